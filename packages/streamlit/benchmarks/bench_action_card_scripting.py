@@ -0,0 +1,149 @@
+"""
+benchmarks/bench_action_card_scripting.py
+액션 카드 50개 페이지의 메인 스레드 스크립트 실행 시간 - MutationObserver vs 키 기반 CSS
+
+observer: 이전 action_card_style() (components.html iframe에서 부모 문서 전체에
+          MutationObserver를 걸고 변경마다 모든 button을 훑어 인라인 스타일 지정)
+css:      현재 action_card_style() (st-key-studio_action_<key> 컨테이너 클래스 선택자, JavaScript 없음)
+
+앱을 `streamlit run`으로 띄우고 첫 로드와 리런 RERUNS회 동안의 Chrome DevTools
+Performance 지표(ScriptDuration, TaskDuration)를 비교합니다.
+
+요구 사항:
+    pip install playwright && playwright install chromium
+
+실행:
+    python benchmarks/bench_action_card_scripting.py
+"""
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+CARDS = 50
+RERUNS = 10
+SETTLE_S = 1.0
+
+_LEGACY_STYLE = """
+import streamlit.components.v1 as components
+
+def action_card_style():
+    components.html('''
+    <script>
+    function styleDeleteButtons() {
+        const buttons = window.parent.document.querySelectorAll('button');
+        buttons.forEach(btn => {
+            if (btn.textContent.includes('🗑️')) {
+                btn.style.background = 'transparent';
+                btn.style.border = 'none';
+                btn.style.boxShadow = 'none';
+                btn.style.padding = '2px 6px';
+                btn.style.minHeight = 'auto';
+                btn.style.fontSize = '28px';
+                btn.style.cursor = 'pointer';
+            }
+        });
+    }
+    setTimeout(styleDeleteButtons, 100);
+    setTimeout(styleDeleteButtons, 300);
+    setTimeout(styleDeleteButtons, 600);
+    const observer = new MutationObserver(() => { styleDeleteButtons(); });
+    observer.observe(window.parent.document.body, { childList: true, subtree: true });
+    </script>
+    ''', height=0)
+"""
+
+APP = """
+import streamlit as st
+from studio_ui import action_card, apply_theme
+{style_import}
+
+apply_theme()
+action_card_style()
+st.session_state.setdefault("runs", 0)
+st.session_state.runs += 1
+st.button("rerun", key="rerun")
+for i in range({cards}):
+    with action_card(f"카드 {{i}}", key=f"card_{{i}}", deletable=True):
+        st.selectbox("주문서", ["이름", "금액", "주소"], key=f"left_{{i}}")
+st.markdown(f"<div id='runs'>{{st.session_state.runs}}</div>", unsafe_allow_html=True)
+"""
+
+VARIANTS = {
+    "observer": _LEGACY_STYLE,
+    "css": "from studio_ui import action_card_style",
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _metrics(cdp) -> dict:
+    return {m["name"]: m["value"] for m in cdp.send("Performance.getMetrics")["metrics"]}
+
+
+def _measure(playwright, app_path: Path, env: dict) -> tuple:
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(app_path),
+         "--server.headless", "true", "--server.port", str(port)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        browser = playwright.chromium.launch()
+        page = browser.new_page(viewport={"width": 1200, "height": 900})
+        cdp = page.context.new_cdp_session(page)
+        cdp.send("Performance.enable")
+
+        page.goto(f"http://localhost:{port}", timeout=60000)
+        page.wait_for_selector("#runs", timeout=60000)
+        time.sleep(SETTLE_S)
+        load = _metrics(cdp)
+
+        for n in range(RERUNS):
+            page.get_by_role("button", name="rerun").click()
+            page.wait_for_function(
+                f"document.getElementById('runs') && document.getElementById('runs').innerText == '{n + 2}'"
+            )
+            time.sleep(SETTLE_S)
+        done = _metrics(cdp)
+        browser.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+    # iframe(observer 스크립트)은 같은 렌더러 프로세스의 메인 스레드에서 실행되므로 지표에 포함됨
+    return (
+        load["ScriptDuration"] * 1000,
+        (done["ScriptDuration"] - load["ScriptDuration"]) * 1000 / RERUNS,
+        (done["TaskDuration"] - load["TaskDuration"]) * 1000 / RERUNS,
+    )
+
+
+def main() -> None:
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        print("playwright가 설치되어 있지 않아 건너뜁니다 (pip install playwright)")
+        return
+
+    src = Path(__file__).resolve().parents[1] / "src"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(src), os.environ.get("PYTHONPATH", "")]))
+    print(f"{CARDS} action cards, {RERUNS} reruns")
+    print(f"{'variant':<10} {'load script (ms)':>17} {'script/rerun (ms)':>18} {'tasks/rerun (ms)':>17}")
+    with tempfile.TemporaryDirectory() as tmp, sync_playwright() as p:
+        for name, style_import in VARIANTS.items():
+            app = Path(tmp) / f"app_{name}.py"
+            app.write_text(APP.format(style_import=style_import, cards=CARDS), encoding="utf-8")
+            load_ms, script_ms, task_ms = _measure(p, app, env)
+            print(f"{name:<10} {load_ms:>17.1f} {script_ms:>18.1f} {task_ms:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
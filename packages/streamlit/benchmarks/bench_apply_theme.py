@@ -0,0 +1,51 @@
+"""
+benchmarks/bench_apply_theme.py
+apply_theme() 리런당 비용 마이크로벤치마크
+
+캐시 도입 전(매 리런 f-string 포맷)과 후(컴파일 캐시 재사용)의
+apply_theme 1회 호출 비용을 테마별로 비교합니다.
+
+실행:
+    python benchmarks/bench_apply_theme.py
+"""
+import timeit
+from unittest import mock
+
+from studio_ui.core import styles
+from studio_ui.core.theme import DARK_THEME, DEFAULT_THEME
+
+THEMES = {
+    "DEFAULT_THEME": DEFAULT_THEME,
+    "DARK_THEME": DARK_THEME,
+    "extend(brand)": DEFAULT_THEME.extend(name="brand", primary="#007bff", primary_dark="#0056b3"),
+    "extend(mint)": DARK_THEME.extend(name="mint", primary="#2ec4b6", info="#3a86ff"),
+}
+
+NUMBER = 2000
+REPEAT = 5
+
+
+def _apply_theme_uncached(theme) -> None:
+    """캐시 도입 전 동작: 매 호출마다 CSS 변수 블록과 스타일시트를 포맷"""
+    theme._build_css_vars()
+    styles.st.markdown(styles._build_stylesheet(theme), unsafe_allow_html=True)
+
+
+def _best_us(fn) -> float:
+    return min(timeit.repeat(fn, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main() -> None:
+    # st.markdown 전송 비용은 제외하고 스타일시트 준비 비용만 측정
+    with mock.patch.object(styles.st, "markdown", new=lambda *args, **kwargs: None):
+        print(f"{'theme':<16} {'before (us)':>12} {'after (us)':>12} {'speedup':>9} {'css bytes':>10}")
+        for label, theme in THEMES.items():
+            styles.clear_stylesheet_cache()
+            before = _best_us(lambda t=theme: _apply_theme_uncached(t))
+            after = _best_us(lambda t=theme: styles.apply_theme(t))
+            size = len(styles.compile_stylesheet(theme).encode("utf-8"))
+            print(f"{label:<16} {before:>12.2f} {after:>12.2f} {before / after:>8.1f}x {size:>10}")
+
+
+if __name__ == "__main__":
+    main()
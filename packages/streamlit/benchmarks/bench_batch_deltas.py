@@ -0,0 +1,131 @@
+"""
+benchmarks/bench_batch_deltas.py
+리런당 프론트엔드 요소(delta) 수 비교 - 요금제 페이지, 인증 페이지
+
+AppTest로 각 페이지를 실행하고 main 영역의 요소/블록 수를 셉니다.
+- legacy: 배치 도입 전 구현 (HTML 조각마다 st.markdown)
+- current: 현재 컴포넌트 (컴포넌트 내부 배치)
+- batch: 페이지 전체를 `with studio_ui.batch():` 로 감쌈
+
+실행:
+    python benchmarks/bench_batch_deltas.py
+"""
+import time
+
+from streamlit.testing.v1 import AppTest
+
+_PLANS = '''
+from studio_ui import PricingPlan
+PLANS = [
+    PricingPlan(name, price, features=["프로젝트 무제한", "팀원 5명", "우선 지원", "API 접근"],
+                disabled_features=["전용 매니저"], is_recommended=(name == "Pro"))
+    for name, price in [("Free", "0"), ("Pro", "9,900"), ("Team", "29,000")]
+]
+'''
+
+_LEGACY_PRICING = _PLANS + '''
+import streamlit as st
+st.markdown('<div>PRICING</div>', unsafe_allow_html=True)
+st.markdown('<div>요금제</div>', unsafe_allow_html=True)
+st.markdown('<div>필요한 만큼만 선택하세요</div>', unsafe_allow_html=True)
+cols = st.columns(3)
+for i, plan in enumerate(PLANS):
+    with cols[i]:
+        with st.container():
+            st.markdown(f'<div class="pricing-card">', unsafe_allow_html=True)
+            st.markdown(f'<div class="pricing-name">{plan.name}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="pricing-price">{plan.currency}{plan.price}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="pricing-period">{plan.period}</div>', unsafe_allow_html=True)
+            for feature in plan.features:
+                st.markdown(f'<div class="pricing-feature">✓ {feature}</div>', unsafe_allow_html=True)
+            for feature in plan.disabled_features:
+                st.markdown(f'<div class="pricing-feature disabled">✗ {feature}</div>', unsafe_allow_html=True)
+            st.markdown("<div style='height: 1rem;'></div>", unsafe_allow_html=True)
+            st.button(plan.cta_text, key=f"plan_{plan.name}")
+            st.markdown('</div>', unsafe_allow_html=True)
+st.markdown('<div>VAT 포함</div>', unsafe_allow_html=True)
+'''
+
+_PRICING_BODY = '''
+section_label("PRICING")
+section_title("요금제", subtitle="필요한 만큼만 선택하세요")
+pricing_grid(PLANS, footer_text="VAT 포함")
+'''
+
+_CURRENT_PRICING = _PLANS + "from studio_ui import section_label, section_title, pricing_grid\n" + _PRICING_BODY
+
+_BATCH_PRICING = (
+    _PLANS
+    + "from studio_ui import batch, section_label, section_title, pricing_grid\n"
+    + "with batch():\n"
+    + "".join(f"    {line}\n" for line in _PRICING_BODY.strip().splitlines())
+)
+
+_LEGACY_AUTH = '''
+import streamlit as st
+st.markdown('<div>WELCOME</div>', unsafe_allow_html=True)
+st.markdown('<div>다시 만나서 반가워요</div>', unsafe_allow_html=True)
+st.markdown('<div>계정에 로그인하세요</div>', unsafe_allow_html=True)
+with st.container():
+    st.markdown('<div class="auth-card">', unsafe_allow_html=True)
+    st.markdown('<div class="auth-header">로그인</div>', unsafe_allow_html=True)
+    st.button("Google로 계속하기", key="login_google")
+    st.markdown('<div class="auth-divider">또는</div>', unsafe_allow_html=True)
+    st.text_input("이메일", key="login_email")
+    st.text_input("비밀번호", type="password", key="login_password")
+    st.markdown('<div class="auth-link"><a href="#">비밀번호를 잊으셨나요?</a></div>', unsafe_allow_html=True)
+    st.button("로그인", key="login_submit")
+    st.markdown('<div class="auth-footer">계정이 없으신가요?</div>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+'''
+
+_AUTH_BODY = '''
+section_label("WELCOME")
+section_title("다시 만나서 반가워요", subtitle="계정에 로그인하세요")
+login_form(key="login")
+'''
+
+_CURRENT_AUTH = "from studio_ui import section_label, section_title\nfrom studio_ui.components import login_form\n" + _AUTH_BODY
+
+_BATCH_AUTH = (
+    "from studio_ui import batch, section_label, section_title\n"
+    + "from studio_ui.components import login_form\n"
+    + "with batch():\n"
+    + "".join(f"    {line}\n" for line in _AUTH_BODY.strip().splitlines())
+)
+
+SCENARIOS = {
+    "pricing": {"legacy": _LEGACY_PRICING, "current": _CURRENT_PRICING, "batch": _BATCH_PRICING},
+    "auth": {"legacy": _LEGACY_AUTH, "current": _CURRENT_AUTH, "batch": _BATCH_AUTH},
+}
+
+
+def _count(node) -> int:
+    """노드와 하위 노드 수 (블록 포함, 요소 하나 = delta 하나)"""
+    children = getattr(node, "children", None)
+    if children is None:
+        return 1
+    return 1 + sum(_count(child) for child in children.values())
+
+
+def _measure(script: str):
+    at = AppTest.from_string(script)
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception)
+    markdown = len(at.markdown)
+    return _count(at.main) - 1, markdown, elapsed * 1000
+
+
+def main() -> None:
+    print(f"{'page':<10} {'variant':<10} {'deltas':>8} {'markdown':>10} {'run (ms)':>10}")
+    for page, variants in SCENARIOS.items():
+        for variant, script in variants.items():
+            deltas, markdown, ms = _measure(script)
+            print(f"{page:<10} {variant:<10} {deltas:>8} {markdown:>10} {ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+benchmarks/bench_callback_reruns.py
+상호작용당 스크립트 실행 횟수 - "클릭 → 상태 변경 → st.rerun()" vs on_click 콜백
+
+legacy: 콜백 도입 전 구현과 같은 패턴 (버튼 값 확인 후 상태 변경 + st.rerun())
+callback: 현재 컴포넌트 (상태는 on_click 콜백에서 변경)
+
+스크립트 맨 위 카운터로 실제 실행 수를 세고, callback 변형은
+studio_ui.component_stats()의 runs_per_interaction도 함께 출력합니다.
+
+실행:
+    python benchmarks/bench_callback_reruns.py
+"""
+from streamlit.testing.v1 import AppTest
+
+_PRELUDE = """
+import streamlit as st
+st.session_state.setdefault("script_runs", 0)
+st.session_state.script_runs += 1
+"""
+
+_LEGACY = {
+    "tab_selector": """
+st.session_state.setdefault("tabs_selected", 0)
+cols = st.columns(3)
+for i in range(3):
+    with cols[i]:
+        if st.button(f"탭 {i}", key=f"tabs_tab_{i}"):
+            st.session_state.tabs_selected = i
+            st.rerun()
+""",
+    "swipe_slider": """
+st.session_state.setdefault("pills_idx", 0)
+cols = st.columns(3)
+for i in range(3):
+    with cols[i]:
+        if st.button(f"슬라이드 {i}", key=f"pills_btn_{i}"):
+            if st.session_state.pills_idx != i:
+                st.session_state.pills_idx = i
+                st.rerun()
+""",
+    "action_card": """
+st.session_state.setdefault("items", list(range(10)))
+for item in st.session_state["items"]:
+    with st.container(border=True):
+        if st.button("🗑️", key=f"del_card_{item}"):
+            st.session_state["items"].remove(item)
+            st.rerun()
+        st.markdown(f"**카드 {item}**")
+""",
+    "logout_button": """
+if st.button("로그아웃", key="logout_btn"):
+    st.session_state["logout_btn_confirm"] = True
+if st.session_state.get("logout_btn_confirm"):
+    st.warning("정말 로그아웃 하시겠습니까?")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("취소", key="logout_btn_cancel"):
+            st.session_state["logout_btn_confirm"] = False
+            st.rerun()
+    with col2:
+        if st.button("확인", key="logout_btn_confirm_btn"):
+            st.session_state["logout_btn_confirm"] = False
+""",
+}
+
+_CALLBACK = {
+    "tab_selector": """
+from studio_ui.components import tab_selector
+tab_selector([{"icon": "", "label": f"탭 {i}"} for i in range(3)], key="tabs")
+""",
+    "swipe_slider": """
+from studio_ui.components import swipe_slider
+swipe_slider([{"emoji": "", "title": f"슬라이드 {i}"} for i in range(3)], key="pills", mode="radio")
+""",
+    "action_card": """
+from studio_ui import action_card
+st.session_state.setdefault("items", list(range(10)))
+for item in st.session_state["items"]:
+    with action_card(f"카드 {item}", key=f"card_{item}",
+                     on_delete=lambda item=item: st.session_state["items"].remove(item)):
+        pass
+""",
+    "logout_button": """
+from studio_ui.components.auth import logout_button
+logout_button(confirm=True)
+""",
+}
+
+# 컴포넌트별 상호작용 순서 (버튼 키)
+CLICKS = {
+    "tab_selector": ["tabs_tab_1", "tabs_tab_2", "tabs_tab_0", "tabs_tab_1"],
+    "swipe_slider": ["pills_btn_1", "pills_btn_2", "pills_btn_0", "pills_btn_1"],
+    "action_card": ["del_card_0", "del_card_1", "del_card_2", "del_card_3"],
+    # 로그아웃 → 취소 → 로그아웃 → 확인
+    "logout_button": ["logout_btn", "logout_btn_cancel", "logout_btn", "logout_btn_confirm_btn"],
+}
+
+
+def _measure(script: str, clicks):
+    at = AppTest.from_string(_PRELUDE + script).run()
+    if at.exception:
+        raise RuntimeError(at.exception)
+    before = at.session_state.script_runs
+    for key in clicks:
+        at.button(key=key).click().run()
+        if at.exception:
+            raise RuntimeError(at.exception)
+    return (at.session_state.script_runs - before) / len(clicks), at
+
+
+def main() -> None:
+    print(f"{'component':<14} {'legacy runs':>12} {'callback runs':>14} {'stats':>8}")
+    for component, clicks in CLICKS.items():
+        legacy, _ = _measure(_LEGACY[component], clicks)
+        current, at = _measure(_CALLBACK[component], clicks)
+        stats = at.session_state["_studio_ui_component_stats"][component]
+        print(
+            f"{component:<14} {legacy:>12.2f} {current:>14.2f} "
+            f"{stats.runs_per_interaction:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+benchmarks/bench_card_grid.py
+card_grid 첫 렌더링 전송량과 리런 시간 - mode="columns" vs mode="virtual"
+
+columns: 항목마다 마크다운 요소 1개 (st.columns 안에 전부 전송)
+virtual: 가상 그리드 요소 1개 (첫 화면 페이지 + 페이지 다이제스트만 전송)
+
+측정 항목 (AppTest, 브라우저 없음):
+    first payload: 첫 실행에서 만들어진 요소 프로토 바이트 합계
+    rerun payload: 항목이 그대로인 리런의 요소 프로토 바이트 합계
+    rerun time:    항목이 그대로인 리런의 스크립트 실행 시간 (RERUNS회 평균)
+    page fetch:    virtual 모드에서 스크롤로 페이지 2개를 요청한 리런의 시간/전송량
+
+실행:
+    python benchmarks/bench_card_grid.py
+"""
+import time
+
+from streamlit.testing.v1 import AppTest
+
+SIZES = (100, 1_000, 10_000)
+COLUMNS = 3
+RERUNS = 5
+
+
+def _app(count: int, mode: str) -> None:
+    from studio_ui import card_grid
+
+    items = [
+        {"icon": "📦", "title": f"상품 {i}", "desc": f"상품 {i}의 설명입니다", "id": i}
+        for i in range(count)
+    ]
+    card_grid(
+        items,
+        columns=3,
+        mode=mode,
+        key="grid",
+        item_key=(lambda item: item["id"]) if mode == "virtual" else None,
+    )
+
+
+def _payload(at: AppTest) -> int:
+    total = 0
+    stack = [at._tree]
+    while stack:
+        node = stack.pop()
+        proto = getattr(node, "proto", None)
+        if proto is not None:
+            total += proto.ByteSize()
+        stack.extend(getattr(node, "children", {}).values())
+    return total
+
+
+def _timed_run(at: AppTest) -> float:
+    start = time.perf_counter()
+    at.run(timeout=120)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    print(f"{'items':>7} {'mode':<8} {'first payload':>14} {'rerun payload':>14} {'rerun time':>11} {'page fetch':>20}")
+    for count in SIZES:
+        for mode in ("columns", "virtual"):
+            at = AppTest.from_function(_app, args=(count, mode), default_timeout=120)
+            at.run()
+            first = _payload(at)
+
+            elapsed = sum(_timed_run(at) for _ in range(RERUNS)) / RERUNS
+            rerun = _payload(at)
+
+            fetch = ""
+            if mode == "virtual":
+                last_page = (count - 1) // (COLUMNS * 8)
+                pages = [last_page // 2, last_page // 2 + 1]
+                at.session_state["grid"] = {"seq": "bench", "want": pages, "visible": pages}
+                fetch_ms = _timed_run(at)
+                fetch = f"{fetch_ms:>7.1f} ms {_payload(at):>8,} B"
+
+            print(f"{count:>7,} {mode:<8} {first:>12,} B {rerun:>12,} B {elapsed:>8.1f} ms {fetch:>20}")
+
+
+if __name__ == "__main__":
+    main()
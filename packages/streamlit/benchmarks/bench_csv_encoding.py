@@ -0,0 +1,69 @@
+"""
+benchmarks/bench_csv_encoding.py
+CP949/UTF-8 CSV 읽기 - UTF-8로 시도 후 실패하면 전체 재디코딩 vs 표본 감지 + 1회 스트리밍 디코딩
+
+retry:    data.decode("utf-8") 실패 → data.decode("cp949") → pd.read_csv (앱에서 하던 방식)
+sniff:    studio_ui.data.sniff_csv (표본만 보고 인코딩/구분자 결정)
+parse:    studio_ui.data.parse_table (감지 + pyarrow 스트리밍 디코딩/파싱)
+
+실행:
+    python benchmarks/bench_csv_encoding.py [--rows 500000]
+"""
+import argparse
+import io
+import random
+import time
+
+
+def _make_csv(rows: int, encoding: str, ascii_head: int = 0) -> bytes:
+    rng = random.Random(0)
+    lines = ["date,name,amount,memo,balance" if ascii_head else "입금일자,입금자,금액,적요,잔액"]
+    for i in range(rows):
+        name = f"user{i}" if i < ascii_head else f"고객{i % 977}"
+        memo = "transfer" if i < ascii_head else "타행이체"
+        lines.append(f"2024-03-{i % 28 + 1:02d},{name},{rng.randint(1000, 99999)},{memo},{i * 31}")
+    return ("\n".join(lines) + "\n").encode(encoding)
+
+
+def _retry(data: bytes) -> int:
+    import pandas as pd
+
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("cp949")
+    return len(pd.read_csv(io.StringIO(text)))
+
+
+def _timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500_000)
+    args = parser.parse_args()
+
+    from studio_ui.data import parse_table, sniff_csv
+
+    files = {
+        "utf-8": _make_csv(args.rows, "utf-8"),
+        "cp949": _make_csv(args.rows, "cp949"),
+        # 헤더 포함 앞 6만 행(약 2.7 MB)이 ASCII → 표본은 ASCII뿐, 비ASCII 구간은 감지 범위
+        # (SCAN_LIMIT_BYTES) 안에서 찾음 / UTF-8 재시도 방식은 그 뒤에서야 실패
+        "cp949 (late)": _make_csv(args.rows, "cp949", ascii_head=min(60_000, args.rows * 9 // 10)),
+    }
+    print(f"{'file':<13} {'size':>8} {'retry':>10} {'sniff':>9} {'parse':>10}  dialect")
+    for label, data in files.items():
+        dialect = sniff_csv(data, "deposits.csv")
+        retry = _timed(_retry, data)
+        sniff = _timed(sniff_csv, data, "deposits.csv")
+        parse = _timed(parse_table, data, "deposits.csv")
+        print(f"{label:<13} {len(data) / 1024 / 1024:>5.1f} MB {retry * 1000:>7.0f} ms "
+              f"{sniff * 1000:>6.1f} ms {parse * 1000:>7.0f} ms  {dialect.encoding} '{dialect.delimiter}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+benchmarks/bench_export.py
+결과 다운로드 - openpyxl로 통합문서 만들기 vs 스트리밍 XLSX/CSV 내보내기 vs 캐시 적중
+
+openpyxl:  Workbook(write_only) + 행마다 append 후 BytesIO에 저장 (앱에서 하던 방식)
+xlsx:      studio_ui.data.export_bytes(kind="xlsx") (배치마다 시트 XML을 zip에 바로 기록)
+csv:       studio_ui.data.export_bytes(kind="csv")
+cached:    같은 표로 cached_export를 두 번 호출했을 때 두 번째 (다이제스트 계산 + 조회)
+
+방법마다 별도 프로세스에서 실행해 최대 RSS(ru_maxrss)를 비교합니다.
+
+요구 사항 (openpyxl 비교용):
+    pip install "studio-ui[dev]"
+
+실행:
+    python benchmarks/bench_export.py [--rows 200000]
+"""
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+METHODS = ("openpyxl", "xlsx", "csv", "cached")
+
+
+def _make_table(rows: int):
+    import pyarrow as pa
+
+    return pa.table({
+        "입금일자": pa.array([f"2024-03-{i % 28 + 1:02d}" for i in range(rows)]).cast(pa.date32()),
+        "입금자": [f"고객{i % 977}" for i in range(rows)],
+        "금액": [(i * 7919) % 99_000 + 1000 for i in range(rows)],
+        "수수료율": [(i % 13) / 1000 for i in range(rows)],
+        "매칭": [i % 3 != 0 for i in range(rows)],
+        "주문번호": [f"ORD-{i:08d}" for i in range(rows)],
+    })
+
+
+def _openpyxl(table) -> int:
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("결과")
+    sheet.append(table.column_names)
+    for row in zip(*(column.to_pylist() for column in table.columns)):
+        sheet.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return len(buffer.getvalue())
+
+
+def _child(method: str, rows: int) -> None:
+    from studio_ui.data import cached_export, export_bytes
+
+    table = _make_table(rows)
+    if method == "cached":
+        cached_export(table, "xlsx")
+    start = time.perf_counter()
+    if method == "openpyxl":
+        size = _openpyxl(table)
+    elif method == "cached":
+        size = len(cached_export(table, "xlsx"))
+    else:
+        size = len(export_bytes(table, method))
+    print(json.dumps({
+        "seconds": time.perf_counter() - start,
+        "file_mb": size / 1024 / 1024,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--child", metavar="METHOD", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        _child(args.child, args.rows)
+        return
+
+    try:
+        import openpyxl  # noqa: F401
+        methods = METHODS
+    except ImportError:
+        print("openpyxl이 설치되어 있지 않아 비교에서 뺍니다 (pip install \"studio-ui[dev]\")")
+        methods = METHODS[1:]
+
+    print(f"{'method':<9} {'rows':>8} {'time':>10} {'file':>9} {'peak RSS':>10}")
+    for method in methods:
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", method, "--rows", str(args.rows)],
+            check=True, capture_output=True, text=True, env=os.environ,
+        ).stdout
+        r = json.loads(out.strip().splitlines()[-1])
+        print(f"{method:<9} {args.rows:>8,} {r['seconds'] * 1000:>8.0f} ms "
+              f"{r['file_mb']:>6.1f} MB {r['rss_mb']:>7.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
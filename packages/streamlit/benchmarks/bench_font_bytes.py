@@ -0,0 +1,70 @@
+"""
+benchmarks/bench_font_bytes.py
+첫 로드 폰트 전송량 - 원본 폰트 전체 vs 서브셋 WOFF2
+
+before: 굵기별 원본 폰트를 그대로 WOFF2로 변환해 서빙할 때의 바이트
+        (Google Fonts는 unicode-range 조각으로 나눠 보내므로 실제 전송량은 페이지의 글자에 따라 다르며,
+        외부망이 없는 환경에서는 아예 받지 못함)
+after:  build_fonts와 같은 글자 집합(ASCII + 컴포넌트 문자열 + 코퍼스)으로 서브셋한 WOFF2
+
+요구 사항:
+    pip install "studio-ui[fonts]"
+
+실행:
+    python benchmarks/bench_font_bytes.py --font NotoSansKR-Regular.otf:400 \\
+        --font NotoSansKR-Bold.otf:700 [--corpus app_strings.txt] [--common-hangul]
+"""
+import argparse
+import io
+import os
+import time
+from pathlib import Path
+
+
+def _full_woff2(path: str) -> int:
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(path)
+    font.flavor = "woff2"
+    buffer = io.BytesIO()
+    font.save(buffer)
+    return len(buffer.getvalue())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--font", action="append", required=True, metavar="PATH[:WEIGHT]")
+    parser.add_argument("--corpus", action="append", default=[], metavar="FILE")
+    parser.add_argument("--common-hangul", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        import fontTools  # noqa: F401
+    except ImportError:
+        print("fontTools가 설치되어 있지 않아 건너뜁니다 (pip install \"studio-ui[fonts]\")")
+        return
+
+    from studio_ui.core.fonts import _font_sources, glyph_text, subset_font
+
+    corpus = [Path(p).read_text(encoding="utf-8") for p in args.corpus]
+    text = glyph_text(corpus, args.common_hangul)
+    print(f"glyphs requested: {len(text):,}")
+    print(f"{'weight':<8} {'source':>12} {'full woff2':>12} {'subset woff2':>13} {'subset time':>12}")
+
+    totals = [0, 0]
+    for weight, path in _font_sources(args.font).items():
+        full = _full_woff2(path)
+        start = time.perf_counter()
+        data, variable_weight, covered = subset_font(path, text)
+        elapsed = time.perf_counter() - start
+        totals[0] += full
+        totals[1] += len(data)
+        print(
+            f"{variable_weight or weight:<8} {os.path.getsize(path):>10,} B {full:>10,} B "
+            f"{len(data):>11,} B {elapsed * 1000:>9.0f} ms  ({len(covered):,} glyphs)"
+        )
+    print(f"first load: {totals[0]:,} B → {totals[1]:,} B ({totals[1] / totals[0]:.1%})")
+
+
+if __name__ == "__main__":
+    main()
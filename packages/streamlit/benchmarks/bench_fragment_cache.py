@@ -0,0 +1,67 @@
+"""
+benchmarks/bench_fragment_cache.py
+HTML 조각 캐시 효과 측정 - 여러 세션(스레드)이 같은 페이지를 반복 렌더링
+
+uncached: 렌더 함수 원본 (`.uncached`)
+cached: FRAGMENT_CACHE 경유 (인자 다이제스트 + LRU)
+
+실행:
+    python benchmarks/bench_fragment_cache.py
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from studio_ui.components.cards import StatItem, pricing_card_html, stats_card_html
+from studio_ui.components.navigation import gnb_html
+from studio_ui.core.cache import clear_fragment_cache, fragment_cache_stats
+
+SESSIONS = 8
+RERUNS = 500
+
+MENU = [
+    {"label": "매칭하기", "page": "matching"},
+    {"label": "사용 방법", "page": "landing", "section": "how"},
+    {"label": "요금제", "page": "landing", "section": "pricing"},
+    {"label": "문의", "page": "contact"},
+]
+STATS = [StatItem(f"상태 {i}", i * 7, "#4a9d6b") for i in range(20)]
+FEATURES = ["✓ 프로젝트 무제한", "✓ 팀원 5명", "✓ 우선 지원", "API 접근", "전용 매니저"]
+
+
+def _page(cached: bool) -> None:
+    gnb = gnb_html if cached else gnb_html.uncached
+    stats = stats_card_html if cached else stats_card_html.uncached
+    pricing = pricing_card_html if cached else pricing_card_html.uncached
+    gnb(menu_items=MENU)
+    stats(STATS, "매칭 결과")
+    for plan, price in (("Free", "₩0"), ("Pro", "₩9,900"), ("Team", "₩29,000")):
+        pricing(plan, price, "월", FEATURES, plan == "Pro")
+
+
+def _session(cached: bool) -> None:
+    for _ in range(RERUNS):
+        _page(cached)
+
+
+def _run(cached: bool) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=SESSIONS) as pool:
+        list(pool.map(_session, [cached] * SESSIONS))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    clear_fragment_cache()
+    total = SESSIONS * RERUNS
+    for label, cached in (("uncached", False), ("cached", True)):
+        elapsed = _run(cached)
+        print(f"{label:<10} {total / elapsed:>10,.0f} page renders/s  ({elapsed * 1000:.0f} ms)")
+    stats = fragment_cache_stats()
+    print(
+        f"cache: hits={stats.hits} misses={stats.misses} evictions={stats.evictions} "
+        f"entries={stats.entries} bytes={stats.bytes}/{stats.max_bytes}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+benchmarks/bench_fragment_reruns.py
+탭/슬라이드 클릭당 전체 스크립트 실행 횟수 - st.rerun() vs 프래그먼트 범위 재실행
+
+full: body 없이 호출 → 클릭마다 전체 스크립트 실행
+    (콜백 도입 전에는 버튼 클릭 재실행 + st.rerun()으로 클릭당 2회)
+fragment: body=... 로 호출 → 선택기와 body만 재실행 (클릭당 0회)
+
+AppTest는 위젯 조작을 항상 전체 실행으로 전달하므로, fragment 변형은
+브라우저와 같이 프래그먼트 ID를 담은 재실행 요청(RerunData.fragment_id_queue)으로
+클릭을 전달합니다. 스크립트 맨 위의 카운터는 전체 실행에서만 증가합니다.
+
+실행:
+    python benchmarks/bench_fragment_reruns.py
+"""
+import functools
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import local_script_runner
+
+CLICKS = 6
+
+_PRELUDE = """
+import time
+import streamlit as st
+from studio_ui.components import swipe_slider, tab_selector
+
+st.session_state.setdefault("full_runs", 0)
+st.session_state.setdefault("body_runs", 0)
+st.session_state.full_runs += 1
+time.sleep(0.02)  # 파일 파싱/매칭 등 선택기 위쪽의 무거운 작업
+
+TABS = [
+    {"id": "name", "icon": "👤", "label": "이름 연결"},
+    {"id": "amount", "icon": "💰", "label": "금액 연결"},
+    {"id": "add", "icon": "➕", "label": "추가"},
+]
+SLIDES = [{"emoji": t["icon"], "title": t["label"]} for t in TABS]
+
+
+def body(idx):
+    st.session_state.body_runs += 1
+    st.write(TABS[idx]["label"])
+"""
+
+SCRIPTS = {
+    ("tab_selector", "full"): _PRELUDE + """
+body(tab_selector(TABS, key="tabs"))
+""",
+    ("tab_selector", "fragment"): _PRELUDE + """
+tab_selector(TABS, key="tabs", body=body)
+""",
+    ("swipe_slider", "full"): _PRELUDE + """
+body(swipe_slider(SLIDES, key="pills", mode="radio"))
+""",
+    ("swipe_slider", "fragment"): _PRELUDE + """
+swipe_slider(SLIDES, key="pills", mode="radio", body=body)
+""",
+}
+
+BUTTON_KEYS = {"tab_selector": "tabs_tab_{}", "swipe_slider": "pills_btn_{}"}
+
+
+@contextmanager
+def _fragment_scoped(at: AppTest) -> Iterator[None]:
+    """등록된 프래그먼트만 다시 실행하도록 AppTest의 재실행 요청을 바꿈"""
+    fragment_ids = list(at._fragment_storage._fragments)
+    original = local_script_runner.RerunData
+    local_script_runner.RerunData = functools.partial(original, fragment_id_queue=fragment_ids)
+    try:
+        yield
+    finally:
+        local_script_runner.RerunData = original
+
+
+def _measure(component: str, variant: str):
+    at = AppTest.from_string(SCRIPTS[(component, variant)]).run()
+    if at.exception:
+        raise RuntimeError(at.exception)
+
+    full_before = at.session_state.full_runs
+    body_before = at.session_state.body_runs
+    start = time.perf_counter()
+    for click in range(CLICKS):
+        button = at.button(key=BUTTON_KEYS[component].format((click + 1) % 3))
+        button.click()
+        if variant == "fragment":
+            with _fragment_scoped(at):
+                at.run()
+        else:
+            at.run()
+        if at.exception:
+            raise RuntimeError(at.exception)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    full = (at.session_state.full_runs - full_before) / CLICKS
+    body = (at.session_state.body_runs - body_before) / CLICKS
+    return full, body, elapsed / CLICKS
+
+
+def main() -> None:
+    print(f"{'component':<14} {'variant':<10} {'full runs/click':>16} {'body runs/click':>16} {'ms/click':>10}")
+    for component, variant in SCRIPTS:
+        full, body, ms = _measure(component, variant)
+        print(f"{component:<14} {variant:<10} {full:>16.1f} {body:>16.1f} {ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+benchmarks/bench_iframe_bundle.py
+iframe 컴포넌트 전송량 - 인스턴스마다 인라인 vs 공용 번들
+
+inline: 스타일시트/스크립트를 iframe 문서에 넣어 인스턴스마다 전송
+        (components.html srcdoc 방식은 이 문서가 매 리런 델타에 실림)
+bundle: 셸(index.html) + 콘텐츠 해시 번들(studio-ui.css/js)을 브라우저가 한 번 받아 캐시,
+        리런 델타에는 인스턴스 데이터(args)만 실림
+
+swipe_slider + step_carousel 쌍을 N개 렌더링해 리런당 델타 바이트와
+첫 로드 시 브라우저가 받는 iframe 에셋 바이트를 비교합니다.
+
+실행:
+    python benchmarks/bench_iframe_bundle.py
+"""
+from streamlit.testing.v1 import AppTest
+
+from studio_ui.core.frontend import BUNDLE_FILES, FRONTEND_DIR
+
+SCRIPT = """
+from studio_ui import step_carousel, swipe_slider
+
+slides = [{{"emoji": "📌", "title": f"카드 {{i}}"}} for i in range(6)]
+steps = [{{"step": f"STEP {{i + 1}}", "title": f"단계 {{i + 1}}", "desc": "설명"}} for i in range(4)]
+for n in range({pairs}):
+    swipe_slider(slides, key=f"slider_{{n}}")
+    step_carousel(steps, key=f"carousel_{{n}}")
+"""
+
+
+def _delta_bytes(pairs: int) -> int:
+    at = AppTest.from_string(SCRIPT.format(pairs=pairs))
+    at.run()
+    assert not at.exception, at.exception
+    return sum(len(el.proto.json_args) for el in at.get("component_instance"))
+
+
+def main() -> None:
+    shell = len((FRONTEND_DIR / "index.html").read_bytes())
+    bundle = sum(len((FRONTEND_DIR / f"{stem}{suffix}").read_bytes()) for stem, suffix in BUNDLE_FILES)
+    print(f"shell {shell:,} B, bundle {bundle:,} B")
+    print(f"{'instances':>9} {'rerun delta inline':>19} {'rerun delta bundle':>19} "
+          f"{'first load inline':>18} {'first load bundle':>18}")
+    for pairs in (1, 5, 20):
+        instances = pairs * 2
+        args = _delta_bytes(pairs)
+        inline_doc = shell + bundle
+        print(
+            f"{instances:>9} {args + instances * inline_doc:>17,} B {args:>17,} B "
+            f"{instances * inline_doc:>16,} B {instances * shell + bundle:>16,} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+benchmarks/bench_import.py
+studio_ui 콜드 스타트 import 비용 측정 (python -X importtime 기반)
+
+시나리오별로 새 인터프리터에서 import를 실행하고
+studio_ui 자체 모듈의 self 시간 합계, 전체 누적 시간,
+streamlit.components.v1 로딩 여부를 보고합니다.
+
+실행:
+    python benchmarks/bench_import.py
+"""
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SCENARIOS = {
+    "import studio_ui": "import studio_ui",
+    "apply_theme + badge": "from studio_ui import apply_theme, badge",
+    "full public API": "import studio_ui; [getattr(studio_ui, n) for n in studio_ui.__all__]",
+}
+
+RUNS = 5
+
+
+def _importtime(code: str) -> List[Tuple[str, int, int, int]]:
+    """(모듈명, self_us, cumulative_us, depth) 목록"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def _measure(code: str) -> Dict[str, float]:
+    own, total = [], []
+    loads_components = False
+    _importtime(code)  # .pyc 생성 등 첫 실행 비용 제외
+    for _ in range(RUNS):
+        rows = _importtime(code)
+        own.append(sum(s for name, s, _, _ in rows if name.split(".")[0] == "studio_ui"))
+        total.append(sum(c for _, _, c, depth in rows if depth == 0))
+        loads_components = loads_components or any(
+            name == "streamlit.components.v1" for name, _, _, _ in rows
+        )
+    return {
+        "studio_ui_self_ms": statistics.median(own) / 1000,
+        "total_ms": statistics.median(total) / 1000,
+        "components_v1": loads_components,
+    }
+
+
+def main() -> None:
+    print(f"{'scenario':<22} {'studio_ui self (ms)':>20} {'total (ms)':>12} {'components.v1':>14}")
+    for label, code in SCENARIOS.items():
+        result = _measure(code)
+        print(
+            f"{label:<22} {result['studio_ui_self_ms']:>20.2f} "
+            f"{result['total_ms']:>12.2f} {str(result['components_v1']):>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
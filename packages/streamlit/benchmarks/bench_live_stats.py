@@ -0,0 +1,101 @@
+"""
+benchmarks/bench_live_stats.py
+live_stats_card / StatsFeed 비용
+
+write:   백그라운드 스레드 THREADS개가 feed.add()를 호출할 때 처리량과 메모리 (레이블 수로 제한되는지)
+tick:    live_stats_card 갱신 1회의 서버 시간 - 건수 그대로 (집계 생략) vs 건수 변경
+payload: 갱신 1회에 전송되는 args 바이트 vs 같은 카드를 stats_card HTML로 다시 보낼 때
+
+실행:
+    python benchmarks/bench_live_stats.py
+"""
+import json
+import threading
+import time
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+
+from studio_ui import StatItem, StatsFeed, stats_card_html
+
+THREADS = 4
+WRITES = 250_000
+LABELS = ["매칭", "확인필요", "미입금", "부분입금", "중복", "취소"]
+TICKS = 50
+
+
+def _run_writers(feed: StatsFeed) -> float:
+    def job(offset: int) -> None:
+        for i in range(WRITES):
+            feed.add(LABELS[(i + offset) % len(LABELS)])
+            if i % 1000 == 0:
+                feed.snapshot()  # 화면 갱신 주기마다 읽는 것을 흉내
+
+    threads = [threading.Thread(target=job, args=(n,)) for n in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def _writes() -> None:
+    feed = StatsFeed()
+    elapsed = _run_writers(feed)
+    total = sum(count for _, count in feed.snapshot()[1])
+    assert total == THREADS * WRITES, total
+
+    # 메모리는 tracemalloc을 켠 별도 실행으로 측정 (이미 채워진 feed에 같은 양을 더 씀)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    _run_writers(feed)
+    growth = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(before, "filename"))
+    tracemalloc.stop()
+
+    print(f"write: {total:,} adds in {elapsed * 1000:.0f} ms ({total / elapsed:,.0f}/s), "
+          f"history {len(feed.history())} snapshots, "
+          f"memory growth over next {total:,} adds {growth / 1024:+.0f} KB")
+
+
+def _app() -> None:
+    import streamlit as st
+
+    from studio_ui import live_stats_card
+
+    live_stats_card(st.session_state["feed"], title="매칭 진행")
+
+
+def _ticks() -> None:
+    feed = StatsFeed()
+    for label in LABELS:
+        feed.add(label, 100)
+    at = AppTest.from_function(_app)
+    at.session_state["feed"] = feed
+    at.run()
+
+    timings = {}
+    for name, change in (("unchanged", False), ("changed", True)):
+        start = time.perf_counter()
+        for i in range(TICKS):
+            if change:
+                feed.add(LABELS[i % len(LABELS)], 7)
+            at.run()
+        timings[name] = (time.perf_counter() - start) * 1000 / TICKS
+
+    args = json.loads(at.get("component_instance")[0].proto.json_args)
+    args.pop("bundle")
+    payload = len(json.dumps(args, ensure_ascii=False).encode("utf-8"))
+    html = stats_card_html.uncached([StatItem(*item) for item in args["items"]], "매칭 진행")
+    print(f"tick (AppTest, 스크립트 전체 포함): unchanged {timings['unchanged']:.2f} ms, "
+          f"changed {timings['changed']:.2f} ms")
+    print(f"payload per update: {payload:,} B args vs {len(html.encode('utf-8')):,} B stats_card HTML")
+
+
+def main() -> None:
+    _writes()
+    _ticks()
+
+
+if __name__ == "__main__":
+    main()
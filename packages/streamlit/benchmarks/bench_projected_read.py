@@ -0,0 +1,119 @@
+"""
+benchmarks/bench_projected_read.py
+넓은 시트 - 헤더만 읽기 / 전체 파싱 / 고른 컬럼만 파싱
+
+openpyxl:  load_workbook(read_only) 후 첫 행 (컬럼 매칭 화면을 채우려고 앱에서 하던 방식)
+header:    studio_ui.data.read_header
+full:      parse_table (전체 컬럼)
+projected: parse_table(columns=[2개])
+
+방법마다 별도 프로세스에서 실행해 최대 RSS(ru_maxrss)를 비교합니다.
+
+요구 사항 (테스트 파일 생성용):
+    pip install "studio-ui[dev]"
+
+실행:
+    python benchmarks/bench_projected_read.py [--columns 60] [--csv-rows 200000] [--xlsx-rows 30000]
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+PICKED = ["입금자", "금액"]
+
+
+def _make_files(directory: str, columns: int, csv_rows: int, xlsx_rows: int) -> dict:
+    import openpyxl
+
+    rng = random.Random(0)
+    header = PICKED + [f"c{i}" for i in range(columns - len(PICKED))]
+
+    def row(i: int) -> list:
+        return [f"고객{i % 977}", rng.randint(1000, 99999)] + [
+            f"메모{i % 13}" if j % 4 == 0 else i * j for j in range(columns - len(PICKED))
+        ]
+
+    csv_path = os.path.join(directory, "wide.csv")
+    with open(csv_path, "w", encoding="utf-8") as f:
+        f.write(",".join(header) + "\n")
+        for i in range(csv_rows):
+            f.write(",".join(map(str, row(i))) + "\n")
+
+    xlsx_path = os.path.join(directory, "wide.xlsx")
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("주문")
+    sheet.append(header)
+    for i in range(xlsx_rows):
+        sheet.append(row(i))
+    workbook.save(xlsx_path)
+    return {"csv": csv_path, "xlsx": xlsx_path}
+
+
+def _child(method: str, path: str) -> None:
+    start = time.perf_counter()
+    if method == "openpyxl":
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        names = next(workbook.active.iter_rows(values_only=True))
+        rows, columns, nbytes = 0, len(names), 0
+    elif method == "header":
+        from studio_ui.data import read_header
+
+        rows, columns, nbytes = 0, len(read_header(path)), 0
+    else:
+        from studio_ui.data import parse_table
+
+        table = parse_table(path, columns=PICKED if method == "projected" else None)
+        rows, columns, nbytes = table.num_rows, table.num_columns, table.nbytes
+    print(json.dumps({
+        "rows": rows,
+        "columns": columns,
+        "seconds": time.perf_counter() - start,
+        "table_mb": nbytes / 1024 / 1024,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--columns", type=int, default=60)
+    parser.add_argument("--csv-rows", type=int, default=200_000)
+    parser.add_argument("--xlsx-rows", type=int, default=30_000)
+    parser.add_argument("--child", nargs=2, metavar=("METHOD", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        _child(*args.child)
+        return
+
+    try:
+        import openpyxl  # noqa: F401
+    except ImportError:
+        print("openpyxl이 설치되어 있지 않아 건너뜁니다 (pip install \"studio-ui[dev]\")")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = _make_files(tmp, args.columns, args.csv_rows, args.xlsx_rows)
+        print(f"{'file':<6} {'method':<10} {'rows':>8} {'cols':>5} {'time':>10} {'table':>9} {'peak RSS':>10}")
+        for kind, path in files.items():
+            methods = ("openpyxl", "header", "full", "projected") if kind == "xlsx" else (
+                "header", "full", "projected"
+            )
+            for method in methods:
+                out = subprocess.run(
+                    [sys.executable, __file__, "--child", method, path],
+                    check=True, capture_output=True, text=True, env=os.environ,
+                ).stdout
+                r = json.loads(out.strip().splitlines()[-1])
+                print(f"{kind:<6} {method:<10} {r['rows']:>8,} {r['columns']:>5} "
+                      f"{r['seconds'] * 1000:>8.0f} ms {r['table_mb']:>6.1f} MB {r['rss_mb']:>7.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+benchmarks/bench_stats_card.py
+stats_card 집계 시간 - Python 루프 vs stats_items() (pandas value_counts)
+
+loop:        레이블을 Python 루프로 세고 StatItem을 만든 뒤 상위 N개 + 기타로 합치는 방식
+object:      stats_items(Series[object], top_n=TOP_N)
+categorical: stats_items(Series[category], top_n=TOP_N)
+
+실행:
+    python benchmarks/bench_stats_card.py
+"""
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from studio_ui.components.cards import StatItem, stats_card_html, stats_items
+
+SIZES = (100_000, 1_000_000, 5_000_000)
+LABELS = ["매칭", "확인필요", "미입금", "부분입금", "중복", "취소", "보류", "환불", "수동매칭", "오류"]
+WEIGHTS = [0.62, 0.1, 0.08, 0.06, 0.04, 0.03, 0.03, 0.02, 0.01, 0.01]
+TOP_N = 4
+REPEAT = 3
+
+
+def _loop(labels: list) -> list:
+    counts = Counter()
+    for label in labels:
+        counts[label] += 1
+    ranked = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)
+    items = [StatItem(label, value, "#4a9d6b") for label, value in ranked[:TOP_N]]
+    other = sum(value for _, value in ranked[TOP_N:])
+    if other:
+        items.append(StatItem("기타", other, "#d9d2c9"))
+    return items
+
+
+def _best(fn, *args) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>10} {'loop':>10} {'object':>10} {'categorical':>12}")
+    for size in SIZES:
+        series = pd.Series(rng.choice(LABELS, size, p=WEIGHTS), dtype=object)
+        category = series.astype("category")
+        labels = series.tolist()
+
+        expected = [(i.label, i.value) for i in _loop(labels)]
+        got = [(i.label, i.value) for i in stats_items(series, top_n=TOP_N)]
+        assert expected == got, (expected, got)
+        stats_card_html.uncached(stats_items(category, top_n=TOP_N))
+
+        print(
+            f"{size:>10,} {_best(_loop, labels):>7.1f} ms "
+            f"{_best(stats_items, series, None, TOP_N):>7.1f} ms "
+            f"{_best(stats_items, category, None, TOP_N):>9.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
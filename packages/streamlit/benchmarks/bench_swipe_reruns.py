@@ -0,0 +1,143 @@
+"""
+benchmarks/bench_swipe_reruns.py
+스와이프 제스처당 스크립트 실행 횟수와 서버 CPU - 실제 브라우저(Playwright)로 측정
+
+swipe_slider(multi)와 step_carousel이 있는 앱을 `streamlit run`으로 띄우고
+카드 클릭, 짧은/긴 스크롤(fling), 빠른 연속 fling, 캐러셀 드래그를 수행한 뒤
+앱이 출력하는 실행 카운터와 스크립트 CPU 합계로 제스처당 비용을 계산합니다.
+값 전송이 합쳐지므로 fling 길이와 관계없이 제스처당 실행은 최대 1회여야 합니다.
+
+비교하려면 PYTHONPATH를 이전 버전(숨겨진 number_input 방식) 체크아웃의 src로 바꿔 실행합니다.
+
+요구 사항:
+    pip install playwright && playwright install chromium
+
+실행:
+    python benchmarks/bench_swipe_reruns.py
+"""
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP = '''
+import time
+import streamlit as st
+from studio_ui import step_carousel, swipe_slider
+
+_cpu_start = time.thread_time()
+st.session_state.setdefault("runs", 0)
+st.session_state.setdefault("cpu_ms", 0.0)
+st.session_state.runs += 1
+
+slides = [{"emoji": "📌", "title": f"카드 {i}"} for i in range(8)]
+steps = [{"step": f"STEP {i + 1}", "title": f"단계 {i + 1}", "desc": "설명"} for i in range(4)]
+
+idx = swipe_slider(slides, key="slider")
+step = step_carousel(steps, key="carousel")
+st.write(f"slider={idx} step={step}")
+st.session_state.cpu_ms += (time.thread_time() - _cpu_start) * 1000
+st.markdown(
+    f"<div id='runs'>{st.session_state.runs}</div><div id='cpu'>{st.session_state.cpu_ms:.3f}</div>",
+    unsafe_allow_html=True,
+)
+'''
+
+SETTLE_S = 1.5
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _counters(page):
+    return int(page.inner_text("#runs")), float(page.inner_text("#cpu"))
+
+
+def _measure(page, gesture):
+    runs_before, cpu_before = _counters(page)
+    gesture()
+    time.sleep(SETTLE_S)
+    page.wait_for_load_state("networkidle")
+    runs_after, cpu_after = _counters(page)
+    # 마지막 실행의 CPU는 카운터 출력 직전까지만 포함되므로 근사치
+    return runs_after - runs_before, cpu_after - cpu_before
+
+
+def main() -> None:
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        print("playwright가 설치되어 있지 않아 건너뜁니다 (pip install playwright)")
+        return
+
+    src = Path(__file__).resolve().parents[1] / "src"
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Path(tmp) / "app.py"
+        app.write_text(APP, encoding="utf-8")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(src), os.environ.get("PYTHONPATH", "")]))
+        server = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", str(app),
+             "--server.headless", "true", "--server.port", str(port)],
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            with sync_playwright() as p:
+                browser = p.chromium.launch()
+                page = browser.new_page(viewport={"width": 480, "height": 900})
+                page.goto(f"http://localhost:{port}", timeout=60000)
+                page.wait_for_selector("#runs", timeout=60000)
+                time.sleep(SETTLE_S)
+
+                slider = page.frame_locator("iframe").nth(0)
+                carousel = page.frame_locator("iframe").nth(1)
+
+                def click_card():
+                    slider.locator(".swipe-card").nth(3).click()
+
+                def fling(events, direction=1):
+                    def gesture():
+                        slider.locator(".swipe-track").hover()
+                        for _ in range(events):
+                            page.mouse.wheel(direction * 40, 0)
+                            time.sleep(0.01)
+                    return gesture
+
+                def fling_burst():
+                    # settle 창보다 짧은 간격의 연속 fling (중간 값은 전송되지 않아야 함)
+                    for direction in (1, -1, 1):
+                        fling(8, direction)()
+                        time.sleep(0.05)
+
+                def drag():
+                    box = carousel.locator(".carousel-track").bounding_box()
+                    y = box["y"] + box["height"] / 2
+                    page.mouse.move(box["x"] + box["width"] * 0.8, y)
+                    page.mouse.down()
+                    page.mouse.move(box["x"] + box["width"] * 0.2, y, steps=10)
+                    page.mouse.up()
+
+                print(f"{'gesture':<22} {'runs':>6} {'server cpu (ms)':>16}")
+                for name, gesture in (
+                    ("slider card click", click_card),
+                    ("slider fling x4", fling(4)),
+                    ("slider fling x40", fling(40, -1)),
+                    ("slider fling burst", fling_burst),
+                    ("carousel drag", drag),
+                ):
+                    runs, cpu = _measure(page, gesture)
+                    print(f"{name:<22} {runs:>6} {cpu:>16.1f}")
+                browser.close()
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
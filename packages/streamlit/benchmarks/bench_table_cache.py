@@ -0,0 +1,65 @@
+"""
+benchmarks/bench_table_cache.py
+파싱 결과 디스크 캐시 - 매번 파싱 vs SHA-256 + 메모리 매핑
+
+parse: parse_table (캐시 없음, 업로드/리런마다 하던 방식)
+miss:  TableCache.get_or_parse 첫 호출 (파싱 + Arrow IPC 저장)
+hit:   같은 바이트로 다시 호출 (다른 세션/워커 프로세스가 같은 파일을 올린 경우)
+       hash: SHA-256 시간, heap: pyarrow 힙 할당 (매핑이므로 0)
+
+요구 사항:
+    pip install "studio-ui[dev]"
+
+실행:
+    python benchmarks/bench_table_cache.py [--csv-rows 200000] [--xlsx-rows 30000]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from bench_upload_parse import _make_files
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    value = fn(*args, **kwargs)
+    return value, (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--csv-rows", type=int, default=200_000)
+    parser.add_argument("--xlsx-rows", type=int, default=30_000)
+    args = parser.parse_args()
+
+    try:
+        import openpyxl  # noqa: F401
+    except ImportError:
+        print("openpyxl이 설치되어 있지 않아 건너뜁니다 (pip install \"studio-ui[dev]\")")
+        return
+
+    import pyarrow as pa
+
+    from studio_ui.data import TableCache, file_digest, parse_table
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = _make_files(tmp, args.csv_rows, args.xlsx_rows)
+        cache = TableCache(os.path.join(tmp, "cache"))
+        print(f"{'file':<6} {'size':>10} {'parse':>10} {'miss':>10} {'hit':>9} {'hash':>8} {'hit heap':>9}")
+        for kind, path in files.items():
+            with open(path, "rb") as f:
+                data = f.read()
+            name = os.path.basename(path)
+            _, parse_ms = _timed(parse_table, data, name=name)
+            _, miss_ms = _timed(cache.get_or_parse, data, name)
+            before = pa.total_allocated_bytes()
+            table, hit_ms = _timed(cache.get_or_parse, data, name)
+            heap = pa.total_allocated_bytes() - before
+            _, hash_ms = _timed(file_digest, data)
+            print(f"{kind:<6} {len(data):>8,} B {parse_ms:>7.0f} ms {miss_ms:>7.0f} ms "
+                  f"{hit_ms:>6.1f} ms {hash_ms:>5.1f} ms {heap:>7,} B  ({table.num_rows:,} rows)")
+
+
+if __name__ == "__main__":
+    main()
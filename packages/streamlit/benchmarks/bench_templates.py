@@ -0,0 +1,174 @@
+"""
+benchmarks/bench_templates.py
+HTML 렌더링 처리량 비교 - 기존 f-string/문자열 연결 vs 사전 컴파일 템플릿
+
+legacy: 템플릿 도입 전 구현 복사본 (이스케이프 없음)
+template: 현재 컴포넌트 (필드별 이스케이프 + 공백 제거)
+
+조각 캐시를 거치지 않는 템플릿 렌더링(`.uncached`)을 측정합니다.
+
+실행:
+    python benchmarks/bench_templates.py
+"""
+import timeit
+
+from studio_ui.components import cards, navigation
+from studio_ui.components.cards import StatItem
+
+NUMBER = 20000
+
+FEATURES = ["✓ 프로젝트 무제한", "✓ 팀원 5명", "✓ 우선 지원", "API 접근", "전용 매니저"]
+MENU = [
+    {"label": "매칭하기", "page": "matching"},
+    {"label": "사용 방법", "page": "landing", "section": "how"},
+    {"label": "요금제", "page": "landing", "section": "pricing"},
+    {"label": "문의", "page": "contact"},
+]
+STATS = [
+    StatItem("매칭", 117, "#4a9d6b"),
+    StatItem("확인필요", 3, "#ffc107"),
+    StatItem("미입금", 5, "#dc3545"),
+    StatItem("중복", 2, "#6c757d"),
+]
+
+
+# ============================================================
+# legacy 구현 (템플릿 도입 전 코드 그대로)
+# ============================================================
+
+def legacy_feature_card(emoji, title, description):
+    return f"""
+    <div style="flex: 1; min-width: 150px; text-align: center; padding: 1rem;">
+        <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">{emoji}</div>
+        <div style="font-size: 1rem; font-weight: 600; color: #2d251f;">{title}</div>
+        <div style="font-size: 0.875rem; color: #8b7355;">{description}</div>
+    </div>
+    """
+
+
+def legacy_pricing_card_html(plan, price, period, features, is_featured=False):
+    if is_featured:
+        bg = "linear-gradient(135deg, #fffcf8, #fff9f0)"
+        border = "2px solid #c9a87c"
+        badge = '<div style="position: absolute; top: -0.75rem; left: 50%; transform: translateX(-50%); background: #c9a87c; color: white; font-size: 0.625rem; font-weight: 700; padding: 0.25rem 0.75rem; border-radius: 9999px;">추천</div>'
+        label_color = "#c9a87c"
+    else:
+        bg = "#fffdfb"
+        border = "1px solid #e8e2d9"
+        badge = ""
+        label_color = "#8b7355"
+
+    features_html = "".join([
+        f'<div style="padding: 0.25rem 0; color: {"#5c4a3d" if f.startswith("✓") else "#c9bfb0"};">{f}</div>'
+        for f in features
+    ])
+
+    return f"""
+    <div style="background: {bg}; border: {border}; border-radius: 1rem; padding: 1.5rem; text-align: center; position: relative;">
+        {badge}
+        <div style="font-size: 0.75rem; font-weight: 600; color: {label_color}; text-transform: uppercase;">{plan}</div>
+        <div style="font-size: 2rem; font-weight: 700; color: #2d251f;">{price}</div>
+        <div style="font-size: 0.75rem; color: #8b7355; margin-bottom: 1rem;">{period}</div>
+        <div style="text-align: left; font-size: 0.875rem; color: #5c4a3d;">
+            {features_html}
+        </div>
+    </div>
+    """
+
+
+# 기존 gnb_html의 리터럴 조각 (템플릿 원문과 동일한 텍스트)
+_GNB_HEAD, _rest = navigation._GNB.source.split("{{ menu|raw }}")
+_GNB_MID, _rest = _rest.split("{{ landing_page }}")
+_GNB_ICON_PRE, _rest = _rest.split("{{ logo_icon }}")
+_GNB_TEXT_PRE, _GNB_TAIL = _rest.split("{{ logo_text }}")
+
+
+def legacy_gnb_html(logo_icon="G", logo_text="공구매칭", menu_items=None, landing_page="landing"):
+    if menu_items is None:
+        menu_items = [{"label": "매칭하기", "page": "matching"}]
+
+    menu_html = ""
+    for item in menu_items:
+        href = "?page=" + item['page']
+        if "section" in item:
+            href += "&section=" + item['section']
+        menu_html += '    <a class="x-menu-item" href="' + href + '" target="_top">' + item["label"] + '</a>\n'
+
+    return (
+        _GNB_HEAD + menu_html + _GNB_MID + landing_page + _GNB_ICON_PRE
+        + logo_icon + _GNB_TEXT_PRE + logo_text + _GNB_TAIL
+    )
+
+
+def legacy_stats_card(items, title="통계"):
+    total = sum(item.value for item in items)
+
+    bar_html = ""
+    for item in items:
+        pct = (item.value / total * 100) if total > 0 else 0
+        bar_html += f'<div class="stats-segment" style="width:{pct}%;background:{item.color};"></div>'
+
+    legend_html = ""
+    for item in items:
+        legend_html += f'''
+        <div class="stats-legend-item">
+            <div class="stats-legend-dot" style="background:{item.color};"></div>
+            <span class="stats-legend-text">{item.label} {item.value}</span>
+        </div>
+        '''
+
+    return f'''
+    <div class="stats-container">
+        <div class="stats-title">{title} (총 {total}건)</div>
+        <div class="stats-bar">{bar_html}</div>
+        <div class="stats-legend">{legend_html}</div>
+    </div>
+    '''
+
+
+# ============================================================
+# 측정
+# ============================================================
+
+CASES = {
+    "feature_card": (
+        lambda: legacy_feature_card("⚡", "빠른 매칭", "주문서와 입금내역을 자동 매칭"),
+        lambda: cards.feature_card.uncached("⚡", "빠른 매칭", "주문서와 입금내역을 자동 매칭"),
+    ),
+    "pricing_card_html": (
+        lambda: legacy_pricing_card_html("Pro", "₩9,900", "월", FEATURES, True),
+        lambda: cards.pricing_card_html.uncached("Pro", "₩9,900", "월", FEATURES, True),
+    ),
+    "gnb_html": (
+        lambda: legacy_gnb_html(menu_items=MENU),
+        lambda: navigation.gnb_html.uncached(menu_items=MENU),
+    ),
+    "stats_card_html": (
+        lambda: legacy_stats_card(STATS, title="매칭 결과"),
+        lambda: cards.stats_card_html.uncached(STATS, title="매칭 결과"),
+    ),
+}
+
+
+def _rates(legacy, current, rounds: int = 7):
+    """두 구현을 번갈아 측정 (CPU 클럭/부하 변동이 한쪽에만 몰리지 않도록)"""
+    best_legacy = best_current = float("inf")
+    for _ in range(rounds):
+        best_legacy = min(best_legacy, timeit.timeit(legacy, number=NUMBER))
+        best_current = min(best_current, timeit.timeit(current, number=NUMBER))
+    return NUMBER / best_legacy, NUMBER / best_current
+
+
+def main() -> None:
+    print(f"{'component':<20} {'legacy (/s)':>14} {'template (/s)':>14} {'ratio':>8} {'bytes':>14}")
+    for name, (legacy, current) in CASES.items():
+        legacy_rate, current_rate = _rates(legacy, current)
+        sizes = f"{len(legacy().encode())}→{len(current().encode())}"
+        print(
+            f"{name:<20} {legacy_rate:>14,.0f} {current_rate:>14,.0f} "
+            f"{current_rate / legacy_rate:>7.2f}x {sizes:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
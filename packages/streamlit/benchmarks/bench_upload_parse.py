@@ -0,0 +1,120 @@
+"""
+benchmarks/bench_upload_parse.py
+업로드 파싱 - 스크립트 스레드에서 pandas로 전체 읽기 vs parse_table 청크 파싱
+
+pandas:      pd.read_csv / pd.read_excel (upload_card 이후 앱에서 하던 방식)
+parse_table: studio_ui.data.parse_table (Arrow 청크, pandas는 .to_pandas()로 변환할 때만)
+job:         ParseJob (스레드 풀) - 파싱 중 스크립트 스레드가 얼마나 오래 멈추는지(최대 간격) 측정
+
+방법마다 별도 프로세스에서 실행해 최대 RSS(ru_maxrss)를 비교합니다.
+
+요구 사항:
+    pip install "studio-ui[dev]"
+
+실행:
+    python benchmarks/bench_upload_parse.py [--csv-rows 200000] [--xlsx-rows 50000]
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+COLUMNS = 20
+
+
+def _make_files(directory: str, csv_rows: int, xlsx_rows: int) -> dict:
+    import openpyxl
+
+    rng = random.Random(0)
+    header = ["입금자", "금액", "메모", "주소"] + [f"c{i}" for i in range(COLUMNS - 4)]
+
+    csv_path = os.path.join(directory, "deposits.csv")
+    with open(csv_path, "w", encoding="utf-8") as f:
+        f.write(",".join(header) + "\n")
+        for i in range(csv_rows):
+            row = [f"고객{i % 977}", str(rng.randint(1000, 99999)), "입금", f"서울시 {i % 50}구"]
+            f.write(",".join(row + [str(i * j) for j in range(COLUMNS - 4)]) + "\n")
+
+    xlsx_path = os.path.join(directory, "orders.xlsx")
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("주문")
+    sheet.append(header)
+    for i in range(xlsx_rows):
+        sheet.append([f"고객{i % 977}", rng.randint(1000, 99999), "입금", f"서울시 {i % 50}구"]
+                     + [i * j for j in range(COLUMNS - 4)])
+    workbook.save(xlsx_path)
+    return {"csv": csv_path, "xlsx": xlsx_path}
+
+
+def _child(method: str, path: str) -> None:
+    start = time.perf_counter()
+    max_gap = 0.0
+    if method == "pandas":
+        import pandas as pd
+
+        frame = pd.read_csv(path) if path.endswith(".csv") else pd.read_excel(path)
+        rows = len(frame)
+    elif method == "parse_table":
+        from studio_ui.data import parse_table
+
+        rows = parse_table(path).num_rows
+    else:
+        from studio_ui.data import ParseJob
+
+        with open(path, "rb") as f:
+            job = ParseJob(f.read(), os.path.basename(path))
+        last = time.perf_counter()
+        while not job.done:  # 스크립트 스레드의 다른 작업(리런)을 흉내
+            time.sleep(0.01)
+            now = time.perf_counter()
+            max_gap = max(max_gap, now - last)
+            last = now
+        rows = job.result().num_rows
+    elapsed = time.perf_counter() - start
+    if method != "job":
+        max_gap = elapsed  # 스크립트 스레드가 파싱 내내 멈춤
+    print(json.dumps({
+        "rows": rows,
+        "seconds": elapsed,
+        "max_gap": max_gap,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--csv-rows", type=int, default=200_000)
+    parser.add_argument("--xlsx-rows", type=int, default=50_000)
+    parser.add_argument("--child", nargs=2, metavar=("METHOD", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        _child(*args.child)
+        return
+
+    try:
+        import openpyxl  # noqa: F401
+    except ImportError:
+        print("openpyxl이 설치되어 있지 않아 건너뜁니다 (pip install \"studio-ui[dev]\")")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = _make_files(tmp, args.csv_rows, args.xlsx_rows)
+        print(f"{'file':<6} {'method':<12} {'rows':>8} {'time':>9} {'script blocked':>15} {'peak RSS':>10}")
+        for kind, path in files.items():
+            for method in ("pandas", "parse_table", "job"):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--child", method, path],
+                    check=True, capture_output=True, text=True, env=os.environ,
+                ).stdout
+                r = json.loads(out.strip().splitlines()[-1])
+                print(f"{kind:<6} {method:<12} {r['rows']:>8,} {r['seconds']:>7.2f} s "
+                      f"{r['max_gap'] * 1000:>12.0f} ms {r['rss_mb']:>7.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
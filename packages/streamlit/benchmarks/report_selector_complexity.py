@@ -0,0 +1,22 @@
+"""
+benchmarks/report_selector_complexity.py
+full / lean 테마 프로필의 선택자 복잡도 정적 비교 리포트
+
+실행:
+    python benchmarks/report_selector_complexity.py
+"""
+from studio_ui.core.css_audit import audit_stylesheet, format_reports
+from studio_ui.core.styles import compile_stylesheet
+from studio_ui.core.theme import DEFAULT_THEME
+
+
+def main() -> None:
+    reports = {
+        profile: audit_stylesheet(compile_stylesheet(DEFAULT_THEME, profile))
+        for profile in ("full", "lean")
+    }
+    print(format_reports(reports))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,156 @@
 """
 studio-ui: Streamlit 범용 디자인 시스템
 """
-# Core
-from studio_ui.core.tokens import COLORS, TYPOGRAPHY, SPACING, RADIUS, SHADOW
-from studio_ui.core.theme import Theme, DEFAULT_THEME, DARK_THEME
-from studio_ui.core.styles import apply_theme, inject_css
-
-# Components - Atoms
-from studio_ui.components.atoms import badge, section_label, section_title, label_badge, link_icon
-
-# Components - Cards
-from studio_ui.components.cards import (
-    PricingPlan,
-    pricing_card,
-    pricing_grid,
-    pricing_card_html,
-    feature_card,
-    StatItem,
-    stats_card,
-    upload_card,
-)
-
-# Components - Layouts
-from studio_ui.components.layouts import (
-    section_container,
-    section_end,
-    card_grid,
-)
-from studio_ui.components.layout import container, section_header, hero
-
-# Components - Forms
-from studio_ui.components.forms import (
-    column_matcher,
-    tab_selector,
-)
-
-# Components - Navigation
-from studio_ui.components.navigation import gnb, gnb_html
-
-# Components - Slider
-from studio_ui.components.slider import swipe_slider
-
-# Components - Step Carousel
-from studio_ui.components.step_carousel import step_carousel
-
-# Components - Action Card
-from studio_ui.components.action_card import action_card, action_card_style
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Core
+    from studio_ui.core.tokens import COLORS, TYPOGRAPHY, SPACING, RADIUS, SHADOW, TRANSITION
+    from studio_ui.core.theme import Theme, DEFAULT_THEME, DARK_THEME
+    from studio_ui.core.registry import ThemeRegistry, THEME_REGISTRY, get_theme
+    from studio_ui.core.styles import apply_theme, inject_css, css_run_stats
+    from studio_ui.core.render import batch, emit_html, flush_html
+    from studio_ui.core.cache import fragment_cache_stats, clear_fragment_cache
+    from studio_ui.core.state import ComponentStats, component_stats, reset_component_stats
+    from studio_ui.core.feed import StatsFeed
+
+    # Components - Atoms
+    from studio_ui.components.atoms import badge, section_label, section_title, label_badge, link_icon
+    from studio_ui.components.atoms import (
+        badge_html,
+        section_label_html,
+        section_title_html,
+        label_badge_html,
+        link_icon_html,
+    )
+
+    # Components - Cards
+    from studio_ui.components.cards import (
+        PricingPlan,
+        pricing_card,
+        pricing_grid,
+        pricing_card_html,
+        feature_card,
+        StatItem,
+        stats_card,
+        stats_card_html,
+        stats_items,
+        live_stats_card,
+        upload_card,
+        upload_table_card,
+        read_upload_columns,
+        download_card,
+        UploadResult,
+    )
+
+    # Components - Layouts
+    from studio_ui.components.layouts import (
+        section_container,
+        section_container_html,
+        section_end,
+        card_grid,
+        grid_card_html,
+    )
+    from studio_ui.components.layout import container, container_html, section_header, hero, hero_html
+
+    # Components - Forms
+    from studio_ui.components.forms import (
+        column_matcher,
+        tab_selector,
+    )
+
+    # Components - Navigation
+    from studio_ui.components.navigation import gnb, gnb_html
+
+    # Components - Slider
+    from studio_ui.components.slider import swipe_slider
+
+    # Components - Step Carousel
+    from studio_ui.components.step_carousel import step_carousel
+
+    # Components - Action Card
+    from studio_ui.components.action_card import action_card, action_card_style
+
+# 공개 API → 정의 모듈 (PEP 562 지연 로딩: 실제로 접근한 모듈만 import)
+_LAZY_ATTRS = {
+    # Core
+    "COLORS": "studio_ui.core.tokens",
+    "TYPOGRAPHY": "studio_ui.core.tokens",
+    "SPACING": "studio_ui.core.tokens",
+    "RADIUS": "studio_ui.core.tokens",
+    "SHADOW": "studio_ui.core.tokens",
+    "TRANSITION": "studio_ui.core.tokens",
+    "Theme": "studio_ui.core.theme",
+    "DEFAULT_THEME": "studio_ui.core.theme",
+    "DARK_THEME": "studio_ui.core.theme",
+    "ThemeRegistry": "studio_ui.core.registry",
+    "THEME_REGISTRY": "studio_ui.core.registry",
+    "get_theme": "studio_ui.core.registry",
+    "apply_theme": "studio_ui.core.styles",
+    "inject_css": "studio_ui.core.styles",
+    "css_run_stats": "studio_ui.core.styles",
+    "batch": "studio_ui.core.render",
+    "emit_html": "studio_ui.core.render",
+    "flush_html": "studio_ui.core.render",
+    "fragment_cache_stats": "studio_ui.core.cache",
+    "clear_fragment_cache": "studio_ui.core.cache",
+    "ComponentStats": "studio_ui.core.state",
+    "component_stats": "studio_ui.core.state",
+    "reset_component_stats": "studio_ui.core.state",
+    "StatsFeed": "studio_ui.core.feed",
+    # Components - Atoms
+    "badge": "studio_ui.components.atoms",
+    "section_label": "studio_ui.components.atoms",
+    "section_title": "studio_ui.components.atoms",
+    "label_badge": "studio_ui.components.atoms",
+    "link_icon": "studio_ui.components.atoms",
+    "badge_html": "studio_ui.components.atoms",
+    "section_label_html": "studio_ui.components.atoms",
+    "section_title_html": "studio_ui.components.atoms",
+    "label_badge_html": "studio_ui.components.atoms",
+    "link_icon_html": "studio_ui.components.atoms",
+    # Components - Cards
+    "PricingPlan": "studio_ui.components.cards",
+    "pricing_card": "studio_ui.components.cards",
+    "pricing_grid": "studio_ui.components.cards",
+    "pricing_card_html": "studio_ui.components.cards",
+    "feature_card": "studio_ui.components.cards",
+    "StatItem": "studio_ui.components.cards",
+    "stats_card": "studio_ui.components.cards",
+    "stats_card_html": "studio_ui.components.cards",
+    "stats_items": "studio_ui.components.cards",
+    "live_stats_card": "studio_ui.components.cards",
+    "upload_card": "studio_ui.components.cards",
+    "upload_table_card": "studio_ui.components.cards",
+    "read_upload_columns": "studio_ui.components.cards",
+    "download_card": "studio_ui.components.cards",
+    "UploadResult": "studio_ui.components.cards",
+    # Components - Layouts
+    "section_container": "studio_ui.components.layouts",
+    "section_end": "studio_ui.components.layouts",
+    "card_grid": "studio_ui.components.layouts",
+    "section_container_html": "studio_ui.components.layouts",
+    "grid_card_html": "studio_ui.components.layouts",
+    "container": "studio_ui.components.layout",
+    "container_html": "studio_ui.components.layout",
+    "section_header": "studio_ui.components.layout",
+    "hero": "studio_ui.components.layout",
+    "hero_html": "studio_ui.components.layout",
+    # Components - Forms
+    "column_matcher": "studio_ui.components.forms",
+    "tab_selector": "studio_ui.components.forms",
+    # Components - Navigation
+    "gnb": "studio_ui.components.navigation",
+    "gnb_html": "studio_ui.components.navigation",
+    # Components - Slider
+    "swipe_slider": "studio_ui.components.slider",
+    # Components - Step Carousel
+    "step_carousel": "studio_ui.components.step_carousel",
+    # Components - Action Card
+    "action_card": "studio_ui.components.action_card",
+    "action_card_style": "studio_ui.components.action_card",
+}
 
 __version__ = "0.1.0"
 
@@ -56,17 +161,36 @@ __all__ = [
     "SPACING",
     "RADIUS",
     "SHADOW",
+    "TRANSITION",
     "Theme",
     "DEFAULT_THEME",
     "DARK_THEME",
+    "ThemeRegistry",
+    "THEME_REGISTRY",
+    "get_theme",
     "apply_theme",
     "inject_css",
+    "css_run_stats",
+    "batch",
+    "emit_html",
+    "flush_html",
+    "fragment_cache_stats",
+    "clear_fragment_cache",
+    "ComponentStats",
+    "component_stats",
+    "reset_component_stats",
+    "StatsFeed",
     # Atoms
     "badge",
     "section_label",
     "section_title",
     "label_badge",
     "link_icon",
+    "badge_html",
+    "section_label_html",
+    "section_title_html",
+    "label_badge_html",
+    "link_icon_html",
     # Cards
     "PricingPlan",
     "pricing_card",
@@ -75,14 +199,25 @@ __all__ = [
     "feature_card",
     "StatItem",
     "stats_card",
+    "stats_card_html",
+    "stats_items",
+    "live_stats_card",
     "upload_card",
+    "upload_table_card",
+    "read_upload_columns",
+    "download_card",
+    "UploadResult",
     # Layouts
     "section_container",
+    "section_container_html",
     "section_end",
     "card_grid",
+    "grid_card_html",
     "container",
+    "container_html",
     "section_header",
     "hero",
+    "hero_html",
     # Forms
     "column_matcher",
     "tab_selector",
@@ -97,3 +232,16 @@ __all__ = [
     "action_card",
     "action_card_style",
 ]
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -1,38 +1,139 @@
 """
 studio_ui.components - UI 컴포넌트
 """
-from .atoms import badge, section_label, section_title
-from .cards import (
-    PricingPlan,
-    pricing_card,
-    pricing_grid,
-    pricing_card_html,
-    feature_card,
-    StatItem,
-    stats_card,
-    upload_card,
-)
-from .layouts import section_container, section_end, card_grid
-from .layout import container, section_header, hero
-from .forms import column_matcher, tab_selector
-from .navigation import gnb, gnb_html
-from .slider import swipe_slider
-from .auth import (
-    AuthFormResult,
-    SignupFormResult,
-    login_form,
-    signup_form,
-    logout_button,
-    user_menu,
-    auth_container,
-    google_oauth_button,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .atoms import (
+        badge,
+        badge_html,
+        section_label,
+        section_label_html,
+        section_title,
+        section_title_html,
+        divider,
+        divider_html,
+        label_badge,
+        label_badge_html,
+        link_icon,
+        link_icon_html,
+    )
+    from .cards import (
+        PricingPlan,
+        pricing_card,
+        pricing_grid,
+        pricing_card_html,
+        feature_card,
+        StatItem,
+        stats_card,
+        stats_card_html,
+        stats_items,
+        live_stats_card,
+        upload_card,
+        upload_table_card,
+        read_upload_columns,
+        download_card,
+        UploadResult,
+    )
+    from .layouts import (
+        section_container,
+        section_container_html,
+        section_end,
+        card_grid,
+        grid_card_html,
+        dark_container,
+        dark_container_html,
+        spacer,
+        spacer_html,
+    )
+    from .layout import container, container_html, section_header, hero, hero_html
+    from .forms import column_matcher, tab_selector
+    from .navigation import gnb, gnb_html
+    from .slider import swipe_slider
+    from .auth import (
+        AuthFormResult,
+        SignupFormResult,
+        login_form,
+        signup_form,
+        logout_button,
+        user_menu,
+        auth_container,
+        google_oauth_button,
+    )
+
+# 공개 API → 정의 모듈 (PEP 562 지연 로딩: 실제로 접근한 모듈만 import)
+_LAZY_ATTRS = {
+    "badge": "studio_ui.components.atoms",
+    "section_label": "studio_ui.components.atoms",
+    "section_title": "studio_ui.components.atoms",
+    "badge_html": "studio_ui.components.atoms",
+    "section_label_html": "studio_ui.components.atoms",
+    "section_title_html": "studio_ui.components.atoms",
+    "divider": "studio_ui.components.atoms",
+    "divider_html": "studio_ui.components.atoms",
+    "label_badge": "studio_ui.components.atoms",
+    "label_badge_html": "studio_ui.components.atoms",
+    "link_icon": "studio_ui.components.atoms",
+    "link_icon_html": "studio_ui.components.atoms",
+    "PricingPlan": "studio_ui.components.cards",
+    "pricing_card": "studio_ui.components.cards",
+    "pricing_grid": "studio_ui.components.cards",
+    "pricing_card_html": "studio_ui.components.cards",
+    "feature_card": "studio_ui.components.cards",
+    "StatItem": "studio_ui.components.cards",
+    "stats_card": "studio_ui.components.cards",
+    "stats_card_html": "studio_ui.components.cards",
+    "stats_items": "studio_ui.components.cards",
+    "live_stats_card": "studio_ui.components.cards",
+    "upload_card": "studio_ui.components.cards",
+    "upload_table_card": "studio_ui.components.cards",
+    "read_upload_columns": "studio_ui.components.cards",
+    "download_card": "studio_ui.components.cards",
+    "UploadResult": "studio_ui.components.cards",
+    "section_container": "studio_ui.components.layouts",
+    "section_end": "studio_ui.components.layouts",
+    "card_grid": "studio_ui.components.layouts",
+    "section_container_html": "studio_ui.components.layouts",
+    "grid_card_html": "studio_ui.components.layouts",
+    "dark_container": "studio_ui.components.layouts",
+    "dark_container_html": "studio_ui.components.layouts",
+    "spacer": "studio_ui.components.layouts",
+    "spacer_html": "studio_ui.components.layouts",
+    "container": "studio_ui.components.layout",
+    "container_html": "studio_ui.components.layout",
+    "section_header": "studio_ui.components.layout",
+    "hero": "studio_ui.components.layout",
+    "hero_html": "studio_ui.components.layout",
+    "column_matcher": "studio_ui.components.forms",
+    "tab_selector": "studio_ui.components.forms",
+    "gnb": "studio_ui.components.navigation",
+    "gnb_html": "studio_ui.components.navigation",
+    "swipe_slider": "studio_ui.components.slider",
+    "AuthFormResult": "studio_ui.components.auth",
+    "SignupFormResult": "studio_ui.components.auth",
+    "login_form": "studio_ui.components.auth",
+    "signup_form": "studio_ui.components.auth",
+    "logout_button": "studio_ui.components.auth",
+    "user_menu": "studio_ui.components.auth",
+    "auth_container": "studio_ui.components.auth",
+    "google_oauth_button": "studio_ui.components.auth",
+}
 
 __all__ = [
     # Atoms
     "badge",
     "section_label",
     "section_title",
+    "divider",
+    "label_badge",
+    "link_icon",
+    "badge_html",
+    "section_label_html",
+    "section_title_html",
+    "divider_html",
+    "label_badge_html",
+    "link_icon_html",
     # Cards
     "PricingPlan",
     "pricing_card",
@@ -41,14 +142,29 @@ __all__ = [
     "feature_card",
     "StatItem",
     "stats_card",
+    "stats_card_html",
+    "stats_items",
+    "live_stats_card",
     "upload_card",
+    "upload_table_card",
+    "read_upload_columns",
+    "download_card",
+    "UploadResult",
     # Layouts
     "section_container",
+    "section_container_html",
     "section_end",
     "card_grid",
+    "grid_card_html",
+    "dark_container",
+    "dark_container_html",
+    "spacer",
+    "spacer_html",
     "container",
+    "container_html",
     "section_header",
     "hero",
+    "hero_html",
     # Forms
     "column_matcher",
     "tab_selector",
@@ -67,3 +183,16 @@ __all__ = [
     "auth_container",
     "google_oauth_button",
 ]
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
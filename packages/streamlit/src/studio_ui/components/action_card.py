@@ -3,8 +3,61 @@ studio_ui/components/action_card.py
 액션 버튼이 있는 카드 컴포넌트
 """
 import streamlit as st
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from typing import Optional, Callable
+from studio_ui.core.compat import HAS_KEY_CLASSES
+from studio_ui.core.render import flush_html
+from studio_ui.core.state import on_interaction, track_run
+from studio_ui.core.styles import inject_css
+
+# 삭제 버튼 위젯 키 접두사 (del_{key}, 기존 앱의 session_state/테스트 키와 호환)
+DELETE_KEY_PREFIX = "del_"
+# 삭제 버튼을 감싸는 컨테이너 키 접두사 (스타일 선택 범위를 패키지 이름공간으로 한정)
+DELETE_SCOPE_PREFIX = "studio_action_"
+
+# 삭제 버튼 스타일 (JavaScript/iframe 없음)
+# Streamlit은 키 있는 컨테이너에 st-key-<키> 클래스를 붙이므로 삭제 버튼을 studio_action_{key}
+# 컨테이너로 감싸 그 안의 버튼만 선택 (사용자의 del_* 위젯은 영향 없음, 테마의 버튼 규칙보다 명시도가 높도록 작성)
+_DELETE_BUTTON_CSS = f"""
+    .stApp [class^="st-key-{DELETE_SCOPE_PREFIX}"] .stButton > button[data-testid],
+    .stApp [class*=" st-key-{DELETE_SCOPE_PREFIX}"] .stButton > button[data-testid],
+    .stApp [class^="st-key-{DELETE_SCOPE_PREFIX}"] .stButton > button[data-testid]:hover,
+    .stApp [class*=" st-key-{DELETE_SCOPE_PREFIX}"] .stButton > button[data-testid]:hover {{
+        background: transparent !important;
+        border: none !important;
+        box-shadow: none !important;
+        padding: 2px 6px !important;
+        min-height: auto !important;
+        font-size: 28px !important;
+        cursor: pointer;
+    }}
+"""
+
+# st-key-<키> 클래스가 없는 버전(< 1.39)용 대체 경로 - 이전과 같은 iframe 스크립트 (실행당 1회)
+_DELETE_BUTTON_SCRIPT = """
+<script>
+function styleDeleteButtons() {
+    // 🗑️ 이모지가 있는 버튼 찾기
+    const buttons = window.parent.document.querySelectorAll('button');
+    buttons.forEach(btn => {
+        if (btn.textContent.includes('🗑️')) {
+            btn.style.background = 'transparent';
+            btn.style.border = 'none';
+            btn.style.boxShadow = 'none';
+            btn.style.padding = '2px 6px';
+            btn.style.minHeight = 'auto';
+            btn.style.fontSize = '28px';
+            btn.style.cursor = 'pointer';
+        }
+    });
+}
+
+// 초기 실행 및 DOM 변경 감지
+setTimeout(styleDeleteButtons, 100);
+const observer = new MutationObserver(styleDeleteButtons);
+observer.observe(window.parent.document.body, { childList: true, subtree: true });
+</script>
+"""
 
 
 @contextmanager
@@ -21,6 +74,7 @@ def action_card(
         title: 카드 타이틀 (이모지 포함 가능)
         key: 고유 키
         on_delete: 삭제 버튼 클릭 시 호출할 콜백 함수
+            (버튼 on_click 콜백으로 스크립트 재실행 전에 호출됨)
         deletable: True이면 삭제 버튼 표시 (on_delete가 None이어도)
 
     Example:
@@ -31,14 +85,27 @@ def action_card(
     # 삭제 버튼 표시 여부
     show_delete = on_delete is not None or deletable
 
+    track_run("action_card")
+    if show_delete:
+        action_card_style()
+
     # 카드 컨테이너
+    flush_html()
     with st.container(border=True):
         # 삭제 버튼 (타이틀 위에 배치)
+        # on_delete는 클릭으로 인한 재실행 전에 콜백으로 호출되므로
+        # 이번 실행에서 바로 삭제 결과가 반영됨 (st.rerun() 불필요)
         if show_delete:
-            delete_clicked = st.button("🗑️", key=f"del_{key}", help=None)
-            if delete_clicked and on_delete:
-                on_delete()
-                st.rerun()
+            scope = st.container(key=f"{DELETE_SCOPE_PREFIX}{key}") if HAS_KEY_CLASSES else nullcontext()
+            with scope:
+                st.button(
+                    "🗑️",
+                    key=f"{DELETE_KEY_PREFIX}{key}",
+                    help=None,
+                    on_click=on_interaction,
+                    args=("action_card",),
+                    kwargs={"callback": on_delete},
+                )
 
         # 헤더 영역
         st.markdown(f"**{title}**")
@@ -50,38 +117,21 @@ def action_card(
 def action_card_style():
     """
     action_card의 전역 스타일을 적용합니다.
-    apply_theme()에서 호출하거나 별도로 호출할 수 있습니다.
+    action_card()가 자동으로 호출하며, 별도로 호출해도 같은 실행에서 한 번만 전송됩니다.
+
+    삭제 버튼(키 del_{key})은 감싸는 컨테이너에 Streamlit이 붙이는 st-key-<키> 클래스
+    (studio_action_{key} → st-key-studio_action_{key})로 선택합니다. JavaScript/iframe 없이 CSS만 사용합니다.
+    st-key 클래스가 없는 Streamlit(< 1.39)에서는 이전의 iframe 스크립트를 실행당 한 번 붙입니다.
     """
+    if HAS_KEY_CLASSES:
+        inject_css(_DELETE_BUTTON_CSS, key="action_card_styles")
+        return
+
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
     import streamlit.components.v1 as components
 
-    # JavaScript로 삭제 버튼 스타일 적용
-    components.html('''
-    <script>
-    function styleDeleteButtons() {
-        // 🗑️ 이모지가 있는 버튼 찾기
-        const buttons = window.parent.document.querySelectorAll('button');
-        buttons.forEach(btn => {
-            if (btn.textContent.includes('🗑️')) {
-                btn.style.background = 'transparent';
-                btn.style.border = 'none';
-                btn.style.boxShadow = 'none';
-                btn.style.padding = '2px 6px';
-                btn.style.minHeight = 'auto';
-                btn.style.fontSize = '28px';
-                btn.style.cursor = 'pointer';
-            }
-        });
-    }
-
-    // 초기 실행 및 DOM 변경 감지
-    setTimeout(styleDeleteButtons, 100);
-    setTimeout(styleDeleteButtons, 300);
-    setTimeout(styleDeleteButtons, 600);
-
-    // MutationObserver로 DOM 변경 감지
-    const observer = new MutationObserver(() => {
-        styleDeleteButtons();
-    });
-    observer.observe(window.parent.document.body, { childList: true, subtree: true });
-    </script>
-    ''', height=0)
+    ctx = get_script_run_ctx()
+    if ctx is None or getattr(ctx, "_studio_ui_delete_script", None) is ctx.cursors:
+        return
+    ctx._studio_ui_delete_script = ctx.cursors
+    components.html(_DELETE_BUTTON_SCRIPT, height=0)
@@ -2,8 +2,40 @@
 studio_ui/components/atoms.py
 기본 UI 요소: Badge, Tag, Section Header 등
 """
-import streamlit as st
 from typing import Literal, Optional
+from studio_ui.core.render import emit_html
+from studio_ui.core.template import Template
+
+
+_BADGE = Template("""
+    <span style="
+        display: inline-block;
+        background: {{ bg|raw }};
+        color: {{ fg|raw }};
+        padding: 0.25rem 0.75rem;
+        border-radius: 9999px;
+        font-size: 0.625rem;
+        font-weight: 700;
+        text-transform: uppercase;
+        letter-spacing: 0.05em;
+    ">{{ text }}</span>
+""")
+
+
+def badge_html(
+    text: str,
+    variant: Literal["default", "success", "warning", "error", "info"] = "default",
+) -> str:
+    """badge() HTML 반환"""
+    colors = {
+        "default": ("var(--primary)", "white"),
+        "success": ("var(--success)", "white"),
+        "warning": ("var(--warning)", "#333"),
+        "error": ("var(--error)", "white"),
+        "info": ("var(--info)", "white"),
+    }
+    bg, fg = colors.get(variant, colors["default"])
+    return _BADGE.render(bg=bg, fg=fg, text=text)
 
 
 def badge(
@@ -21,28 +53,24 @@ def badge(
         >>> badge("NEW", variant="success")
         >>> badge("추천", variant="default")
     """
-    colors = {
-        "default": ("var(--primary)", "white"),
-        "success": ("var(--success)", "white"),
-        "warning": ("var(--warning)", "#333"),
-        "error": ("var(--error)", "white"),
-        "info": ("var(--info)", "white"),
-    }
-    bg, fg = colors.get(variant, colors["default"])
+    emit_html(badge_html(text, variant))
 
-    st.markdown(f"""
-    <span style="
-        display: inline-block;
-        background: {bg};
-        color: {fg};
-        padding: 0.25rem 0.75rem;
-        border-radius: 9999px;
-        font-size: 0.625rem;
-        font-weight: 700;
+
+_SECTION_LABEL = Template("""
+    <div style="
+        font-size: 0.75rem;
+        font-weight: 600;
+        color: var(--fg-muted);
         text-transform: uppercase;
-        letter-spacing: 0.05em;
-    ">{text}</span>
-    """, unsafe_allow_html=True)
+        letter-spacing: 0.1em;
+        margin-bottom: 0.5rem;
+    ">{{ text }}</div>
+""")
+
+
+def section_label_html(text: str) -> str:
+    """section_label() HTML 반환"""
+    return _SECTION_LABEL.render(text=text)
 
 
 def section_label(text: str) -> None:
@@ -55,16 +83,30 @@ def section_label(text: str) -> None:
     Example:
         >>> section_label("HOW IT WORKS")
     """
-    st.markdown(f"""
+    emit_html(section_label_html(text))
+
+
+_SECTION_TITLE = Template("""
     <div style="
-        font-size: 0.75rem;
-        font-weight: 600;
+        font-size: 1.25rem;
+        font-weight: 700;
+        color: var(--fg-primary);
+        margin-bottom: 0.25rem;
+    ">{{ text }}</div>
+    {{ subtitle|raw }}
+""")
+_SECTION_SUBTITLE = Template("""
+    <div style="
+        font-size: 0.875rem;
         color: var(--fg-muted);
-        text-transform: uppercase;
-        letter-spacing: 0.1em;
-        margin-bottom: 0.5rem;
-    ">{text}</div>
-    """, unsafe_allow_html=True)
+    ">{{ text }}</div>
+""")
+
+
+def section_title_html(text: str, subtitle: Optional[str] = None) -> str:
+    """section_title() HTML 반환"""
+    subtitle_html = _SECTION_SUBTITLE.render(text=subtitle) if subtitle else ""
+    return _SECTION_TITLE.render(text=text, subtitle=subtitle_html)
 
 
 def section_title(text: str, subtitle: Optional[str] = None) -> None:
@@ -78,22 +120,21 @@ def section_title(text: str, subtitle: Optional[str] = None) -> None:
     Example:
         >>> section_title("주요 기능", subtitle="핵심 기능을 소개합니다")
     """
-    st.markdown(f"""
-    <div style="
-        font-size: 1.25rem;
-        font-weight: 700;
-        color: var(--fg-primary);
-        margin-bottom: 0.25rem;
-    ">{text}</div>
-    """, unsafe_allow_html=True)
+    emit_html(section_title_html(text, subtitle))
+
+
+_DIVIDER = Template("""
+    <hr style="
+        border: none;
+        border-top: 1px solid var(--border-light);
+        margin: {{ margin }} 0;
+    ">
+""")
+
 
-    if subtitle:
-        st.markdown(f"""
-        <div style="
-            font-size: 0.875rem;
-            color: var(--fg-muted);
-        ">{subtitle}</div>
-        """, unsafe_allow_html=True)
+def divider_html(margin: str = "1.5rem") -> str:
+    """divider() HTML 반환"""
+    return _DIVIDER.render(margin=margin)
 
 
 def divider(margin: str = "1.5rem") -> None:
@@ -106,13 +147,37 @@ def divider(margin: str = "1.5rem") -> None:
     Example:
         >>> divider()
     """
-    st.markdown(f"""
-    <hr style="
-        border: none;
-        border-top: 1px solid var(--border-light);
-        margin: {margin} 0;
-    ">
-    """, unsafe_allow_html=True)
+    emit_html(divider_html(margin))
+
+
+_LABEL_BADGE = Template("""
+    <span style="
+        display: inline-block;
+        padding: 4px 10px;
+        border-radius: 6px;
+        font-size: 11px;
+        font-weight: 600;
+        color: {{ color|raw }};
+        background: {{ bg|raw }};
+        border: 1px solid {{ border|raw }};
+        margin-bottom: 8px;
+    ">{{ text }}</span>
+""")
+
+
+def label_badge_html(
+    text: str,
+    variant: Literal["order", "deposit", "default"] = "default",
+) -> str:
+    """label_badge() HTML 반환"""
+    # ⚠️ 디자인 시스템에 맞는 따뜻한 색상 팔레트 (수정 시 UI 확인 필수)
+    colors = {
+        "order": {"bg": "#f5ebe0", "text": "#8b7355", "border": "#d4c4b0"},
+        "deposit": {"bg": "#e8f0e8", "text": "#5a7a5a", "border": "#c4d4c4"},
+        "default": {"bg": "#f5f3f0", "text": "#6b6560", "border": "#e0dcd8"},
+    }
+    style = colors.get(variant, colors["default"])
+    return _LABEL_BADGE.render(color=style["text"], bg=style["bg"], border=style["border"], text=text)
 
 
 def label_badge(
@@ -132,27 +197,22 @@ def label_badge(
         >>> label_badge("주문서", variant="order")
         >>> label_badge("입금내역", variant="deposit")
     """
-    # ⚠️ 디자인 시스템에 맞는 따뜻한 색상 팔레트 (수정 시 UI 확인 필수)
-    colors = {
-        "order": {"bg": "#f5ebe0", "text": "#8b7355", "border": "#d4c4b0"},
-        "deposit": {"bg": "#e8f0e8", "text": "#5a7a5a", "border": "#c4d4c4"},
-        "default": {"bg": "#f5f3f0", "text": "#6b6560", "border": "#e0dcd8"},
-    }
-    style = colors.get(variant, colors["default"])
+    emit_html(label_badge_html(text, variant))
 
-    st.markdown(f"""
-    <span style="
-        display: inline-block;
-        padding: 4px 10px;
-        border-radius: 6px;
-        font-size: 11px;
-        font-weight: 600;
-        color: {style['text']};
-        background: {style['bg']};
-        border: 1px solid {style['border']};
-        margin-bottom: 8px;
-    ">{text}</span>
-    """, unsafe_allow_html=True)
+
+_LINK_ICON = Template("""
+    <div style="
+        text-align: center;
+        padding: 12px 0;
+        color: #999;
+        font-size: 1.5rem;
+    ">{{ icon }}</div>
+""")
+
+
+def link_icon_html(icon: str = "🔗") -> str:
+    """link_icon() HTML 반환"""
+    return _LINK_ICON.render(icon=icon)
 
 
 def link_icon(icon: str = "🔗") -> None:
@@ -166,11 +226,4 @@ def link_icon(icon: str = "🔗") -> None:
         >>> link_icon()
         >>> link_icon("↔️")
     """
-    st.markdown(f"""
-    <div style="
-        text-align: center;
-        padding: 12px 0;
-        color: #999;
-        font-size: 1.5rem;
-    ">{icon}</div>
-    """, unsafe_allow_html=True)
+    emit_html(link_icon_html(icon))
@@ -7,7 +7,10 @@ import streamlit as st
 from typing import Optional
 from dataclasses import dataclass
 
+from studio_ui.core.render import batch, emit_html, flush_html
+from studio_ui.core.state import on_interaction, track_run
 from studio_ui.core.styles import inject_css
+from studio_ui.core.template import Template
 
 
 @dataclass
@@ -34,6 +37,41 @@ class SignupFormResult:
         return self.password == self.password_confirm
 
 
+_AUTH_CARD = Template('<div class="auth-card">{{ header|raw }}</div>')
+_AUTH_HEADER = Template("""
+    <div class="auth-header">
+        {{ title|raw }}
+        {{ subtitle|raw }}
+    </div>
+""")
+_AUTH_TITLE = Template('<div class="auth-title">{{ text }}</div>')
+_AUTH_SUBTITLE = Template('<div class="auth-subtitle">{{ text }}</div>')
+_AUTH_CARD_HEADER = Template("""
+    <div class="auth-card">
+        <div class="auth-header">
+            <div class="auth-title">{{ title }}</div>
+            <div class="auth-subtitle">{{ subtitle }}</div>
+        </div>
+    </div>
+""")
+_AUTH_LINK = Template("""
+    <div class="auth-link">
+        <a href="#">{{ text }}</a>
+    </div>
+""")
+_AUTH_FOOTER = Template("""
+    <div class="auth-footer">
+        {{ text }} <a href="#">{{ link_text }}</a>
+    </div>
+""")
+_USER_MENU_INFO = Template("""
+    <div class="user-menu-info">
+        <div class="user-menu-name">{{ name }}</div>
+        <div class="user-menu-email">{{ email }}</div>
+    </div>
+""")
+
+
 def _auth_styles() -> None:
     """인증 폼 공통 스타일 - 디자인 시스템 적용"""
     inject_css("""
@@ -221,6 +259,7 @@ def google_oauth_button(
         <path d="M12 5.38c1.62 0 3.06.56 4.21 1.64l3.15-3.15C17.45 2.09 14.97 1 12 1 7.7 1 3.99 3.47 2.18 7.07l3.66 2.84c.87-2.6 3.3-4.53 6.16-4.53z" fill="#EA4335"/>
     </svg>"""
 
+    flush_html()
     clicked = st.button(
         f"🔵 {label}",
         key=key,
@@ -267,25 +306,21 @@ def login_form(
 
     oauth_provider = None
 
-    with st.container():
-        st.markdown('<div class="auth-card">', unsafe_allow_html=True)
-
-        # 헤더
-        st.markdown(f"""
-            <div class="auth-header">
-                <div class="auth-title">{title}</div>
-                <div class="auth-subtitle">{subtitle}</div>
-            </div>
-        """, unsafe_allow_html=True)
+    flush_html()
+    with st.container(), batch():
+        # 카드 + 헤더 (하나의 요소)
+        emit_html(_AUTH_CARD_HEADER.render(title=title, subtitle=subtitle))
 
         # Google OAuth
         if show_google_oauth:
+            flush_html()
             if google_oauth_button(key=f"{key}_google"):
                 oauth_provider = "google"
 
-            st.markdown('<div class="auth-divider">또는</div>', unsafe_allow_html=True)
+            emit_html('<div class="auth-divider">또는</div>')
 
         # 이메일 입력
+        flush_html()
         email = st.text_input(
             "이메일",
             placeholder=email_placeholder,
@@ -304,13 +339,10 @@ def login_form(
 
         # 비밀번호 찾기 링크
         if show_forgot_password:
-            st.markdown(f"""
-                <div class="auth-link">
-                    <a href="#">{forgot_password_text}</a>
-                </div>
-            """, unsafe_allow_html=True)
+            emit_html(_AUTH_LINK.render(text=forgot_password_text))
 
         # 로그인 버튼
+        flush_html()
         submitted = st.button(
             submit_label,
             key=f"{key}_submit",
@@ -319,13 +351,7 @@ def login_form(
         )
 
         # 푸터
-        st.markdown(f"""
-            <div class="auth-footer">
-                {signup_text} <a href="#">{signup_link_text}</a>
-            </div>
-        """, unsafe_allow_html=True)
-
-        st.markdown('</div>', unsafe_allow_html=True)
+        emit_html(_AUTH_FOOTER.render(text=signup_text, link_text=signup_link_text))
 
     return AuthFormResult(
         email=email,
@@ -369,25 +395,21 @@ def signup_form(
 
     oauth_provider = None
 
-    with st.container():
-        st.markdown('<div class="auth-card">', unsafe_allow_html=True)
-
-        # 헤더
-        st.markdown(f"""
-            <div class="auth-header">
-                <div class="auth-title">{title}</div>
-                <div class="auth-subtitle">{subtitle}</div>
-            </div>
-        """, unsafe_allow_html=True)
+    flush_html()
+    with st.container(), batch():
+        # 카드 + 헤더 (하나의 요소)
+        emit_html(_AUTH_CARD_HEADER.render(title=title, subtitle=subtitle))
 
         # Google OAuth
         if show_google_oauth:
+            flush_html()
             if google_oauth_button(label="Google로 회원가입", key=f"{key}_google"):
                 oauth_provider = "google"
 
-            st.markdown('<div class="auth-divider">또는 이메일로 가입</div>', unsafe_allow_html=True)
+            emit_html('<div class="auth-divider">또는 이메일로 가입</div>')
 
         # 이메일
+        flush_html()
         email = st.text_input(
             "이메일",
             placeholder=email_placeholder,
@@ -415,11 +437,10 @@ def signup_form(
 
         # 비밀번호 불일치 경고
         if password and password_confirm and password != password_confirm:
-            st.markdown("""
-                <div class="auth-error">비밀번호가 일치하지 않습니다</div>
-            """, unsafe_allow_html=True)
+            emit_html('<div class="auth-error">비밀번호가 일치하지 않습니다</div>')
 
         # 회원가입 버튼
+        flush_html()
         submitted = st.button(
             submit_label,
             key=f"{key}_submit",
@@ -428,13 +449,7 @@ def signup_form(
         )
 
         # 푸터
-        st.markdown(f"""
-            <div class="auth-footer">
-                {login_text} <a href="#">{login_link_text}</a>
-            </div>
-        """, unsafe_allow_html=True)
-
-        st.markdown('</div>', unsafe_allow_html=True)
+        emit_html(_AUTH_FOOTER.render(text=login_text, link_text=login_link_text))
 
     return SignupFormResult(
         email=email,
@@ -468,26 +483,49 @@ def logout_button(
         bool: 로그아웃 클릭 여부
     """
     btn_label = f"{icon} {label}".strip() if icon else label
+    flush_html()
 
-    if confirm:
-        if st.button(btn_label, key=key, type=button_type):
-            st.session_state[f"{key}_confirm"] = True
-
-        if st.session_state.get(f"{key}_confirm"):
-            st.warning(confirm_message)
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("취소", key=f"{key}_cancel", use_container_width=True):
-                    st.session_state[f"{key}_confirm"] = False
-                    st.rerun()
-            with col2:
-                if st.button("확인", key=f"{key}_confirm_btn", type="primary", use_container_width=True):
-                    st.session_state[f"{key}_confirm"] = False
-                    return True
-        return False
-    else:
+    if not confirm:
         return st.button(btn_label, key=key, type=button_type)
 
+    track_run("logout_button")
+    confirm_key = f"{key}_confirm"
+    confirmed_key = f"{key}_confirmed"
+
+    st.button(
+        btn_label,
+        key=key,
+        type=button_type,
+        on_click=on_interaction,
+        args=("logout_button", {confirm_key: True}),
+    )
+
+    # 확인 버튼 콜백이 남긴 1회성 플래그 (콜백에서 다이얼로그는 이미 닫힘)
+    if st.session_state.pop(confirmed_key, False):
+        return True
+
+    if st.session_state.get(confirm_key):
+        st.warning(confirm_message)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.button(
+                "취소",
+                key=f"{key}_cancel",
+                use_container_width=True,
+                on_click=on_interaction,
+                args=("logout_button", {confirm_key: False}),
+            )
+        with col2:
+            st.button(
+                "확인",
+                key=f"{key}_confirm_btn",
+                type="primary",
+                use_container_width=True,
+                on_click=on_interaction,
+                args=("logout_button", {confirm_key: False, confirmed_key: True}),
+            )
+    return False
+
 
 def user_menu(
     user_email: str,
@@ -526,13 +564,10 @@ def user_menu(
 
     display_name = user_name or user_email.split("@")[0]
 
+    flush_html()
     with st.popover(f"👤 {display_name}"):
-        st.markdown(f"""
-            <div class="user-menu-info">
-                <div class="user-menu-name">{display_name}</div>
-                <div class="user-menu-email">{user_email}</div>
-            </div>
-        """, unsafe_allow_html=True)
+        emit_html(_USER_MENU_INFO.render(name=display_name, email=user_email))
+        flush_html()
 
         result = None
 
@@ -560,14 +595,14 @@ def auth_container(
     """
     _auth_styles()
 
-    st.markdown('<div class="auth-card">', unsafe_allow_html=True)
-
+    # 카드 + 헤더 (하나의 요소)
+    header_html = ""
     if title or subtitle:
-        st.markdown(f"""
-            <div class="auth-header">
-                {f'<div class="auth-title">{title}</div>' if title else ''}
-                {f'<div class="auth-subtitle">{subtitle}</div>' if subtitle else ''}
-            </div>
-        """, unsafe_allow_html=True)
+        header_html = _AUTH_HEADER.render(
+            title=_AUTH_TITLE.render(text=title) if title else "",
+            subtitle=_AUTH_SUBTITLE.render(text=subtitle) if subtitle else "",
+        )
+    emit_html(_AUTH_CARD.render(header=header_html))
+    flush_html()
 
     return st.container()
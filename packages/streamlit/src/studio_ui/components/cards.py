@@ -2,16 +2,43 @@
 studio_ui/components/cards.py
 카드 컴포넌트
 """
+import time
 import streamlit as st
 from dataclasses import dataclass
-from typing import List, Optional, Callable, Any
+from datetime import timedelta
+from typing import TYPE_CHECKING, List, Literal, Mapping, Optional, Callable, Any, Sequence, Union
+from studio_ui.core.cache import cached_fragment
+from studio_ui.core.compat import HAS_DEFERRED_DOWNLOAD, HAS_FRAGMENT, fragment
+from studio_ui.core.feed import StatsFeed
+from studio_ui.core.frontend import studio_component
+from studio_ui.core.render import emit_html, flush_html
 from studio_ui.core.styles import inject_css
+from studio_ui.core.template import Template
+from studio_ui.core.tokens import Colors
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+    from studio_ui.data.cache import TableCache
+    from studio_ui.data.encoding import CsvDialect
 
 
 # ============================================================
 # FeatureCard - HTML 기반 (순수 표시용)
 # ============================================================
 
+_FEATURE_CARD = Template("""
+    <div style="flex: 1; min-width: 150px; text-align: center; padding: 1rem;">
+        <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">{{ emoji }}</div>
+        <div style="font-size: 1rem; font-weight: 600; color: #2d251f;">{{ title }}</div>
+        <div style="font-size: 0.875rem; color: #8b7355;">{{ description }}</div>
+    </div>
+""")
+
+
+@cached_fragment
 def feature_card(emoji: str, title: str, description: str) -> str:
     """
     피처 카드 (HTML 반환)
@@ -24,19 +51,29 @@ def feature_card(emoji: str, title: str, description: str) -> str:
     Returns:
         HTML 문자열
     """
-    return f"""
-    <div style="flex: 1; min-width: 150px; text-align: center; padding: 1rem;">
-        <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">{emoji}</div>
-        <div style="font-size: 1rem; font-weight: 600; color: #2d251f;">{title}</div>
-        <div style="font-size: 0.875rem; color: #8b7355;">{description}</div>
-    </div>
-    """
+    return _FEATURE_CARD.render(emoji=emoji, title=title, description=description)
 
 
 # ============================================================
 # PricingCard - HTML 기반 (순수 표시용)
 # ============================================================
 
+_PRICING_CARD = Template("""
+    <div style="background: {{ bg|raw }}; border: {{ border|raw }}; border-radius: 1rem; padding: 1.5rem; text-align: center; position: relative;">
+        {{ badge|raw }}
+        <div style="font-size: 0.75rem; font-weight: 600; color: {{ label_color|raw }}; text-transform: uppercase;">{{ plan }}</div>
+        <div style="font-size: 2rem; font-weight: 700; color: #2d251f;">{{ price }}</div>
+        <div style="font-size: 0.75rem; color: #8b7355; margin-bottom: 1rem;">{{ period }}</div>
+        <div style="text-align: left; font-size: 0.875rem; color: #5c4a3d;">
+            {{ features|raw }}
+        </div>
+    </div>
+""")
+_PRICING_FEATURE = Template('<div style="padding: 0.25rem 0; color: {{ color|raw }};">{{ text }}</div>')
+_PRICING_BADGE = '<div style="position: absolute; top: -0.75rem; left: 50%; transform: translateX(-50%); background: #c9a87c; color: white; font-size: 0.625rem; font-weight: 700; padding: 0.25rem 0.75rem; border-radius: 9999px;">추천</div>'
+
+
+@cached_fragment
 def pricing_card_html(
     plan: str,
     price: str,
@@ -60,7 +97,7 @@ def pricing_card_html(
     if is_featured:
         bg = "linear-gradient(135deg, #fffcf8, #fff9f0)"
         border = "2px solid #c9a87c"
-        badge = '<div style="position: absolute; top: -0.75rem; left: 50%; transform: translateX(-50%); background: #c9a87c; color: white; font-size: 0.625rem; font-weight: 700; padding: 0.25rem 0.75rem; border-radius: 9999px;">추천</div>'
+        badge = _PRICING_BADGE
         label_color = "#c9a87c"
     else:
         bg = "#fffdfb"
@@ -69,21 +106,20 @@ def pricing_card_html(
         label_color = "#8b7355"
 
     features_html = "".join([
-        f'<div style="padding: 0.25rem 0; color: {"#5c4a3d" if f.startswith("✓") else "#c9bfb0"};">{f}</div>'
+        _PRICING_FEATURE.render(color="#5c4a3d" if f.startswith("✓") else "#c9bfb0", text=f)
         for f in features
     ])
 
-    return f"""
-    <div style="background: {bg}; border: {border}; border-radius: 1rem; padding: 1.5rem; text-align: center; position: relative;">
-        {badge}
-        <div style="font-size: 0.75rem; font-weight: 600; color: {label_color}; text-transform: uppercase;">{plan}</div>
-        <div style="font-size: 2rem; font-weight: 700; color: #2d251f;">{price}</div>
-        <div style="font-size: 0.75rem; color: #8b7355; margin-bottom: 1rem;">{period}</div>
-        <div style="text-align: left; font-size: 0.875rem; color: #5c4a3d;">
-            {features_html}
-        </div>
-    </div>
-    """
+    return _PRICING_CARD.render(
+        bg=bg,
+        border=border,
+        badge=badge,
+        label_color=label_color,
+        plan=plan,
+        price=price,
+        period=period,
+        features=features_html,
+    )
 
 
 # ============================================================
@@ -103,6 +139,38 @@ class PricingPlan:
     cta_text: str = "선택하기"
 
 
+_PLAN_CARD = Template("""
+    <div class="{{ card_class|raw }}">
+        {{ badge|raw }}
+        <div class="pricing-name">{{ name }}</div>
+        <div class="pricing-price">{{ currency }}{{ price }}</div>
+        <div class="pricing-period">{{ period }}</div>
+        {{ features|raw }}
+    </div>
+    <div style="height: 1rem;"></div>
+""")
+_PLAN_FEATURE = Template('<div class="{{ cls|raw }}">{{ mark|raw }} {{ text }}</div>')
+_PLAN_BADGE = '<div class="pricing-badge">추천</div>'
+
+
+@cached_fragment
+def _plan_body_html(plan: PricingPlan) -> str:
+    """pricing_card() 본문 HTML (버튼 제외)"""
+    features_html = "".join(
+        [_PLAN_FEATURE.render(cls="pricing-feature", mark="✓", text=f) for f in (plan.features or [])]
+        + [_PLAN_FEATURE.render(cls="pricing-feature disabled", mark="✗", text=f) for f in (plan.disabled_features or [])]
+    )
+    return _PLAN_CARD.render(
+        card_class="pricing-card recommended" if plan.is_recommended else "pricing-card",
+        badge=_PLAN_BADGE if plan.is_recommended else "",
+        name=plan.name,
+        currency=plan.currency,
+        price=plan.price,
+        period=plan.period,
+        features=features_html,
+    )
+
+
 def pricing_card(
     plan: PricingPlan,
     on_select: Optional[Callable[[str], None]] = None,
@@ -185,24 +253,13 @@ def pricing_card(
         }
     """, key="pricing_card_styles")
 
-    card_class = "pricing-card recommended" if plan.is_recommended else "pricing-card"
     key = key or f"pricing_{plan.name}"
 
+    flush_html()
     with st.container():
-        badge_html = '<div class="pricing-badge">추천</div>' if plan.is_recommended else ""
-        st.markdown(f'<div class="{card_class}">{badge_html}', unsafe_allow_html=True)
-
-        st.markdown(f'<div class="pricing-name">{plan.name}</div>', unsafe_allow_html=True)
-        st.markdown(f'<div class="pricing-price">{plan.currency}{plan.price}</div>', unsafe_allow_html=True)
-        st.markdown(f'<div class="pricing-period">{plan.period}</div>', unsafe_allow_html=True)
-
-        for feature in (plan.features or []):
-            st.markdown(f'<div class="pricing-feature">✓ {feature}</div>', unsafe_allow_html=True)
-
-        for feature in (plan.disabled_features or []):
-            st.markdown(f'<div class="pricing-feature disabled">✗ {feature}</div>', unsafe_allow_html=True)
-
-        st.markdown("<div style='height: 1rem;'></div>", unsafe_allow_html=True)
+        # 버튼 앞의 카드 본문은 하나의 요소로 출력 (카드 div가 본문을 실제로 감쌈)
+        emit_html(_plan_body_html(plan))
+        flush_html()
 
         clicked = st.button(
             plan.cta_text,
@@ -211,14 +268,19 @@ def pricing_card(
             use_container_width=True,
         )
 
-        st.markdown('</div>', unsafe_allow_html=True)
-
         if clicked and on_select:
             on_select(plan.name)
 
         return clicked
 
 
+_GRID_FOOTER = Template("""
+    <div style="text-align: center; font-size: 0.75rem; color: var(--fg-muted); margin-top: 1rem;">
+        {{ text }}
+    </div>
+""")
+
+
 def pricing_grid(
     plans: List[PricingPlan],
     columns: int = 3,
@@ -236,6 +298,7 @@ def pricing_grid(
         선택된 플랜 이름 (없으면 None)
     """
     selected = None
+    flush_html()
     cols = st.columns(columns)
 
     for i, plan in enumerate(plans):
@@ -244,11 +307,7 @@ def pricing_grid(
                 selected = plan.name
 
     if footer_text:
-        st.markdown(f"""
-        <div style="text-align: center; font-size: 0.75rem; color: var(--fg-muted); margin-top: 1rem;">
-            {footer_text}
-        </div>
-        """, unsafe_allow_html=True)
+        emit_html(_GRID_FOOTER.render(text=footer_text))
 
     return selected
 
@@ -265,16 +324,153 @@ class StatItem:
     color: str
 
 
-def stats_card(
+# stats_card()에 넘길 수 있는 데이터: StatItem 리스트 또는 범주 레이블 (Series/배열/DataFrame/시퀀스)
+StatsData = Union[Sequence[StatItem], "pd.Series", "pd.DataFrame", "np.ndarray", Sequence[Any]]
+
+_COLORS = Colors()
+# colors를 지정하지 않은 항목에 순서대로 쓰는 팔레트
+_STATS_PALETTE = (
+    _COLORS.success,
+    _COLORS.warning,
+    _COLORS.error,
+    _COLORS.info,
+    _COLORS.primary,
+    _COLORS.fg_secondary,
+    _COLORS.primary_light,
+)
+_STATS_OTHER_COLOR = _COLORS.border_dark
+_STATS_MISSING_LABEL = "(빈 값)"
+
+
+def stats_items(
+    data: StatsData,
+    column: Optional[str] = None,
+    top_n: Optional[int] = None,
+    colors: Union[Mapping[str, str], Sequence[str], None] = None,
+    other_label: str = "기타",
+    dropna: bool = True,
+) -> List[StatItem]:
+    """
+    범주 레이블 데이터를 StatItem 리스트로 집계
+
+    집계는 pandas value_counts 한 번으로 끝나므로 (Python 루프 없음) 수백만 행도 빠르게 처리되며,
+    Categorical 컬럼은 코드 배열만 세므로 더 빠릅니다.
+    항목은 건수 내림차순이고, top_n을 넘는 범주는 other_label 항목 하나로 합칩니다.
+
+    Args:
+        data: 레이블 Series / 1차원 배열 / 시퀀스, 또는 DataFrame (column으로 컬럼 지정)
+        column: DataFrame 컬럼 (컬럼이 1개면 생략 가능)
+        top_n: 표시할 최대 범주 수 (나머지는 "기타"로 합산, None이면 전부)
+        colors: 레이블 → 색상 매핑 또는 순서대로 쓸 색상 리스트 (없으면 기본 팔레트)
+        other_label: 합산 항목 레이블
+        dropna: True면 결측값 제외, False면 "(빈 값)" 항목으로 집계
+
+    Returns:
+        StatItem 리스트
+
+    Example:
+        >>> stats_items(df, column="status", top_n=5, colors={"매칭": "#4a9d6b"})
+    """
+    import pandas as pd
+
+    if isinstance(data, pd.DataFrame):
+        if column is None:
+            if data.shape[1] != 1:
+                raise ValueError("컬럼이 여러 개인 DataFrame은 column을 지정해야 합니다")
+            column = data.columns[0]
+        data = data[column]
+    elif not isinstance(data, pd.Series):
+        data = pd.Series(data, copy=False)
+
+    counts = data.value_counts(dropna=dropna)
+    if isinstance(data.dtype, pd.CategoricalDtype):
+        counts = counts[counts > 0]  # 사용되지 않은 범주 제외
+
+    other = 0
+    if top_n is not None and len(counts) > top_n:
+        other = int(counts.iloc[top_n:].sum())
+        counts = counts.iloc[:top_n]
+
+    labels = [_STATS_MISSING_LABEL if pd.isna(label) else str(label) for label in counts.index]
+    return _count_items(labels, counts.to_numpy().tolist(), other, colors, other_label)
+
+
+def _count_items(
+    labels: List[str],
+    values: List[int],
+    other: int,
+    colors: Union[Mapping[str, str], Sequence[str], None],
+    other_label: str,
+) -> List[StatItem]:
+    """집계된 (레이블, 건수)에 색상을 붙여 StatItem 리스트로 변환"""
+    if isinstance(colors, Mapping):
+        palette = iter(_STATS_PALETTE * (len(labels) // len(_STATS_PALETTE) + 1))
+        picked = [colors.get(label) or next(palette) for label in labels]
+    else:
+        cycle = list(colors or _STATS_PALETTE)
+        picked = [cycle[i % len(cycle)] for i in range(len(labels))]
+
+    items = [StatItem(label, value, color) for label, value, color in zip(labels, values, picked)]
+    if other:
+        items.append(StatItem(other_label, other, _STATS_OTHER_COLOR))
+    return items
+
+
+_STATS_CARD = Template('''
+    <div class="stats-container">
+        <div class="stats-title">{{ title }} (총 {{ total|num }}건)</div>
+        <div class="stats-bar">{{ bar|raw }}</div>
+        <div class="stats-legend">{{ legend|raw }}</div>
+    </div>
+''')
+_STATS_SEGMENT = Template('<div class="stats-segment" style="width:{{ pct|num }}%;background:{{ color }};"></div>')
+_STATS_LEGEND_ITEM = Template('''
+    <div class="stats-legend-item">
+        <div class="stats-legend-dot" style="background:{{ color }};"></div>
+        <span class="stats-legend-text">{{ label }} {{ value|num }}</span>
+    </div>
+''')
+
+
+@cached_fragment
+def stats_card_html(
     items: List[StatItem],
     title: str = "통계",
+) -> str:
+    """stats_card() HTML 반환 (스타일은 stats_card()가 주입)"""
+    total = sum(item.value for item in items)
+
+    bar_html = "".join([
+        _STATS_SEGMENT.render(pct=(item.value / total * 100) if total > 0 else 0, color=item.color)
+        for item in items
+    ])
+    legend_html = "".join([
+        _STATS_LEGEND_ITEM.render(color=item.color, label=item.label, value=item.value)
+        for item in items
+    ])
+
+    return _STATS_CARD.render(title=title, total=total, bar=bar_html, legend=legend_html)
+
+
+def stats_card(
+    items: StatsData,
+    title: str = "통계",
+    column: Optional[str] = None,
+    top_n: Optional[int] = None,
+    colors: Union[Mapping[str, str], Sequence[str], None] = None,
+    other_label: str = "기타",
 ) -> None:
     """
     통계 카드 (Native Wrapper)
 
     Args:
-        items: 통계 항목 리스트
+        items: 통계 항목 리스트, 또는 범주 레이블 Series / 배열 / DataFrame
+            (레이블 데이터는 stats_items()로 집계)
         title: 카드 제목
+        column: DataFrame 레이블 컬럼
+        top_n: 표시할 최대 범주 수 (나머지는 other_label로 합산)
+        colors: 레이블 → 색상 매핑 또는 색상 리스트
+        other_label: 합산 항목 레이블
 
     Example:
         >>> items = [
@@ -283,7 +479,12 @@ def stats_card(
         ...     StatItem("미입금", 5, "#dc3545"),
         ... ]
         >>> stats_card(items, title="매칭 결과")
+
+        >>> stats_card(result_df, title="매칭 결과", column="status", top_n=4)
     """
+    if not _is_stat_items(items):
+        items = stats_items(items, column, top_n, colors, other_label)
+
     inject_css("""
         .stats-container {
             background: linear-gradient(135deg, var(--bg-dark), #3d322b);
@@ -327,35 +528,97 @@ def stats_card(
         }
     """, key="stats_card_styles")
 
-    total = sum(item.value for item in items)
+    emit_html(stats_card_html(items, title))
 
-    bar_html = ""
-    for item in items:
-        pct = (item.value / total * 100) if total > 0 else 0
-        bar_html += f'<div class="stats-segment" style="width:{pct}%;background:{item.color};"></div>'
-
-    legend_html = ""
-    for item in items:
-        legend_html += f'''
-        <div class="stats-legend-item">
-            <div class="stats-legend-dot" style="background:{item.color};"></div>
-            <span class="stats-legend-text">{item.label} {item.value}</span>
-        </div>
-        '''
 
-    st.markdown(f'''
-    <div class="stats-container">
-        <div class="stats-title">{title} (총 {total}건)</div>
-        <div class="stats-bar">{bar_html}</div>
-        <div class="stats-legend">{legend_html}</div>
-    </div>
-    ''', unsafe_allow_html=True)
+def live_stats_card(
+    feed: StatsFeed,
+    title: str = "통계",
+    run_every: Union[float, timedelta, str] = 1.0,
+    key: str = "live_stats",
+    top_n: Optional[int] = None,
+    colors: Union[Mapping[str, str], Sequence[str], None] = None,
+    other_label: str = "기타",
+) -> None:
+    """
+    실시간 통계 카드 (백그라운드 작업 진행 표시)
+
+    st.fragment(run_every)로 이 카드만 주기적으로 다시 실행하므로 메인 스크립트는
+    다시 실행되지 않습니다. feed.version이 그대로인 주기는 집계를 건너뛰고,
+    브라우저는 바뀐 막대 구간 너비와 범례 값만 고칩니다 (iframe 컴포넌트, 카드 DOM 유지).
+    항목 순서는 feed에 처음 기록된 순서로 고정되어 구간 위치가 흔들리지 않습니다.
+    st.fragment가 없는 버전에서는 스크립트가 실행될 때만 갱신됩니다.
+
+    Args:
+        feed: 백그라운드 작업이 건수를 쓰는 StatsFeed (st.cache_resource 등으로 공유)
+        title: 카드 제목
+        run_every: 갱신 주기 (초, timedelta 또는 "2s" 같은 문자열)
+        key: 컴포넌트 키
+        top_n: 표시할 최대 범주 수 (건수가 많은 순으로 선택, 나머지는 other_label로 합산)
+        colors: 레이블 → 색상 매핑 또는 색상 리스트
+        other_label: 합산 항목 레이블
+
+    Example:
+        >>> feed = matching_feed()  # @st.cache_resource
+        >>> live_stats_card(feed, title="매칭 진행", run_every=0.5,
+        ...                 colors={"매칭": "#4a9d6b", "미입금": "#dc3545"})
+    """
+    flush_html()
+    fragment(_live_stats, run_every=run_every)(feed, title, key, top_n, colors, other_label)
+
+
+def _live_stats(
+    feed: StatsFeed,
+    title: str,
+    key: str,
+    top_n: Optional[int],
+    colors: Union[Mapping[str, str], Sequence[str], None],
+    other_label: str,
+) -> None:
+    """live_stats_card() 프래그먼트 본문 (버전이 바뀐 주기에만 집계)"""
+    state_key = f"{key}_live"
+    last = st.session_state.get(state_key)
+    options = (title, top_n, colors, other_label)
+    if last is None or last[0] != (feed.version,) + options:
+        version, counts = feed.snapshot()
+        # feed가 합산한 레이블(overflow_label)도 기타 항목 하나로 합침
+        labels = [label for label, _ in counts if label != other_label]
+        values = [value for label, value in counts if label != other_label]
+        other = sum(value for label, value in counts if label == other_label)
+        if top_n is not None and len(labels) > top_n:
+            # 건수 상위 top_n개를 feed 순서 그대로 표시
+            keep = set(sorted(range(len(values)), key=values.__getitem__, reverse=True)[:top_n])
+            other += sum(v for i, v in enumerate(values) if i not in keep)
+            labels = [label for i, label in enumerate(labels) if i in keep]
+            values = [value for i, value in enumerate(values) if i in keep]
+        items = _count_items(labels, values, other, colors, other_label)
+        last = st.session_state[state_key] = ((version,) + options, {
+            "title": title,
+            "total": sum(values) + other,
+            "items": [[item.label, item.value, item.color] for item in items],
+        })
+    studio_component("stats", key=key, **last[1])
+
+
+def _is_stat_items(items: Any) -> bool:
+    """이미 집계된 StatItem 리스트인지 (빈 리스트 포함)"""
+    return isinstance(items, (list, tuple)) and (not items or isinstance(items[0], StatItem))
 
 
 # ============================================================
 # UploadCard - Native Wrapper
 # ============================================================
 
+_UPLOAD_HEADER = Template('''
+    <div class="upload-card-header">
+        <div class="upload-icon">{{ icon }}</div>
+        <div class="upload-title">{{ title }}</div>
+        {{ help|raw }}
+    </div>
+''')
+_UPLOAD_HELP = Template("<div class='upload-help'>{{ text }}</div>")
+
+
 def upload_card(
     title: str,
     icon: str = "📎",
@@ -386,6 +649,14 @@ def upload_card(
         ...     help_text="엑셀 또는 CSV 파일",
         ... )
     """
+    _upload_card_style()
+
+    flush_html()
+    with st.container(border=True):
+        return _upload_card_body(title, icon, accepted_types, help_text, key)
+
+
+def _upload_card_style() -> None:
     inject_css("""
         .upload-card-header {
             text-align: center;
@@ -406,19 +677,325 @@ def upload_card(
         }
     """, key="upload_card_styles")
 
+
+def _upload_card_body(
+    title: str,
+    icon: str,
+    accepted_types: Optional[List[str]],
+    help_text: Optional[str],
+    key: Optional[str],
+) -> Any:
+    """카드 헤더 + st.file_uploader (카드 컨테이너 안에서 호출)"""
+    help_html = _UPLOAD_HELP.render(text=help_text) if help_text else ""
+    emit_html(_UPLOAD_HEADER.render(icon=icon, title=title, help=help_html))
+    flush_html()
+
+    return st.file_uploader(
+        title,
+        type=accepted_types,
+        key=key,
+        label_visibility="collapsed",
+    )
+
+
+@dataclass
+class UploadResult:
+    """upload_table_card() 결과"""
+    file: Any                      # st.file_uploader 결과 (없으면 None)
+    table: Optional["pa.Table"] = None  # 파싱이 끝나면 Arrow 테이블
+    progress: float = 0.0
+    error: Optional[str] = None
+    header: Optional[List[str]] = None  # 헤더 행 컬럼 이름 (파싱 전에도 채워짐)
+    dialect: Optional["CsvDialect"] = None  # CSV 인코딩/구분자 (감지 결과)
+
+    @property
+    def ready(self) -> bool:
+        """파싱이 끝나 table을 쓸 수 있는지"""
+        return self.table is not None
+
+    def to_pandas(self) -> Optional["pd.DataFrame"]:
+        """table을 pandas DataFrame으로 변환 (없으면 None)"""
+        return None if self.table is None else self.table.to_pandas()
+
+
+def upload_table_card(
+    title: str,
+    icon: str = "📎",
+    accepted_types: Optional[List[str]] = None,
+    help_text: Optional[str] = None,
+    key: str = "upload_table",
+    sheet: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    header_only: bool = False,
+    poll_every: float = 0.3,
+    cache: Union[Literal["auto"], "TableCache", None] = "auto",
+) -> UploadResult:
+    """
+    파일 업로드 + 표 파싱 카드
+
+    upload_card()와 같은 카드에서 업로드한 CSV/XLSX를 스크립트 스레드 밖(스레드 풀)에서
+    청크 단위로 Arrow 테이블로 읽고(studio_ui.data.parse_table), 진행률을 카드 안에 표시합니다.
+    진행률 표시는 st.fragment(run_every=poll_every)로 카드 안만 갱신하며,
+    파싱이 끝나면 앱을 한 번 다시 실행해 결과를 돌려줍니다.
+    같은 파일이 그대로 있는 리런은 다시 파싱하지 않습니다 (세션에 결과 유지).
+    파싱 결과는 디스크 캐시(TableCache)에 저장되므로 다른 세션/워커 프로세스가 같은 파일을
+    올리면 파싱 없이 (SHA-256 + 메모리 매핑)만으로 바로 결과를 돌려줍니다.
+    st.fragment가 없는 버전에서는 스크립트 스레드가 진행률을 갱신하며 완료를 기다립니다.
+
+    헤더 행은 항상 먼저 읽어 UploadResult.header로 돌려줍니다 (studio_ui.data.read_header).
+    CSV는 인코딩(UTF-8/CP949)과 구분자를 앞부분 표본으로 감지해 UploadResult.dialect로 알려줍니다.
+    header_only=True면 파싱하지 않으므로, column_matcher()로 컬럼을 고른 뒤
+    read_upload_columns()로 고른 컬럼만 읽을 수 있습니다.
+
+    Args:
+        title: 카드 제목
+        icon: 아이콘 이모지
+        accepted_types: 허용 파일 확장자 리스트 (기본: csv, tsv, txt, xlsx)
+        help_text: 도움말 텍스트
+        key: 컴포넌트 키
+        sheet: XLSX 시트 이름 (없으면 활성 시트)
+        columns: 읽을 컬럼 (없으면 전부)
+        header_only: 헤더 행만 읽고 파싱하지 않음
+        poll_every: 진행률 갱신 주기 (초)
+        cache: 파싱 결과 디스크 캐시 ("auto": default_table_cache(), None: 캐시 안 함)
+
+    Returns:
+        UploadResult (파싱 중에는 table이 None, 끝나면 ready=True)
+
+    Example:
+        >>> orders = upload_table_card("주문서 업로드", icon="📋", key="orders")
+        >>> if orders.ready:
+        ...     df = orders.to_pandas()
+    """
+    _upload_card_style()
+
+    flush_html()
     with st.container(border=True):
-        help_html = f"<div class='upload-help'>{help_text}</div>" if help_text else ""
-        st.markdown(f'''
-        <div class="upload-card-header">
-            <div class="upload-icon">{icon}</div>
-            <div class="upload-title">{title}</div>
-            {help_html}
-        </div>
-        ''', unsafe_allow_html=True)
+        file = _upload_card_body(
+            title, icon, accepted_types or ["csv", "tsv", "txt", "xlsx"], help_text, key
+        )
+        if file is None:
+            st.session_state.pop(f"{key}_header", None)
+            st.session_state.pop(f"{key}_parse", None)
+            return UploadResult(None)
+
+        upload = _upload_header(file, key, sheet)
+        if header_only or upload.error is not None:
+            if upload.error is not None:
+                st.error(f"{file.name}: {upload.error}")
+            return upload
+        return _parse_upload(upload, key, sheet, columns, poll_every, cache)
+
+
+def read_upload_columns(
+    upload: UploadResult,
+    columns: Sequence[str],
+    key: str = "upload_table",
+    sheet: Optional[str] = None,
+    poll_every: float = 0.3,
+    cache: Union[Literal["auto"], "TableCache", None] = "auto",
+) -> UploadResult:
+    """
+    업로드 파일에서 고른 컬럼만 파싱 (upload_table_card(header_only=True) 다음 단계)
 
-        return st.file_uploader(
-            title,
-            type=accepted_types,
-            key=key,
-            label_visibility="collapsed",
+    XLSX는 행마다 고른 셀만 찾아 변환하고 CSV는 고른 컬럼만 변환하므로,
+    넓은 시트일수록 건너뛴 컬럼 비율만큼 시간과 메모리가 줄어듭니다.
+    진행률/캐시 동작은 upload_table_card()와 같고, 진행률은 호출한 자리에 표시됩니다.
+
+    Args:
+        upload: upload_table_card() 결과
+        columns: 읽을 컬럼 (upload.header 중에서)
+        key: upload_table_card()에 준 키
+        sheet: XLSX 시트 이름 (없으면 활성 시트)
+        poll_every: 진행률 갱신 주기 (초)
+        cache: 파싱 결과 디스크 캐시 ("auto": default_table_cache(), None: 캐시 안 함)
+
+    Returns:
+        UploadResult (파싱 중에는 table이 None, 끝나면 ready=True)
+
+    Example:
+        >>> orders = upload_table_card("주문서 업로드", key="orders", header_only=True)
+        >>> deposits = upload_table_card("입금내역 업로드", key="deposits", header_only=True)
+        >>> if orders.header and deposits.header:
+        ...     left, right = column_matcher("주문서", orders.header, "입금내역", deposits.header)
+        ...     orders = read_upload_columns(orders, [left, "금액"], key="orders")
+    """
+    if upload.file is None or upload.error is not None:
+        return upload
+    return _parse_upload(upload, key, sheet, list(dict.fromkeys(columns)), poll_every, cache)
+
+
+def _upload_header(file: Any, key: str, sheet: Optional[str]) -> UploadResult:
+    """헤더 행만 읽어 UploadResult.header로 (파일이 그대로면 세션에 둔 값을 재사용)"""
+    header_key = f"{key}_header"
+    file_id = (getattr(file, "file_id", None) or (file.name, file.size), sheet)
+    entry = st.session_state.get(header_key)
+    if entry is None or entry[0] != file_id:
+        from studio_ui.data.encoding import sniff_csv
+        from studio_ui.data.parse import file_kind, read_header
+
+        data = file.getvalue()
+        try:
+            dialect = sniff_csv(data, file.name) if file_kind(file.name) == "csv" else None
+            header = read_header(
+                data, file.name, sheet=sheet,
+                encoding=dialect and dialect.encoding, delimiter=dialect and dialect.delimiter,
+            )
+            entry = (file_id, header, dialect, None)
+        except Exception as exc:  # 형식 오류 등은 카드에 표시
+            entry = (file_id, None, None, str(exc) or type(exc).__name__)
+        st.session_state[header_key] = entry
+    return UploadResult(file, header=entry[1], dialect=entry[2], error=entry[3])
+
+
+def _parse_upload(
+    upload: UploadResult,
+    key: str,
+    sheet: Optional[str],
+    columns: Optional[Sequence[str]],
+    poll_every: float,
+    cache: Union[Literal["auto"], "TableCache", None],
+) -> UploadResult:
+    """세션의 ParseJob을 시작/재사용하고 진행률 또는 결과를 돌려줌"""
+    file = upload.file
+    job_key = f"{key}_parse"
+    file_id = getattr(file, "file_id", None) or (file.name, file.size)
+    options = {"sheet": sheet, "columns": list(columns) if columns else None}
+    entry = st.session_state.get(job_key)
+    if entry is None or entry[0] != (file_id, options):
+        from studio_ui.data.cache import default_table_cache
+        from studio_ui.data.parse import ParseJob
+
+        table_cache = default_table_cache() if cache == "auto" else cache
+        job = ParseJob(file.getvalue(), file.name, cache=table_cache, **options)
+        entry = st.session_state[job_key] = ((file_id, options), job)
+    job = entry[1]
+
+    if not job.done:
+        if HAS_FRAGMENT:
+            flush_html()
+            fragment(_parse_progress, run_every=poll_every)(job_key)
+            return UploadResult(
+                file, progress=job.progress, header=upload.header, dialect=upload.dialect
+            )
+        _wait_parse(job, poll_every)
+
+    if job.error is not None:
+        st.error(f"{file.name}: {job.error}")
+        return UploadResult(
+            file, progress=1.0, error=str(job.error), header=upload.header, dialect=upload.dialect
+        )
+    return UploadResult(
+        file, table=job.result(), progress=1.0, header=upload.header, dialect=upload.dialect
+    )
+
+
+def _parse_progress(job_key: str) -> None:
+    """upload_table_card() 진행률 프래그먼트 (끝나면 앱 전체를 한 번 다시 실행)"""
+    entry = st.session_state.get(job_key)
+    if entry is None:
+        return
+    job = entry[1]
+    if job.done:
+        st.rerun()
+    st.progress(job.progress, text=f"{job.name} 읽는 중 {job.progress:.0%}")
+
+
+def _wait_parse(job: Any, poll_every: float) -> None:
+    """프래그먼트 미지원 버전: 스크립트 스레드에서 진행률을 갱신하며 대기"""
+    bar = st.progress(0.0, text=f"{job.name} 읽는 중")
+    while not job.done:
+        time.sleep(poll_every)
+        bar.progress(job.progress, text=f"{job.name} 읽는 중 {job.progress:.0%}")
+    bar.empty()
+
+
+# ============================================================
+# DownloadCard - Native Wrapper
+# ============================================================
+
+_EXPORT_LABELS = {"xlsx": "Excel (.xlsx)", "csv": "CSV (.csv)"}
+
+
+def download_card(
+    data: Union["pa.Table", "pd.DataFrame"],
+    title: str = "결과 다운로드",
+    icon: str = "📥",
+    file_name: str = "result",
+    formats: Sequence[str] = ("xlsx", "csv"),
+    help_text: Optional[str] = None,
+    key: str = "download",
+    sheet_name: str = "결과",
+) -> bool:
+    """
+    결과 다운로드 카드 (Native Wrapper)
+
+    파일은 사용자가 요청할 때만 만듭니다 (studio_ui.data.export - 청크 단위 스트리밍 쓰기).
+    만든 바이트는 입력 테이블 다이제스트를 키로 프로세스 공용 캐시(EXPORT_CACHE)에 저장하므로
+    리런하거나 다른 세션이 같은 결과를 받을 때는 다시 만들지 않습니다.
+    st.download_button이 지연 생성(data=callable)을 지원하면 다운로드 버튼을 누를 때 만들고,
+    지원하지 않는 버전에서는 "파일 준비" 버튼을 누른 뒤 다운로드 버튼을 보여줍니다.
+
+    Args:
+        data: 결과 테이블 (pyarrow.Table 또는 pandas DataFrame, 인덱스는 제외)
+        title: 카드 제목
+        icon: 아이콘 이모지
+        file_name: 확장자를 뺀 파일 이름
+        formats: 내보낼 형식 ("xlsx", "csv" - 둘 이상이면 형식 선택 표시)
+        help_text: 도움말 텍스트
+        key: 컴포넌트 키
+        sheet_name: XLSX 시트 이름
+
+    Returns:
+        이번 실행에서 다운로드 버튼을 눌렀는지
+
+    Example:
+        >>> download_card(result_df, title="매칭 결과 다운로드", file_name="매칭결과")
+    """
+    from studio_ui.data.export import MIME_TYPES, cached_export
+
+    _upload_card_style()  # 업로드 카드와 같은 헤더 스타일
+
+    flush_html()
+    with st.container(border=True):
+        help_html = _UPLOAD_HELP.render(text=help_text) if help_text else ""
+        emit_html(_UPLOAD_HEADER.render(icon=icon, title=title, help=help_html))
+        flush_html()
+
+        kind = formats[0]
+        if len(formats) > 1:
+            kind = st.radio(
+                title,
+                list(formats),
+                format_func=lambda k: _EXPORT_LABELS.get(k, k),
+                horizontal=True,
+                key=f"{key}_format",
+                label_visibility="collapsed",
+            )
+        options = {"sheet_name": sheet_name} if kind == "xlsx" else {}
+
+        def build() -> bytes:
+            return cached_export(data, kind, **options)
+
+        if not HAS_DEFERRED_DOWNLOAD:
+            from studio_ui.data.export import table_digest
+
+            prepared_key = f"{key}_prepared"
+            prepared = (kind, table_digest(data))  # 결과가 바뀌면 다시 요청할 때까지 만들지 않음
+            if st.session_state.get(prepared_key) != prepared:
+                if not st.button("파일 준비", key=f"{key}_prepare", use_container_width=True):
+                    return False
+                st.session_state[prepared_key] = prepared
+            with st.spinner("파일을 만드는 중..."):
+                payload: Any = build()
+        else:
+            payload = build  # 버튼을 누를 때 (캐시에 있으면 바로) 만들어 전송
+
+        return st.download_button(
+            "다운로드",
+            data=payload,
+            file_name=f"{file_name}.{kind}",
+            mime=MIME_TYPES[kind],
+            key=f"{key}_button",
+            use_container_width=True,
         )
@@ -3,8 +3,15 @@ studio_ui/components/forms.py
 폼 컴포넌트 - Native Wrapper 방식
 """
 import streamlit as st
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from studio_ui.core.compat import fragment
+from studio_ui.core.render import emit_html, flush_html
+from studio_ui.core.state import on_interaction, track_run
 from studio_ui.core.styles import inject_css
+from studio_ui.core.template import Template
+
+# 레이블은 업로드 파일의 컬럼/파일 이름일 수 있으므로 이스케이프
+_MATCHER_LABEL = Template('<div class="matcher-label">{{ icon|raw }} {{ label }}</div>')
 
 
 def column_matcher(
@@ -60,10 +67,12 @@ def column_matcher(
         }
     """, key="column_matcher_styles")
 
+    flush_html()
     col_left, col_center, col_right = st.columns([5, 1, 5])
 
     with col_left:
-        st.markdown(f'<div class="matcher-label">🟦 {left_label}</div>', unsafe_allow_html=True)
+        emit_html(_MATCHER_LABEL.render(icon="🟦", label=left_label))
+        flush_html()
         left_val = st.selectbox(
             left_label,
             left_options,
@@ -73,10 +82,12 @@ def column_matcher(
         )
 
     with col_center:
-        st.markdown('<div class="matcher-link">🔗</div>', unsafe_allow_html=True)
+        emit_html('<div class="matcher-link">🔗</div>')
+        flush_html()
 
     with col_right:
-        st.markdown(f'<div class="matcher-label">🟧 {right_label}</div>', unsafe_allow_html=True)
+        emit_html(_MATCHER_LABEL.render(icon="🟧", label=right_label))
+        flush_html()
         right_val = st.selectbox(
             right_label,
             right_options,
@@ -88,24 +99,63 @@ def column_matcher(
     return left_val, right_val
 
 
+def _render_tabs(tabs: List[Dict[str, Any]], key: str) -> None:
+    """탭 버튼 행 (선택은 on_click 콜백에서 반영 → 클릭당 실행 1회)"""
+    track_run("tab_selector")
+    state_key = f"{key}_selected"
+    cols = st.columns(len(tabs))
+
+    for i, tab in enumerate(tabs):
+        with cols[i]:
+            is_active = st.session_state[state_key] == i
+            st.button(
+                f"{tab['icon']}\n{tab['label']}",
+                key=f"{key}_tab_{i}",
+                type="primary" if is_active else "secondary",
+                use_container_width=True,
+                on_click=on_interaction,
+                args=("tab_selector", {state_key: i}),
+            )
+
+
+@fragment
+def _tab_selector_fragment(
+    tabs: List[Dict[str, Any]],
+    key: str,
+    body: Callable[[int], None],
+) -> None:
+    """탭 버튼 + 본문 (탭 클릭 시 이 함수만 다시 실행)"""
+    _render_tabs(tabs, key)
+    body(st.session_state[f"{key}_selected"])
+    flush_html()
+
+
 def tab_selector(
     tabs: List[Dict[str, Any]],
     default_index: int = 0,
     key: str = "tab_selector",
+    body: Optional[Callable[[int], None]] = None,
 ) -> int:
     """
     탭 선택기 (SwipeSlider 대체)
 
     st.columns + st.button으로 Native 구현
     모바일에서도 안정적으로 동작
+    선택은 버튼 콜백에서 반영되므로 클릭당 스크립트 실행은 1회입니다.
+
+    body를 넘기면 탭 버튼과 body를 하나의 프래그먼트(st.fragment)로 렌더링합니다.
+    탭을 바꿔도 전체 스크립트(파일 파싱, 매칭 등)는 다시 실행되지 않고
+    선택기와 body만 다시 그려집니다. st.fragment가 없는 버전에서는
+    전체 스크립트가 한 번 다시 실행됩니다.
 
     Args:
         tabs: 탭 리스트 [{"id": "...", "icon": "👤", "label": "이름"}]
         default_index: 기본 선택 인덱스
         key: 세션 상태 키
+        body: 선택된 탭 인덱스를 받아 본문을 그리는 함수 (선택)
 
     Returns:
-        선택된 탭 인덱스
+        선택된 탭 인덱스 (body를 넘긴 경우 전체 실행 시점의 값)
 
     Example:
         >>> tabs = [
@@ -116,6 +166,10 @@ def tab_selector(
         >>> selected_idx = tab_selector(tabs)
         >>> if tabs[selected_idx]["id"] == "name":
         ...     st.write("이름 매칭 폼 표시")
+
+        >>> def render_tab(idx):
+        ...     st.write(f"{tabs[idx]['label']} 폼 표시")
+        >>> tab_selector(tabs, body=render_tab)  # 탭 전환 시 이 부분만 재실행
     """
     inject_css("""
         .tab-container {
@@ -127,21 +181,11 @@ def tab_selector(
     if state_key not in st.session_state:
         st.session_state[state_key] = default_index
 
-    cols = st.columns(len(tabs))
-
-    for i, tab in enumerate(tabs):
-        with cols[i]:
-            is_active = st.session_state[state_key] == i
-            btn_type = "primary" if is_active else "secondary"
-
-            if st.button(
-                f"{tab['icon']}\n{tab['label']}",
-                key=f"{key}_tab_{i}",
-                type=btn_type,
-                use_container_width=True,
-            ):
-                st.session_state[state_key] = i
-                st.rerun()
+    flush_html()
+    if body is not None:
+        _tab_selector_fragment(tabs, key, body)
+    else:
+        _render_tabs(tabs, key)
 
     return st.session_state[state_key]
 
@@ -170,6 +214,7 @@ def search_input(
         }
     """, key="search_input_styles")
 
+    flush_html()
     return st.text_input(
         "검색",
         placeholder=placeholder,
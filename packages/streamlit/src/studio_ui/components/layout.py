@@ -2,7 +2,39 @@
 studio_ui/components/layout.py
 레이아웃 컴포넌트 - 컨테이너, 섹션 헤더
 """
-import streamlit as st
+from studio_ui.core.render import emit_html
+from studio_ui.core.template import Template, escape
+
+
+_CONTAINER = Template("""
+    <div style="background: #fffdfb; border: 1px solid #e8e2d9; border-radius: 1.5rem; padding: {{ padding }}; margin-bottom: {{ margin_bottom }};">
+        {{ content|raw }}
+    </div>
+""")
+_SECTION_HEADER = Template("""
+    <div style="text-align: center; margin-bottom: 1.5rem;">
+        <div style="font-size: 0.75rem; font-weight: 600; color: #8b7355; text-transform: uppercase; letter-spacing: 0.1em; margin-bottom: 0.5rem;">{{ label }}</div>
+        <div style="font-size: 1.25rem; font-weight: 700; color: #2d251f; margin-bottom: 0.25rem;">{{ title }}</div>
+        {{ subtitle|raw }}
+    </div>
+""")
+_SECTION_HEADER_SUBTITLE = Template('<div style="font-size: 0.875rem; color: #8b7355;">{{ text }}</div>')
+_HERO = Template("""
+    <div style="text-align: center; padding: 2rem 1rem;">
+        <div style="font-size: 2.5rem; font-weight: 700; color: #2d251f; margin-bottom: 0.75rem;">
+            {{ title }}
+        </div>
+        <div style="font-size: 1.125rem; color: #5c4a3d; line-height: 1.6; max-width: 500px; margin: 0 auto 1.5rem;">
+            {{ subtitle|raw }}
+        </div>
+    </div>
+""")
+_HERO_HIGHLIGHT = Template('<strong style="color: #c9a87c;">{{ text }}</strong>')
+
+
+def container_html(content: str, padding: str = "2rem", margin_bottom: str = "1.5rem") -> str:
+    """container() HTML 반환 (content는 HTML 그대로 삽입)"""
+    return _CONTAINER.render(padding=padding, margin_bottom=margin_bottom, content=content)
 
 
 def container(content: str, padding: str = "2rem", margin_bottom: str = "1.5rem"):
@@ -14,11 +46,7 @@ def container(content: str, padding: str = "2rem", margin_bottom: str = "1.5rem"
         padding: 패딩
         margin_bottom: 하단 마진
     """
-    st.markdown(f"""
-    <div style="background: #fffdfb; border: 1px solid #e8e2d9; border-radius: 1.5rem; padding: {padding}; margin-bottom: {margin_bottom};">
-        {content}
-    </div>
-    """, unsafe_allow_html=True)
+    emit_html(container_html(content, padding, margin_bottom))
 
 
 def section_header(label: str, title: str, subtitle: str = "") -> str:
@@ -33,14 +61,17 @@ def section_header(label: str, title: str, subtitle: str = "") -> str:
     Returns:
         HTML 문자열
     """
-    subtitle_html = f'<div style="font-size: 0.875rem; color: #8b7355;">{subtitle}</div>' if subtitle else ""
-    return f"""
-    <div style="text-align: center; margin-bottom: 1.5rem;">
-        <div style="font-size: 0.75rem; font-weight: 600; color: #8b7355; text-transform: uppercase; letter-spacing: 0.1em; margin-bottom: 0.5rem;">{label}</div>
-        <div style="font-size: 1.25rem; font-weight: 700; color: #2d251f; margin-bottom: 0.25rem;">{title}</div>
-        {subtitle_html}
-    </div>
-    """
+    subtitle_html = _SECTION_HEADER_SUBTITLE.render(text=subtitle) if subtitle else ""
+    return _SECTION_HEADER.render(label=label, title=title, subtitle=subtitle_html)
+
+
+def hero_html(title: str, subtitle: str, highlight: str = "") -> str:
+    """hero() HTML 반환"""
+    # 부제목은 이스케이프한 뒤 {highlight} 자리에 강조 HTML 삽입
+    subtitle_html = escape(subtitle)
+    if highlight:
+        subtitle_html = subtitle_html.replace("{highlight}", _HERO_HIGHLIGHT.render(text=highlight))
+    return _HERO.render(title=title, subtitle=subtitle_html)
 
 
 def hero(title: str, subtitle: str, highlight: str = ""):
@@ -52,16 +83,4 @@ def hero(title: str, subtitle: str, highlight: str = ""):
         subtitle: 서브타이틀
         highlight: 강조 텍스트 (선택)
     """
-    highlight_html = f'<strong style="color: #c9a87c;">{highlight}</strong>' if highlight else ""
-    subtitle_with_highlight = subtitle.replace("{highlight}", highlight_html) if highlight else subtitle
-
-    st.markdown(f"""
-    <div style="text-align: center; padding: 2rem 1rem;">
-        <div style="font-size: 2.5rem; font-weight: 700; color: #2d251f; margin-bottom: 0.75rem;">
-            {title}
-        </div>
-        <div style="font-size: 1.125rem; color: #5c4a3d; line-height: 1.6; max-width: 500px; margin: 0 auto 1.5rem;">
-            {subtitle_with_highlight}
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    emit_html(hero_html(title, subtitle, highlight))
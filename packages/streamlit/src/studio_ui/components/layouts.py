@@ -2,9 +2,36 @@
 studio_ui/components/layouts.py
 레이아웃 컴포넌트
 """
+import json
 import streamlit as st
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, Hashable, List, Literal, Optional
+from studio_ui.core.cache import FRAGMENT_CACHE, fragment_key
+from studio_ui.core.compat import KEYED_COMPONENT_IDENTITY, fragment
+from studio_ui.core.frontend import studio_component
+from studio_ui.core.render import emit_html, flush_html
 from studio_ui.core.styles import inject_css
+from studio_ui.core.template import Template
+
+
+_SECTION_BOX_OPEN = Template('''
+    <div class="section-box">
+        <div class="section-header">
+            <div class="section-label">{{ label }}</div>
+            <div class="section-title">{{ title }}</div>
+            {{ subtitle|raw }}
+        </div>
+''')
+_SECTION_SUBTITLE = Template('<div class="section-subtitle">{{ text }}</div>')
+
+
+def section_container_html(
+    label: str,
+    title: str,
+    subtitle: Optional[str] = None,
+) -> str:
+    """section_container() 시작 HTML 반환 (닫는 태그는 section_end())"""
+    subtitle_html = _SECTION_SUBTITLE.render(text=subtitle) if subtitle else ""
+    return _SECTION_BOX_OPEN.render(label=label, title=title, subtitle=subtitle_html)
 
 
 def section_container(
@@ -57,35 +84,62 @@ def section_container(
         }
     """, key="section_container_styles")
 
-    subtitle_html = f'<div class="section-subtitle">{subtitle}</div>' if subtitle else ""
-
-    st.markdown(f'''
-    <div class="section-box">
-        <div class="section-header">
-            <div class="section-label">{label}</div>
-            <div class="section-title">{title}</div>
-            {subtitle_html}
-        </div>
-    ''', unsafe_allow_html=True)
+    emit_html(section_container_html(label, title, subtitle))
 
 
 def section_end() -> None:
     """섹션 컨테이너 종료"""
-    st.markdown('</div>', unsafe_allow_html=True)
+    emit_html('</div>')
+
+
+_GRID_CARD = Template('''
+    <div class="grid-card">
+        <div class="grid-icon">{{ icon }}</div>
+        <div class="grid-title">{{ title }}</div>
+        <div class="grid-desc">{{ desc }}</div>
+    </div>
+''')
+
+
+def grid_card_html(item: Dict[str, Any]) -> str:
+    """card_grid() 항목 하나의 HTML 반환"""
+    return _GRID_CARD.render(
+        icon=item.get("icon", ""),
+        title=item.get("title", ""),
+        desc=item.get("desc", ""),
+    )
 
 
 def card_grid(
     items: List[Dict[str, Any]],
     columns: int = 3,
+    mode: Literal["columns", "virtual"] = "columns",
+    key: str = "card_grid",
+    item_key: Optional[Callable[[Dict[str, Any]], Hashable]] = None,
+    height: int = 600,
+    row_height: int = 180,
+    page_size: Optional[int] = None,
 ) -> None:
     """
     카드 그리드 레이아웃
 
-    st.columns를 활용한 Native 그리드
+    columns: st.columns를 활용한 Native 그리드 (항목마다 요소 1개)
+    virtual: 가상 스크롤 그리드 요소 1개
+        - 보이는 행만 DOM에 그리고, 페이지(page_size개)는 스크롤에 따라 서버에서 받아옴
+        - 페이지 요청은 그리드만 다시 실행 (st.fragment, 없는 버전은 전체 실행)
+        - 페이지 다이제스트가 같으면 브라우저 캐시의 페이지를 다시 쓰고 전송하지 않음
 
     Args:
         items: 카드 데이터 리스트 [{"icon": "📊", "title": "제목", "desc": "설명"}]
         columns: 컬럼 수
+        mode: "columns" (기본) | "virtual" (수백 개 이상)
+        key: virtual 모드 컴포넌트 키
+        item_key: virtual 모드 항목 키 함수 (예: lambda item: item["id"])
+            지정하면 키만으로 페이지 변경을 판단 (내용이 바뀌면 키도 바뀌어야 함),
+            없으면 항목 내용으로 판단
+        height: virtual 모드 그리드 높이 (px, 내부 스크롤)
+        row_height: virtual 모드 행 높이 (px)
+        page_size: virtual 모드 페이지당 항목 수 (기본: columns * 8)
 
     Example:
         >>> items = [
@@ -94,7 +148,16 @@ def card_grid(
         ...     {"icon": "⚡", "title": "기능3", "desc": "설명3"},
         ... ]
         >>> card_grid(items, columns=3)
+
+        >>> card_grid(catalog, columns=4, mode="virtual", item_key=lambda item: item["sku"])
     """
+    if mode == "virtual":
+        flush_html()
+        _virtual_grid(
+            items, columns, key, item_key, height, row_height, page_size or columns * 8
+        )
+        return
+
     inject_css("""
         .grid-card {
             background: var(--bg-card);
@@ -126,17 +189,145 @@ def card_grid(
         }
     """, key="card_grid_styles")
 
+    flush_html()
     cols = st.columns(columns)
 
     for i, item in enumerate(items):
         with cols[i % columns]:
-            st.markdown(f'''
-            <div class="grid-card">
-                <div class="grid-icon">{item.get("icon", "")}</div>
-                <div class="grid-title">{item.get("title", "")}</div>
-                <div class="grid-desc">{item.get("desc", "")}</div>
-            </div>
-            ''', unsafe_allow_html=True)
+            emit_html(grid_card_html(item))
+            flush_html()
+
+
+def _material_key(material: Any) -> bytes:
+    """항목 키 목록 또는 페이지 내용의 다이제스트 (16바이트)"""
+    try:
+        return fragment_key(material)
+    except TypeError:
+        return fragment_key(json.dumps(material, sort_keys=True, default=str))
+
+
+def _page_digest(
+    page: List[Dict[str, Any]],
+    item_key: Optional[Callable[[Dict[str, Any]], Hashable]],
+) -> str:
+    """페이지 다이제스트 (항목 키 또는 내용 기준, 브라우저 캐시 비교용)"""
+    material = [item_key(item) for item in page] if item_key is not None else page
+    return _material_key(material).hex()[:12]
+
+
+def _page_payload(page: List[Dict[str, Any]]) -> str:
+    """
+    페이지 전송 문자열 (프로세스 공용 조각 캐시 경유)
+
+    item_key는 세션의 브라우저 캐시 비교에만 쓰고, 공용 캐시 키는 항상 페이지 내용으로 만듭니다.
+    (키가 같아도 세션마다 내용이 다를 수 있으므로)
+    """
+    return FRAGMENT_CACHE.get_or_create(
+        ("card_grid_page", _material_key(page)), lambda: _page_json(page)
+    )
+
+
+def _page_json(page: List[Dict[str, Any]]) -> str:
+    """페이지 전송 형식 ([icon, title, desc] 배열, 프론트엔드가 textContent로 그림)"""
+    rows = [[item.get("icon", ""), item.get("title", ""), item.get("desc", "")] for item in page]
+    return json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+
+
+def _requested_pages(
+    key: str,
+    pages: List[List[Dict[str, Any]]],
+    digests: List[str],
+    columns: int,
+    height: int,
+    row_height: int,
+    page_size: int,
+) -> Dict[str, str]:
+    """이번 실행에서 보낼 페이지 (요청받은 페이지 + 보이는 범위에서 내용이 바뀐 페이지)"""
+    served_key = f"{key}_served"
+    served = st.session_state.get(served_key)
+    if served is None:
+        served = st.session_state[served_key] = {"seq": None, "digests": {}}
+
+    request = st.session_state.get(key) or {}
+    if request.get("seq") is not None and request.get("seq") != served["seq"]:
+        served["seq"] = request["seq"]
+        wanted = set(request.get("want") or ())
+    else:
+        wanted = set()
+    # 첫 렌더링은 요청 왕복 없이 첫 화면 분량을 보냄
+    first_screen = ((height // row_height + 2) * columns - 1) // page_size
+    first, last = request.get("visible") or (0, first_screen)
+
+    send = {}
+    for index in sorted(wanted | set(range(first, last + 1))):
+        if not 0 <= index < len(pages):
+            continue
+        digest = digests[index]
+        if index not in wanted and served["digests"].get(index) == digest:
+            continue
+        send[str(index)] = _page_payload(pages[index])
+        served["digests"][index] = digest
+    return send
+
+
+@fragment
+def _virtual_grid(
+    items: List[Dict[str, Any]],
+    columns: int,
+    key: str,
+    item_key: Optional[Callable[[Dict[str, Any]], Hashable]],
+    height: int,
+    row_height: int,
+    page_size: int,
+) -> None:
+    """
+    가상 그리드 렌더링 (페이지 요청 시 이 함수만 다시 실행)
+
+    프론트엔드 값: {"seq": 요청 번호, "want": [필요한 페이지], "visible": [첫 페이지, 끝 페이지]}
+    이번 실행에서 보내는 페이지:
+        - 새 요청(seq)의 want 페이지 (브라우저 캐시에 없거나 다이제스트가 다른 페이지)
+        - 보이는 범위에서 이 세션에 보낸 뒤 내용이 바뀐 페이지 (요청 왕복 없이 갱신)
+
+    인자가 바뀌면 요소 ID도 바뀌는 Streamlit 버전(KEYED_COMPONENT_IDENTITY가 False)에서는
+    pages가 실행마다 달라지면 iframe이 다시 만들어지므로 모든 페이지를 한 번에 보냅니다.
+    (항목이 바뀔 때만 인자가 달라짐, DOM은 그대로 보이는 행만 그림)
+    """
+    pages = [items[start:start + page_size] for start in range(0, len(items), page_size)]
+    digests = [_page_digest(page, item_key) for page in pages]
+
+    if KEYED_COMPONENT_IDENTITY:
+        send = _requested_pages(key, pages, digests, columns, height, row_height, page_size)
+    else:
+        send = {str(index): _page_payload(page) for index, page in enumerate(pages)}
+
+    studio_component(
+        "grid",
+        key=key,
+        total=len(items),
+        columns=columns,
+        height=height,
+        row_height=row_height,
+        page_size=page_size,
+        digests=digests,
+        pages=send,
+    )
+
+
+_DARK_CONTAINER = Template("""
+    <div style="
+        background: linear-gradient(135deg, var(--bg-dark), #3d322b);
+        border-radius: var(--radius-lg);
+        padding: {{ padding }};
+        color: white;
+    ">
+        {{ content|raw }}
+    </div>
+""")
+
+
+def dark_container_html(content: str, padding: str = "1.5rem") -> str:
+    """dark_container() HTML 반환 (content는 HTML 그대로 삽입)"""
+    return _DARK_CONTAINER.render(padding=padding, content=content)
 
 
 def dark_container(content: str, padding: str = "1.5rem") -> None:
@@ -150,16 +341,15 @@ def dark_container(content: str, padding: str = "1.5rem") -> None:
     Example:
         >>> dark_container("<h3>대시보드</h3>")
     """
-    st.markdown(f"""
-    <div style="
-        background: linear-gradient(135deg, var(--bg-dark), #3d322b);
-        border-radius: var(--radius-lg);
-        padding: {padding};
-        color: white;
-    ">
-        {content}
-    </div>
-    """, unsafe_allow_html=True)
+    emit_html(dark_container_html(content, padding))
+
+
+_SPACER = Template("<div style='height: {{ height }};'></div>")
+
+
+def spacer_html(height: str = "1rem") -> str:
+    """spacer() HTML 반환"""
+    return _SPACER.render(height=height)
 
 
 def spacer(height: str = "1rem") -> None:
@@ -172,4 +362,4 @@ def spacer(height: str = "1rem") -> None:
     Example:
         >>> spacer("2rem")
     """
-    st.markdown(f"<div style='height: {height};'></div>", unsafe_allow_html=True)
+    emit_html(spacer_html(height))
@@ -1,9 +1,90 @@
 """
 studio_ui.core - 디자인 토큰 및 테마 시스템
 """
-from .tokens import COLORS, TYPOGRAPHY, SPACING, RADIUS, SHADOW
-from .theme import Theme, DEFAULT_THEME, DARK_THEME
-from .styles import apply_theme, inject_css
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .tokens import COLORS, TYPOGRAPHY, SPACING, RADIUS, SHADOW, TRANSITION
+    from .theme import Theme, DEFAULT_THEME, DARK_THEME
+    from .registry import ThemeRegistry, THEME_REGISTRY, get_theme
+    from .css_audit import SelectorReport, audit_stylesheet
+    from .styles import (
+        CssRunStats,
+        apply_theme,
+        compile_stylesheet,
+        css_run_stats,
+        inject_css,
+        publish_stylesheet,
+    )
+    from .render import batch, emit_html, flush_html
+    from .compat import HAS_FRAGMENT, fragment
+    from .fonts import FontFace, build_fonts, load_fonts
+    from .feed import StatsFeed
+    from .state import (
+        ComponentStats,
+        component_stats,
+        on_interaction,
+        reset_component_stats,
+        track_run,
+    )
+    from .template import Template, escape
+    from .cache import (
+        FRAGMENT_CACHE,
+        ByteLRU,
+        CacheStats,
+        cached_fragment,
+        clear_fragment_cache,
+        fragment_cache_stats,
+        fragment_key,
+    )
+
+# 공개 API → 정의 모듈 (PEP 562 지연 로딩: 실제로 접근한 모듈만 import)
+_LAZY_ATTRS = {
+    "COLORS": "studio_ui.core.tokens",
+    "TYPOGRAPHY": "studio_ui.core.tokens",
+    "SPACING": "studio_ui.core.tokens",
+    "RADIUS": "studio_ui.core.tokens",
+    "SHADOW": "studio_ui.core.tokens",
+    "TRANSITION": "studio_ui.core.tokens",
+    "Theme": "studio_ui.core.theme",
+    "DEFAULT_THEME": "studio_ui.core.theme",
+    "DARK_THEME": "studio_ui.core.theme",
+    "ThemeRegistry": "studio_ui.core.registry",
+    "THEME_REGISTRY": "studio_ui.core.registry",
+    "get_theme": "studio_ui.core.registry",
+    "SelectorReport": "studio_ui.core.css_audit",
+    "audit_stylesheet": "studio_ui.core.css_audit",
+    "CssRunStats": "studio_ui.core.styles",
+    "apply_theme": "studio_ui.core.styles",
+    "compile_stylesheet": "studio_ui.core.styles",
+    "css_run_stats": "studio_ui.core.styles",
+    "inject_css": "studio_ui.core.styles",
+    "publish_stylesheet": "studio_ui.core.styles",
+    "batch": "studio_ui.core.render",
+    "emit_html": "studio_ui.core.render",
+    "flush_html": "studio_ui.core.render",
+    "HAS_FRAGMENT": "studio_ui.core.compat",
+    "fragment": "studio_ui.core.compat",
+    "FontFace": "studio_ui.core.fonts",
+    "build_fonts": "studio_ui.core.fonts",
+    "load_fonts": "studio_ui.core.fonts",
+    "StatsFeed": "studio_ui.core.feed",
+    "ComponentStats": "studio_ui.core.state",
+    "component_stats": "studio_ui.core.state",
+    "on_interaction": "studio_ui.core.state",
+    "reset_component_stats": "studio_ui.core.state",
+    "track_run": "studio_ui.core.state",
+    "Template": "studio_ui.core.template",
+    "escape": "studio_ui.core.template",
+    "FRAGMENT_CACHE": "studio_ui.core.cache",
+    "ByteLRU": "studio_ui.core.cache",
+    "CacheStats": "studio_ui.core.cache",
+    "cached_fragment": "studio_ui.core.cache",
+    "clear_fragment_cache": "studio_ui.core.cache",
+    "fragment_cache_stats": "studio_ui.core.cache",
+    "fragment_key": "studio_ui.core.cache",
+}
 
 __all__ = [
     "COLORS",
@@ -11,9 +92,55 @@ __all__ = [
     "SPACING",
     "RADIUS",
     "SHADOW",
+    "TRANSITION",
     "Theme",
     "DEFAULT_THEME",
     "DARK_THEME",
+    "ThemeRegistry",
+    "THEME_REGISTRY",
+    "get_theme",
     "apply_theme",
+    "compile_stylesheet",
     "inject_css",
+    "publish_stylesheet",
+    "CssRunStats",
+    "css_run_stats",
+    "SelectorReport",
+    "audit_stylesheet",
+    "batch",
+    "emit_html",
+    "flush_html",
+    "HAS_FRAGMENT",
+    "fragment",
+    "FontFace",
+    "build_fonts",
+    "load_fonts",
+    "StatsFeed",
+    "ComponentStats",
+    "component_stats",
+    "on_interaction",
+    "reset_component_stats",
+    "track_run",
+    "Template",
+    "escape",
+    "FRAGMENT_CACHE",
+    "ByteLRU",
+    "CacheStats",
+    "cached_fragment",
+    "clear_fragment_cache",
+    "fragment_cache_stats",
+    "fragment_key",
 ]
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
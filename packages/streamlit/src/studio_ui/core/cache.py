@@ -0,0 +1,279 @@
+"""
+studio_ui/core/cache.py
+바이트 예산 기반 LRU 캐시 + 프로세스 공용 HTML 조각 캐시
+
+Streamlit은 세션마다 별도 스레드에서 스크립트를 실행하므로
+모든 연산은 락으로 보호됩니다.
+"""
+import functools
+import hashlib
+import marshal
+import operator
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+
+def sizeof(value: Any) -> int:
+    """캐시 항목의 바이트 크기 추정 (문자열은 UTF-8 인코딩 길이)"""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class ByteLRU:
+    """
+    바이트 예산을 넘으면 가장 오래 사용하지 않은 항목부터 제거하는 LRU 캐시
+
+    Args:
+        max_bytes: 최대 바이트 (초과 시 LRU 제거)
+        sizeof_fn: 항목 크기 계산 함수
+
+    Example:
+        >>> cache = ByteLRU(max_bytes=1024 * 1024)
+        >>> html = cache.get_or_create(("gnb", digest), lambda: render())
+    """
+
+    def __init__(self, max_bytes: int, sizeof_fn: Callable[[Any], int] = sizeof):
+        self._data: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._sizeof = sizeof_fn
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    def get(self, key: Hashable, default: Optional[T] = None) -> Optional[T]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(value)
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self._max_bytes:
+                return
+            self._data[key] = (value, size)
+            self._bytes += size
+            self._evict()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        캐시 조회 후 없으면 생성하여 저장
+
+        생성은 락 밖에서 수행하므로 느린 factory가 다른 세션을 막지 않습니다.
+        동시에 같은 키를 생성하면 먼저 저장된 값을 사용합니다.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return item[0]
+            self.misses += 1
+
+        value = factory()
+        size = self._sizeof(value)
+
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                return item[0]
+            if size <= self._max_bytes:
+                self._data[key] = (value, size)
+                self._bytes += size
+                self._evict()
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._data),
+                bytes=self._bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def _evict(self) -> None:
+        # 호출자가 락을 잡은 상태에서 호출
+        while self._bytes > self._max_bytes and self._data:
+            _, (_, size) = self._data.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+
+# ============================================================
+# Fragment Cache - 순수 렌더 함수(*_html) 결과 캐시
+# ============================================================
+
+# HTML 조각 캐시 기본 메모리 상한 (4 MB)
+DEFAULT_FRAGMENT_BYTES = 4 * 1024 * 1024
+
+# 프로세스 공용 조각 캐시 (모든 세션이 공유)
+FRAGMENT_CACHE = ByteLRU(DEFAULT_FRAGMENT_BYTES)
+
+# 재귀 없이 그대로 직렬화하는 타입
+_LEAF_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+# 타입별 (태그, 필드 getter) 캐시 - 데이터클래스가 아니면 ()
+_DATACLASS_SPECS: Dict[type, Tuple] = {}
+
+
+def _dataclass_spec(cls: type) -> Tuple:
+    if not is_dataclass(cls):
+        return ()
+    names = [f.name for f in fields(cls)]
+    getter = operator.attrgetter(*names) if len(names) > 1 else (lambda obj: (getattr(obj, names[0]),))
+    return (f"\0{cls.__module__}.{cls.__qualname__}", getter)
+
+
+def _canonical(value: Any) -> Any:
+    """marshal로 직렬화할 수 없는 데이터클래스를 (타입 태그, 필드값...) 튜플로 변환"""
+    cls = type(value)
+    if cls in _LEAF_TYPES:
+        return value
+    if cls is list or cls is tuple:
+        return tuple([v if type(v) in _LEAF_TYPES else _canonical(v) for v in value])
+    if cls is dict:
+        return {k: v if type(v) in _LEAF_TYPES else _canonical(v) for k, v in value.items()}
+    spec = _DATACLASS_SPECS.get(cls)
+    if spec is None:
+        spec = _DATACLASS_SPECS.setdefault(cls, _dataclass_spec(cls))
+    if not spec:
+        return value  # 직렬화 가능 여부는 marshal이 판단
+    tag, getter = spec
+    return (tag,) + tuple([v if type(v) in _LEAF_TYPES else _canonical(v) for v in getter(value)])
+
+
+# 리프 값 참조 추적이 없는 marshal 포맷 (같은 객체를 다시 만나도 그대로 기록하므로 더 빠름)
+_MARSHAL_VERSION = 2
+
+# 이 길이 이하의 직렬화 결과는 해시 없이 그대로 캐시 키로 사용
+_INLINE_KEY_BYTES = 256
+
+
+def _payload(args: Tuple, kwargs: Dict[str, Any], canonical: bool = False) -> bytes:
+    """인자 직렬화 (ValueError: 데이터클래스 등 marshal로 직렬화할 수 없는 값)"""
+    value = _canonical((args, kwargs)) if canonical else (args, kwargs)
+    return marshal.dumps(value, _MARSHAL_VERSION)
+
+
+def fragment_key(*args: Any, **kwargs: Any) -> bytes:
+    """
+    인자의 안정적인 다이제스트 (16바이트, 같은 인터프리터 안에서 안정)
+
+    문자열/숫자/리스트/딕셔너리는 marshal로 바로 직렬화하고,
+    데이터클래스가 섞여 있으면 필드 튜플로 변환한 뒤 직렬화합니다.
+
+    Raises:
+        TypeError: 키로 쓸 수 없는 인자 (DataFrame 등)
+    """
+    try:
+        payload = _payload(args, kwargs)
+    except ValueError:
+        try:
+            payload = _payload(args, kwargs, canonical=True)
+        except ValueError:
+            raise TypeError("조각 캐시 키로 쓸 수 없는 인자") from None
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def cached_fragment(fn: Callable[..., str]) -> Callable[..., str]:
+    """
+    순수 렌더 함수 결과를 FRAGMENT_CACHE에 캐시하는 데코레이터
+
+    같은 인자로 렌더링한 HTML은 세션과 무관하게 재사용됩니다.
+    키로 쓸 수 없는 인자(DataFrame 등)가 오면 캐시 없이 렌더링합니다.
+    원본 함수는 `.uncached`로 접근할 수 있습니다.
+
+    짧은 인자는 직렬화 결과를 그대로 키로 쓰고(_INLINE_KEY_BYTES 이하) 긴 인자만 해시합니다.
+    데이터클래스 인자를 한 번 만나면 이후 호출은 바로 필드 튜플로 변환해 직렬화합니다.
+
+    Example:
+        >>> @cached_fragment
+        ... def gnb_html(logo_text: str, menu_items: list) -> str:
+        ...     ...
+    """
+    name = f"{fn.__module__}.{fn.__qualname__}"
+    canonical = False
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        nonlocal canonical
+        try:
+            payload = _payload(args, kwargs, canonical)
+        except ValueError:
+            try:
+                payload = _payload(args, kwargs, canonical=True)
+            except ValueError:
+                return fn(*args, **kwargs)
+            canonical = True
+        if len(payload) <= _INLINE_KEY_BYTES:
+            key: Tuple = (name, payload)
+        else:
+            key = (name, hashlib.blake2b(payload, digest_size=16).digest())
+        return FRAGMENT_CACHE.get_or_create(key, lambda: fn(*args, **kwargs))
+
+    wrapper.uncached = fn
+    return wrapper
+
+
+def fragment_cache_stats() -> CacheStats:
+    """HTML 조각 캐시 통계 (hits, misses, evictions, bytes ...)"""
+    return FRAGMENT_CACHE.stats()
+
+
+def clear_fragment_cache() -> None:
+    """HTML 조각 캐시 비우기"""
+    FRAGMENT_CACHE.clear()
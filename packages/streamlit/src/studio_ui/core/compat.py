@@ -0,0 +1,121 @@
+"""
+studio_ui/core/compat.py
+Streamlit 버전 호환 - 기능 감지
+
+pyproject의 최소 버전(streamlit>=1.24)보다 새로운 API는 여기서 감지하고,
+없는 버전에서는 동작이 같은 대체 경로를 사용합니다.
+"""
+import functools
+import inspect
+from datetime import timedelta
+from typing import Any, Callable, Optional, TypeVar, Union
+
+import streamlit as st
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _fragment_decorator() -> Optional[Callable[[F], F]]:
+    # st.fragment (1.37+) → st.experimental_fragment (1.33 ~ 1.36) → 미지원
+    return getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+
+HAS_FRAGMENT = _fragment_decorator() is not None
+
+
+def fragment(
+    fn: Optional[F] = None,
+    *,
+    run_every: Union[int, float, timedelta, str, None] = None,
+) -> Any:
+    """
+    프래그먼트 데코레이터 (미지원 버전에서는 일반 함수로 실행)
+
+    프래그먼트 안 위젯을 조작하면 전체 스크립트 대신 해당 함수만 다시 실행됩니다.
+    미지원 버전에서는 함수를 그대로 반환하므로 위젯 조작 시 전체 스크립트가
+    다시 실행되지만 결과 화면은 같습니다.
+
+    run_every를 지정하면 함수만 주기적으로 다시 실행됩니다 (미지원 버전에서는
+    스크립트가 실행될 때만 갱신).
+
+    Example:
+        >>> @fragment
+        ... def _filters():
+        ...     st.button("새로고침")
+
+        >>> @fragment(run_every=1.0)
+        ... def _progress():
+        ...     st.write(job.progress)
+    """
+    if fn is None:
+        return functools.partial(fragment, run_every=run_every)
+    decorator = _fragment_decorator()
+    if decorator is None:
+        return fn
+    return decorator(fn) if run_every is None else decorator(fn, run_every=run_every)
+
+
+def _keyed_component_identity() -> bool:
+    # key가 있으면 인자가 바뀌어도 요소 ID를 유지하는지 (key_as_main_identity 도입 이후)
+    try:
+        from streamlit.elements.lib.utils import compute_and_register_element_id
+    except ImportError:
+        return False
+    return "key_as_main_identity" in inspect.signature(compute_and_register_element_id).parameters
+
+
+# True면 커스텀 컴포넌트 인자를 실행마다 바꿔도 iframe이 다시 만들어지지 않음
+KEYED_COMPONENT_IDENTITY = _keyed_component_identity()
+
+
+def _deferred_download() -> bool:
+    # st.download_button(data=callable) - 클릭할 때 파일 생성 (MediaFileManager.add_deferred 도입 이후)
+    try:
+        from streamlit.runtime.media_file_manager import MediaFileManager
+    except ImportError:
+        return False
+    return hasattr(MediaFileManager, "add_deferred")
+
+
+# True면 다운로드 버튼 데이터를 클릭할 때 만들 수 있음 (리런마다 파일을 넘기지 않음)
+HAS_DEFERRED_DOWNLOAD = _deferred_download()
+
+
+def _key_classes() -> bool:
+    # 키 있는 위젯/컨테이너에 st-key-<키> 클래스를 붙이는지 (st.container(key=) 도입 이후, 1.39 ~)
+    return "key" in inspect.signature(st.container).parameters
+
+
+# True면 키로 위젯 요소를 CSS에서 선택할 수 있음 (.st-key-<키>)
+HAS_KEY_CLASSES = _key_classes()
+
+
+def active_container() -> Any:
+    """
+    지금 st.* 호출이 그려질 컨테이너 (with 블록의 컨테이너, 없으면 메인 영역)
+
+    반환값은 DeltaGenerator이며 같은 with 블록 안에서는 같은 객체입니다.
+    """
+    return st._main._active_dg
+
+
+def current_fragment_id() -> Optional[str]:
+    """
+    지금 실행 중인 프래그먼트 ID (프래그먼트 밖이거나 미지원 버전이면 None)
+
+    1.37 ~: ScriptRunContext.current_fragment_id
+    최근 버전: 스레드별 상태(ThreadState.get().fragment_id)
+    """
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    fragment_id = getattr(ctx, "current_fragment_id", None)
+    if fragment_id:
+        return fragment_id
+    try:
+        from streamlit.runtime.scriptrunner_utils.script_run_context import ThreadState
+    except ImportError:
+        return None
+    return getattr(ThreadState.get(), "fragment_id", None)
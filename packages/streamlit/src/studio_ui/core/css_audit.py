@@ -0,0 +1,215 @@
+"""
+studio_ui/core/css_audit.py
+스타일시트 선택자 복잡도 정적 분석
+
+브라우저의 스타일 재계산 비용을 키우는 패턴을 정적으로 집계합니다.
+- 키 선택자(가장 오른쪽 compound)가 `*` 인 전체 선택자
+- 키 선택자가 태그뿐인 광범위 선택자 (p, span, div ...)
+- !important 선언 수, 최대 명시도, 컴포지터 전용이 아닌 트랜지션
+"""
+import re
+from dataclasses import dataclass, fields
+from typing import Dict, Iterator, List, Tuple
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_IMPORT_RE = re.compile(r"@import[^;]*;")
+_TAG_RE = re.compile(r"</?style[^>]*>")
+_TYPE_RE = re.compile(r"^[a-zA-Z][\w-]*$")
+_TRANSITION_RE = re.compile(r"transition\s*:\s*([^;]+)")
+
+# 컴포지터 스레드에서 처리되는 (레이아웃/페인트를 유발하지 않는) 속성
+_COMPOSITED_PROPERTIES = {"transform", "opacity", "filter"}
+
+
+@dataclass
+class SelectorReport:
+    """스타일시트 선택자 복잡도 리포트"""
+    bytes: int = 0
+    rules: int = 0
+    selectors: int = 0
+    universal_key: int = 0               # `.stApp *` 처럼 키 선택자가 `*`
+    type_key: int = 0                    # `p`, `.stApp div` 처럼 키 선택자가 태그뿐
+    zero_specificity: int = 0            # :where() 등으로 명시도 0
+    max_combinators: int = 0             # 선택자 하나의 최대 조합자 수
+    important: int = 0                   # !important 선언 수
+    max_specificity: Tuple[int, int, int] = (0, 0, 0)
+    non_composited_transitions: int = 0  # `transition: all` 또는 레이아웃/페인트 속성 트랜지션
+
+
+def _iter_rules(css: str) -> Iterator[Tuple[str, str]]:
+    """(prelude, body) 쌍 순회 (@media 등 중첩 블록은 재귀)"""
+    i, n = 0, len(css)
+    while i < n:
+        start = css.find("{", i)
+        if start < 0:
+            return
+        prelude = css[i:start].strip()
+        depth, j = 1, start + 1
+        while j < n and depth:
+            if css[j] == "{":
+                depth += 1
+            elif css[j] == "}":
+                depth -= 1
+            j += 1
+        body = css[start + 1:j - 1]
+        if prelude.startswith("@"):
+            yield from _iter_rules(body)
+        elif prelude:
+            yield prelude, body
+        i = j
+
+
+def _split_top(text: str, separators: str) -> List[str]:
+    """괄호/대괄호 밖의 구분자로 분리"""
+    parts, buf, depth = [], [], 0
+    for ch in text:
+        if ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        if depth == 0 and ch in separators:
+            parts.append("".join(buf))
+            buf = []
+            continue
+        buf.append(ch)
+    parts.append("".join(buf))
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _closing(text: str, i: int, open_ch: str, close_ch: str) -> int:
+    """text[i]가 open_ch일 때 대응하는 close_ch의 인덱스"""
+    depth = 0
+    for j in range(i, len(text)):
+        if text[j] == open_ch:
+            depth += 1
+        elif text[j] == close_ch:
+            depth -= 1
+            if depth == 0:
+                return j
+    return len(text) - 1
+
+
+def specificity(selector: str) -> Tuple[int, int, int]:
+    """선택자 명시도 (id, class/attr/pseudo-class, type/pseudo-element)"""
+    a = b = c = 0
+    i, n = 0, len(selector)
+    while i < n:
+        ch = selector[i]
+        if ch == "#":
+            a += 1
+            i += 1
+            while i < n and (selector[i].isalnum() or selector[i] in "-_"):
+                i += 1
+        elif ch == ".":
+            b += 1
+            i += 1
+            while i < n and (selector[i].isalnum() or selector[i] in "-_"):
+                i += 1
+        elif ch == "[":
+            b += 1
+            i = _closing(selector, i, "[", "]") + 1
+        elif selector.startswith("::", i):
+            c += 1
+            i += 2
+            while i < n and (selector[i].isalnum() or selector[i] in "-_"):
+                i += 1
+        elif ch == ":":
+            m = re.match(r":([\w-]+)", selector[i:])
+            name = m.group(1) if m else ""
+            i += len(name) + 1
+            args = ""
+            if i < n and selector[i] == "(":
+                end = _closing(selector, i, "(", ")")
+                args = selector[i + 1:end]
+                i = end + 1
+            if name == "where":
+                continue
+            if name in ("is", "not", "has"):
+                inner = [specificity(s) for s in _split_top(args, ",")]
+                ia, ib, ic = max(inner) if inner else (0, 0, 0)
+                a, b, c = a + ia, b + ib, c + ic
+            else:
+                b += 1
+        elif ch.isalpha():
+            c += 1
+            while i < n and (selector[i].isalnum() or selector[i] in "-_"):
+                i += 1
+        else:
+            i += 1
+    return a, b, c
+
+
+def _key_kind(compound: str) -> str:
+    """키 compound 분류: "universal" | "type" | "" """
+    m = re.fullmatch(r":(?:where|is)\((.*)\)", compound)
+    if m:
+        kinds = {_key_kind(_split_top(arg, " >+~")[-1]) for arg in _split_top(m.group(1), ",")}
+        for kind in ("universal", "type"):
+            if kind in kinds:
+                return kind
+        return ""
+    bare = re.sub(r"::?[\w-]+(\([^)]*\))?$", "", compound)
+    if bare.startswith("*"):
+        return "universal"
+    if _TYPE_RE.match(bare):
+        return "type"
+    return ""
+
+
+def audit_stylesheet(css: str) -> SelectorReport:
+    """
+    스타일시트 선택자 복잡도 분석
+
+    Args:
+        css: CSS 문자열 (<style> 태그 포함 가능)
+
+    Returns:
+        SelectorReport
+
+    Example:
+        >>> from studio_ui.core.styles import compile_stylesheet
+        >>> audit_stylesheet(compile_stylesheet(profile="lean")).universal_key
+        0
+    """
+    report = SelectorReport(bytes=len(css.encode("utf-8")))
+    text = _IMPORT_RE.sub("", _TAG_RE.sub("", _COMMENT_RE.sub("", css)))
+
+    for prelude, body in _iter_rules(text):
+        report.rules += 1
+        report.important += body.count("!important")
+
+        for match in _TRANSITION_RE.finditer(body):
+            props = {part.split()[0] for part in match.group(1).split(",") if part.split()}
+            if not props <= _COMPOSITED_PROPERTIES:
+                report.non_composited_transitions += 1
+
+        for selector in _split_top(prelude, ","):
+            report.selectors += 1
+            compounds = _split_top(selector.replace(">", " > "), " >+~")
+            report.max_combinators = max(report.max_combinators, len(compounds) - 1)
+
+            kind = _key_kind(compounds[-1]) if compounds else ""
+            if kind == "universal":
+                report.universal_key += 1
+            elif kind == "type":
+                report.type_key += 1
+
+            spec = specificity(selector)
+            if spec == (0, 0, 0):
+                report.zero_specificity += 1
+            report.max_specificity = max(report.max_specificity, spec)
+
+    return report
+
+
+def format_reports(reports: Dict[str, SelectorReport]) -> str:
+    """여러 리포트를 항목별 비교 표로 포맷"""
+    names = list(reports)
+    width = max(12, *(len(name) for name in names))
+    lines = [f"{'metric':<28}" + "".join(f"{name:>{width + 2}}" for name in names)]
+    for f in fields(SelectorReport):
+        values = [getattr(reports[name], f.name) for name in names]
+        lines.append(
+            f"{f.name:<28}" + "".join(f"{str(v):>{width + 2}}" for v in values)
+        )
+    return "\n".join(lines)
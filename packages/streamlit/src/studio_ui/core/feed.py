@@ -0,0 +1,104 @@
+"""
+studio_ui/core/feed.py
+백그라운드 작업 → 화면 실시간 집계 버퍼
+
+백그라운드 스레드(매칭 작업 등)는 StatsFeed에 건수를 쓰고,
+live_stats_card()는 st.fragment(run_every)로 주기적으로 읽습니다.
+쓰기는 락 안에서 딕셔너리 갱신만 하므로 작업 속도에 영향이 거의 없고,
+메모리는 레이블 수(max_labels)와 이력 길이(capacity)로 제한됩니다.
+"""
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Mapping, Tuple
+
+# (레이블, 건수) 튜플 - 레이블은 처음 기록된 순서
+Counts = Tuple[Tuple[str, int], ...]
+
+
+class StatsFeed:
+    """
+    스레드 안전 집계 버퍼 (세션/스레드 공유)
+
+    건수가 바뀔 때마다 version이 증가하므로 읽는 쪽은 version만 비교해
+    바뀌지 않은 주기를 건너뜁니다. 관측한 스냅샷은 최근 capacity개까지
+    링 버퍼(history)에 남습니다.
+
+    Args:
+        capacity: history에 보관할 최대 스냅샷 수
+        max_labels: 최대 레이블 수 (넘는 레이블은 overflow_label로 합산)
+        overflow_label: 합산 레이블
+
+    Example:
+        >>> @st.cache_resource
+        ... def matching_feed() -> StatsFeed:
+        ...     return StatsFeed()
+        >>> feed = matching_feed()
+        >>> threading.Thread(target=run_matching, args=(feed,)).start()  # feed.add("매칭")
+        >>> live_stats_card(feed, title="매칭 진행")
+    """
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        max_labels: int = 32,
+        overflow_label: str = "기타",
+    ):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._version = 0
+        self._max_labels = max_labels
+        self._overflow_label = overflow_label
+        self._history: "deque[Tuple[int, float, Counts]]" = deque(maxlen=capacity)
+
+    @property
+    def version(self) -> int:
+        """건수가 바뀔 때마다 증가하는 번호"""
+        return self._version
+
+    def add(self, label: str, n: int = 1) -> None:
+        """레이블 건수에 n을 더함"""
+        with self._lock:
+            self._add(label, n)
+            self._version += 1
+
+    def update(self, counts: Mapping[str, int]) -> None:
+        """여러 레이블 건수를 한 번에 더함 (버전은 1만 증가)"""
+        with self._lock:
+            for label, n in counts.items():
+                self._add(label, n)
+            self._version += 1
+
+    def set(self, counts: Mapping[str, int]) -> None:
+        """건수 전체를 교체 (작업이 누적 건수를 직접 관리할 때)"""
+        with self._lock:
+            self._counts = {}
+            for label, n in counts.items():
+                self._add(label, n)
+            self._version += 1
+
+    def reset(self) -> None:
+        """건수와 이력 초기화"""
+        with self._lock:
+            self._counts = {}
+            self._history.clear()
+            self._version += 1
+
+    def snapshot(self) -> Tuple[int, Counts]:
+        """(version, 건수) - 이전 스냅샷과 버전이 다르면 history에 기록"""
+        with self._lock:
+            counts = tuple(self._counts.items())
+            if not self._history or self._history[-1][0] != self._version:
+                self._history.append((self._version, time.time(), counts))
+            return self._version, counts
+
+    def history(self) -> List[Tuple[float, Counts]]:
+        """관측한 최근 스냅샷 [(timestamp, 건수), ...] (오래된 순)"""
+        with self._lock:
+            return [(ts, counts) for _, ts, counts in self._history]
+
+    def _add(self, label: str, n: int) -> None:
+        # 호출자가 락을 잡은 상태에서 호출
+        if label not in self._counts and len(self._counts) >= self._max_labels:
+            label = self._overflow_label
+        self._counts[label] = self._counts.get(label, 0) + n
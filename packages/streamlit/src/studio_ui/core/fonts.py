@@ -0,0 +1,370 @@
+"""
+studio_ui/core/fonts.py
+자체 호스팅 서브셋 폰트 - Google Fonts @import 대체
+
+Noto Sans KR 같은 CJK 폰트는 수 MB라 렌더링을 막고, 외부망이 없는 배포 환경에서는
+fonts.googleapis.com을 불러올 수 없습니다. 빌드 단계에서 앱이 실제로 쓰는 글자만
+남긴 WOFF2를 만들어 static/ 폴더로 서빙합니다.
+
+빌드 (fontTools 필요: pip install "studio-ui[fonts]"):
+    python -m studio_ui.core.fonts --font NotoSansKR-Regular.otf:400 \\
+        --font NotoSansKR-Bold.otf:700 --corpus app_strings.txt --static-dir static
+
+- 글자 집합: ASCII + studio_ui 컴포넌트 문자열 리터럴 + 사용자 코퍼스
+  (--common-hangul: KS X 1001 완성형 한글 2,350자 추가)
+- static/studio_ui/<폰트>-<굵기>-<해시>.woff2 + fonts.json 매니페스트 기록
+- apply_theme()가 매니페스트를 읽어 테마 스타일시트에 @font-face(font-display: swap)를 넣음
+  (server.enableStaticServing = true 필요)
+- 매니페스트가 없거나 static 서빙이 꺼져 있으면 fonts="auto"는 Google Fonts @import로 대체
+
+서브셋에 없는 글자(업로드한 파일의 이름 등)는 브라우저가 글자 단위로 시스템 폰트를 사용합니다.
+"""
+import argparse
+import ast
+import io
+import json
+import os
+import re
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import streamlit as st
+
+from .static import ASSET_SUBDIR, default_static_dir, publish_asset
+
+DEFAULT_FAMILY = "Noto Sans KR"
+
+# 빌드한 폰트가 없을 때(apply_theme(fonts="auto")) 대신 쓰는 Google Fonts 스타일시트 (이전 기본 동작)
+GOOGLE_FONTS_IMPORT = (
+    "@import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;500;600;700&display=swap');"
+)
+
+# static/studio_ui/ 아래 빌드 결과 매니페스트
+MANIFEST_NAME = "fonts.json"
+
+# 컴포넌트 문자열 리터럴을 수집할 패키지 하위 폴더
+_STRING_SOURCES = ("components", "widgets")
+
+# unicode-range에서 이 간격 이하로 떨어진 구간은 합침 (규칙 길이 제한, 다운로드 판단에만 쓰임)
+_RANGE_GAP = 64
+
+# 테마를 적용한 세션의 폰트 (iframe 컴포넌트가 같은 폰트를 쓰도록 전달)
+_SESSION_KEY = "_studio_ui_fonts"
+
+# 매니페스트 경로 → (mtime, 폰트)
+_MANIFESTS: Dict[str, Tuple[float, Tuple["FontFace", ...]]] = {}
+
+
+@dataclass(frozen=True)
+class FontFace:
+    """
+    @font-face 하나 (불변, 해시 가능 - Theme.fonts에 사용)
+
+    Args:
+        family: font-family 이름
+        weight: font-weight ("400", 가변 폰트는 "100 900")
+        url: 페이지 기준 상대 URL (예: "app/static/studio_ui/noto-sans-kr-400-1a2b3c.woff2")
+        unicode_range: 서브셋에 포함된 코드포인트 (예: "U+20-7E, U+AC00-AC01")
+        size: WOFF2 바이트 수
+    """
+    family: str
+    weight: str
+    url: str
+    unicode_range: str = ""
+    size: int = 0
+
+    def to_css(self) -> str:
+        """@font-face 규칙"""
+        unicode_range = f"\n    unicode-range: {self.unicode_range};" if self.unicode_range else ""
+        return (
+            "@font-face {\n"
+            f"    font-family: '{self.family}';\n"
+            "    font-style: normal;\n"
+            f"    font-weight: {self.weight};\n"
+            "    font-display: swap;\n"
+            f"    src: url('{self.url}') format('woff2');{unicode_range}\n"
+            "}"
+        )
+
+
+def font_face_css(faces: Sequence[FontFace]) -> str:
+    """여러 @font-face 규칙을 하나의 CSS 문자열로"""
+    return "\n".join(face.to_css() for face in faces)
+
+
+# ============================================
+# 글자 집합
+# ============================================
+
+def _string_literals(source: str) -> Iterable[str]:
+    """모듈의 문자열 리터럴 (독스트링 제외)"""
+    tree = ast.parse(source)
+    docstrings = set()
+    for node in ast.walk(tree):
+        body = getattr(node, "body", None)
+        if isinstance(body, list) and body and isinstance(body[0], ast.Expr):
+            docstrings.add(id(body[0].value))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and id(node) not in docstrings:
+            yield node.value
+
+
+def component_strings() -> str:
+    """studio_ui 컴포넌트가 화면에 그리는 문자열 (파이썬 문자열 리터럴)"""
+    package = Path(__file__).resolve().parents[1]
+    parts: List[str] = []
+    for folder in _STRING_SOURCES:
+        for path in sorted((package / folder).rglob("*.py")):
+            parts.extend(_string_literals(path.read_text(encoding="utf-8")))
+    return "".join(parts)
+
+
+def common_hangul() -> str:
+    """KS X 1001 완성형 한글 2,350자 (일상 문장 대부분을 덮는 음절)"""
+    chars = []
+    for lead in range(0xB0, 0xC9):
+        for trail in range(0xA1, 0xFF):
+            try:
+                chars.append(bytes((lead, trail)).decode("euc-kr"))
+            except UnicodeDecodeError:
+                continue
+    return "".join(chars)
+
+
+def glyph_text(corpus: Iterable[str] = (), include_common_hangul: bool = False) -> str:
+    """
+    서브셋에 남길 글자 (정렬, 중복 제거)
+
+    Args:
+        corpus: 추가 텍스트 (앱 문자열, 도메인 용어 등)
+        include_common_hangul: KS X 1001 완성형 한글 2,350자 포함 여부
+    """
+    chars = set(chr(c) for c in range(0x20, 0x7F))
+    chars.update(component_strings())
+    for text in corpus:
+        chars.update(text)
+    if include_common_hangul:
+        chars.update(common_hangul())
+    return "".join(sorted(c for c in chars if c.isprintable()))
+
+
+def unicode_range(text: str) -> str:
+    """글자 집합 → CSS unicode-range (가까운 구간은 합침)"""
+    spans: List[List[int]] = []
+    for point in sorted(set(ord(c) for c in text)):
+        if spans and point <= spans[-1][1] + _RANGE_GAP:
+            spans[-1][1] = point
+        else:
+            spans.append([point, point])
+    return ", ".join(f"U+{a:X}" if a == b else f"U+{a:X}-{b:X}" for a, b in spans)
+
+
+# ============================================
+# 서브셋 빌드
+# ============================================
+
+def _font_tools():
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        raise ImportError(
+            "폰트 서브셋에는 fontTools가 필요합니다: pip install \"studio-ui[fonts]\""
+        ) from None
+    return subset, TTFont
+
+
+def _weight_range(font) -> Optional[str]:
+    """가변 폰트의 wght 축 범위 ("100 900"), 고정 폰트는 None"""
+    if "fvar" not in font:
+        return None
+    for axis in font["fvar"].axes:
+        if axis.axisTag == "wght":
+            return f"{int(axis.minValue)} {int(axis.maxValue)}"
+    return None
+
+
+def subset_font(source: Union[str, Path], text: str) -> Tuple[bytes, Optional[str], str]:
+    """
+    폰트를 text의 글자만 남긴 WOFF2로 서브셋
+
+    Args:
+        source: 원본 폰트 (.ttf/.otf/.woff2)
+        text: 남길 글자
+
+    Returns:
+        (WOFF2 바이트, 가변 폰트의 wght 범위 또는 None, 서브셋에 실제로 들어간 글자)
+    """
+    subset, TTFont = _font_tools()
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    font = TTFont(str(source))
+    weight = _weight_range(font)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    covered = "".join(chr(point) for point in sorted(font.getBestCmap() or ()))
+    buffer = io.BytesIO()
+    font.flavor = "woff2"
+    font.save(buffer)
+    return buffer.getvalue(), weight, covered
+
+
+def _slug(family: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", family.lower()).strip("-")
+
+
+def build_fonts(
+    sources: Dict[str, Union[str, Path]],
+    corpus: Iterable[str] = (),
+    family: str = DEFAULT_FAMILY,
+    static_dir: Optional[Union[str, Path]] = None,
+    include_common_hangul: bool = False,
+) -> Tuple[FontFace, ...]:
+    """
+    굵기별 원본 폰트를 서브셋해 static/ 폴더에 기록하고 매니페스트 작성
+
+    Args:
+        sources: {굵기: 원본 폰트 경로} (예: {"400": "NotoSansKR-Regular.otf"}),
+            가변 폰트는 굵기 대신 아무 키나 사용 (wght 축 범위를 자동 사용)
+        corpus: 추가 텍스트
+        family: font-family 이름
+        static_dir: static 폴더 경로 (기본: 앱의 static/)
+        include_common_hangul: KS X 1001 완성형 한글 2,350자 포함 여부
+
+    Returns:
+        기록된 폰트
+
+    Example:
+        >>> build_fonts({"400": "NotoSansKR-Regular.otf", "700": "NotoSansKR-Bold.otf"},
+        ...             corpus=[Path("strings.txt").read_text()])
+    """
+    text = glyph_text(corpus, include_common_hangul)
+    faces = []
+    for weight, source in sources.items():
+        # unicode-range는 원본에 실제로 있는 글자만 (이모지 등은 브라우저가 다른 폰트로 그림)
+        data, variable_weight, covered = subset_font(source, text)
+        weight = variable_weight or str(weight)
+        url = publish_asset(
+            data, stem=f"{_slug(family)}-{weight.replace(' ', '-')}", suffix=".woff2",
+            static_dir=static_dir,
+        )
+        faces.append(FontFace(family, weight, url, unicode_range(covered), len(data)))
+
+    manifest = {
+        "family": family,
+        "glyphs": len(text),
+        "faces": [asdict(face) for face in faces],
+    }
+    root = Path(static_dir) if static_dir is not None else default_static_dir()
+    _write_atomic(root / ASSET_SUBDIR / MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2))
+    return tuple(faces)
+
+
+def _write_atomic(target: Path, content: str) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+# ============================================
+# 런타임
+# ============================================
+
+def load_fonts(static_dir: Optional[Union[str, Path]] = None) -> Tuple[FontFace, ...]:
+    """
+    build_fonts가 기록한 매니페스트의 폰트 (없으면 빈 튜플)
+
+    매니페스트가 바뀌지 않으면 파일을 다시 읽지 않습니다.
+    """
+    root = Path(static_dir) if static_dir is not None else default_static_dir()
+    path = root / ASSET_SUBDIR / MANIFEST_NAME
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return ()
+
+    memo = _MANIFESTS.get(str(path))
+    if memo is not None and memo[0] == mtime:
+        return memo[1]
+
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    faces = tuple(FontFace(**face) for face in manifest.get("faces", ()))
+    _MANIFESTS[str(path)] = (mtime, faces)
+    return faces
+
+
+def set_session_fonts(faces: Sequence[FontFace]) -> None:
+    """현재 세션 테마의 폰트 기록 (apply_theme에서 호출)"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    if get_script_run_ctx() is None:
+        return
+    value = [{"family": f.family, "weight": f.weight, "url": f.url} for f in faces]
+    if st.session_state.get(_SESSION_KEY) != value:
+        st.session_state[_SESSION_KEY] = value
+
+
+def session_fonts() -> List[Dict[str, str]]:
+    """iframe 컴포넌트에 넘길 현재 세션 폰트 ({family, weight, url} 목록)"""
+    return st.session_state.get(_SESSION_KEY) or []
+
+
+def _font_sources(specs: Sequence[str]) -> Dict[str, str]:
+    """
+    --font PATH[:WEIGHT] 목록 → {굵기: 경로}
+
+    마지막 콜론 뒤가 숫자일 때만 굵기로 해석합니다 (C:\\fonts\\x.otf:700 같은 Windows 경로).
+    같은 굵기를 두 번 지정하면 ValueError.
+    """
+    sources: Dict[str, str] = {}
+    for spec in specs:
+        path, sep, weight = spec.rpartition(":")
+        if not weight.isdigit():
+            # "x.otf:"처럼 굵기가 비어 있으면 기본 굵기
+            path, weight = (path if sep and not weight else spec), "400"
+        if weight in sources:
+            raise ValueError(f"굵기 {weight}의 --font가 두 번 지정되었습니다: {sources[weight]}, {path}")
+        sources[weight] = path
+    return sources
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m studio_ui.core.fonts",
+        description="studio_ui 자체 호스팅 서브셋 폰트 빌드",
+    )
+    parser.add_argument("--font", action="append", required=True, metavar="PATH[:WEIGHT]",
+                        help="원본 폰트 (굵기 기본 400, 가변 폰트는 wght 축 범위 사용)")
+    parser.add_argument("--corpus", action="append", default=[], metavar="FILE",
+                        help="앱 문자열 텍스트 파일 (여러 번 지정 가능)")
+    parser.add_argument("--family", default=DEFAULT_FAMILY)
+    parser.add_argument("--static-dir", default="static")
+    parser.add_argument("--common-hangul", action="store_true",
+                        help="KS X 1001 완성형 한글 2,350자 포함")
+    args = parser.parse_args(argv)
+
+    try:
+        sources = _font_sources(args.font)
+    except ValueError as exc:
+        parser.error(str(exc))
+    corpus = [Path(p).read_text(encoding="utf-8") for p in args.corpus]
+
+    faces = build_fonts(sources, corpus, args.family, args.static_dir, args.common_hangul)
+    for face, source in zip(faces, sources.values()):
+        print(f"{face.family} {face.weight}: {os.path.getsize(source):,} B → {face.size:,} B ({face.url})")
+
+
+if __name__ == "__main__":
+    main()
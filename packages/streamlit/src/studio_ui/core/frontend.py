@@ -0,0 +1,91 @@
+"""
+studio_ui/core/frontend.py
+iframe 컴포넌트 공용 번들 - 모든 studio_ui iframe 컴포넌트가 같은 셸과 에셋을 사용
+
+frontend/ 폴더 구성:
+    index.html      번들을 불러와 render 메시지를 넘기는 작은 셸
+    studio-ui.css   공용 스타일시트
+    studio-ui.js    variant별 렌더러 (cards, carousel, grid, stylesheet)
+
+번들 URL에는 콘텐츠 해시가 들어 있어 내용이 바뀔 때만 달라집니다.
+- static 서빙이 켜져 있으면 publish_asset으로 app/static에 기록
+  (검증 헤더(ETag/Last-Modified)가 붙어 브라우저 캐시 재사용)
+- 꺼져 있으면 컴포넌트 폴더의 파일을 ?v=<해시> URL로 제공
+render 메시지에는 번들 URL(수십 바이트)과 인스턴스 데이터만 실립니다.
+apply_theme이 자체 호스팅 폰트를 사용하면 폰트 URL도 함께 넘겨 iframe이 같은 WOFF2를 씁니다.
+"""
+from functools import cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .fonts import session_fonts
+from .static import content_digest, publish_asset, static_serving_enabled
+
+FRONTEND_DIR = Path(__file__).resolve().parents[1] / "frontend"
+
+# 번들 파일 (stem, suffix)
+BUNDLE_FILES: Tuple[Tuple[str, str], ...] = (("studio-ui", ".css"), ("studio-ui", ".js"))
+
+_component_func: Optional[Callable[..., Any]] = None
+
+
+def _component() -> Callable[..., Any]:
+    """declare_component는 첫 사용 시 한 번만 호출 (import 비용 지연)"""
+    global _component_func
+    if _component_func is None:
+        import streamlit.components.v1 as components
+
+        _component_func = components.declare_component("studio_ui", path=str(FRONTEND_DIR))
+    return _component_func
+
+
+@cache
+def _bundle_bytes() -> Tuple[bytes, ...]:
+    return tuple((FRONTEND_DIR / f"{stem}{suffix}").read_bytes() for stem, suffix in BUNDLE_FILES)
+
+
+def bundle_version() -> str:
+    """번들 콘텐츠 해시 (css + js)"""
+    return content_digest(b"".join(_bundle_bytes()))
+
+
+def bundle_urls() -> Dict[str, Any]:
+    """
+    현재 설정에서 사용할 번들 URL
+
+    Returns:
+        {"css": URL, "js": URL, "page": URL이 부모 페이지 기준인지 여부}
+    """
+    if static_serving_enabled():
+        # publish_asset은 (폴더, 파일명)별로 메모하므로 프로세스당 한 번만 기록
+        css, js = (
+            publish_asset(data, stem=stem, suffix=suffix)
+            for data, (stem, suffix) in zip(_bundle_bytes(), BUNDLE_FILES)
+        )
+        return {"css": css, "js": js, "page": True}
+
+    version = bundle_version()
+    css, js = (f"{stem}{suffix}?v={version}" for stem, suffix in BUNDLE_FILES)
+    return {"css": css, "js": js, "page": False}
+
+
+def studio_component(variant: str, key: Optional[str] = None, default: Any = None, **args: Any) -> Any:
+    """
+    공용 iframe 컴포넌트 렌더링
+
+    Args:
+        variant: 프론트엔드 렌더러 (cards, carousel, grid, stylesheet)
+        key: 컴포넌트 키
+        default: 프론트엔드가 값을 보내기 전의 반환값
+        **args: 인스턴스 데이터 (JSON 직렬화 가능해야 함)
+
+    Returns:
+        프론트엔드가 보낸 값 (없으면 default)
+
+    Example:
+        >>> studio_component("stylesheet", href=url, height=0)
+    """
+    fonts = session_fonts() if variant != "stylesheet" else None
+    if fonts:
+        args["fonts"] = fonts
+    return _component()(variant=variant, bundle=bundle_urls(), key=key, default=default, **args)
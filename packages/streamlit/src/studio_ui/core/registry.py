@@ -0,0 +1,141 @@
+"""
+studio_ui/core/registry.py
+테마 레지스트리 - 내용 지문 기반 테마 인터닝 및 컴파일 산출물 캐시
+
+하나의 Streamlit 프로세스에서 여러 브랜드를 서비스할 때
+같은 오버라이드로 만든 테마는 같은 인스턴스를 공유하고,
+컴파일된 스타일시트 등은 메모리 상한이 있는 LRU에 보관합니다.
+"""
+import threading
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Tuple, TypeVar
+
+from .cache import ByteLRU, CacheStats
+
+if TYPE_CHECKING:
+    from .theme import Theme
+
+T = TypeVar("T")
+
+# 컴파일 산출물 기본 메모리 상한 (8 MB ≈ 스타일시트 400여 개)
+DEFAULT_MAX_ARTIFACT_BYTES = 8 * 1024 * 1024
+
+
+class ThemeRegistry:
+    """
+    테마 인터닝 레지스트리
+
+    Args:
+        max_artifact_bytes: 컴파일 산출물 캐시 메모리 상한 (바이트)
+
+    Example:
+        >>> registry = ThemeRegistry(max_artifact_bytes=2 * 1024 * 1024)
+        >>> brand = registry.extend(DEFAULT_THEME, "brand", primary="#007bff")
+        >>> brand is registry.extend(DEFAULT_THEME, "brand", primary="#007bff")
+        True
+        >>> registry.get("brand") is brand
+        True
+    """
+
+    def __init__(self, max_artifact_bytes: int = DEFAULT_MAX_ARTIFACT_BYTES):
+        self._lock = threading.Lock()
+        self._themes: Dict[Tuple[str, str], "Theme"] = {}
+        self._by_name: Dict[str, "Theme"] = {}
+        self._tokens: Dict[Any, Any] = {}
+        self._artifacts = ByteLRU(max_artifact_bytes)
+
+    def intern(self, theme: "Theme") -> "Theme":
+        """
+        (이름, 지문)이 같은 테마가 이미 있으면 그 인스턴스를 반환, 없으면 등록
+
+        토큰 객체(Colors 등)도 내용이 같으면 하나의 인스턴스로 공유합니다.
+        같은 이름을 다른 내용으로 등록하면 이름 조회는 마지막 테마를 가리킵니다.
+        """
+        key = (theme.name, theme.fingerprint())
+        existing = self._themes.get(key)
+        if existing is not None:
+            return existing
+
+        with self._lock:
+            existing = self._themes.get(key)
+            if existing is not None:
+                return existing
+            theme = self._intern_tokens(theme)
+            self._themes[key] = theme
+            self._by_name[theme.name] = theme
+            return theme
+
+    def extend(self, base: "Theme", name: str, **color_overrides) -> "Theme":
+        """base 테마를 색상 오버라이드로 확장한 인터닝된 테마"""
+        return self.intern(replace(base, name=name, colors=replace(base.colors, **color_overrides)))
+
+    def get(self, name: str) -> "Theme":
+        """
+        이름으로 테마 조회
+
+        Raises:
+            KeyError: 등록되지 않은 이름
+        """
+        try:
+            return self._by_name[name]
+        except KeyError:
+            raise KeyError(f"등록되지 않은 테마: {name!r}") from None
+
+    def names(self) -> List[str]:
+        """등록된 테마 이름 목록"""
+        with self._lock:
+            return list(self._by_name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __len__(self) -> int:
+        return len(self._themes)
+
+    def artifact(self, theme: "Theme", kind: Hashable, factory: Callable[[], T]) -> T:
+        """
+        테마 컴파일 산출물 조회/생성 (지문 기준, LRU + 메모리 상한)
+
+        Args:
+            theme: 대상 테마
+            kind: 산출물 종류 (예: ("stylesheet", "full"))
+            factory: 캐시 미스 시 호출되는 생성 함수
+        """
+        return self._artifacts.get_or_create((theme.fingerprint(), kind), factory)
+
+    @property
+    def max_artifact_bytes(self) -> int:
+        return self._artifacts.max_bytes
+
+    @max_artifact_bytes.setter
+    def max_artifact_bytes(self, value: int) -> None:
+        self._artifacts.max_bytes = value
+
+    def artifact_stats(self) -> CacheStats:
+        """컴파일 산출물 캐시 통계"""
+        return self._artifacts.stats()
+
+    def clear_artifacts(self) -> None:
+        """컴파일 산출물 캐시 비우기"""
+        self._artifacts.clear()
+
+    def _intern_tokens(self, theme: "Theme") -> "Theme":
+        # 호출자가 락을 잡은 상태에서 호출
+        from .theme import _CSS_VAR_GROUPS
+
+        changes = {}
+        for group, _ in _CSS_VAR_GROUPS:
+            tokens = getattr(theme, group)
+            shared = self._tokens.setdefault(tokens, tokens)
+            if shared is not tokens:
+                changes[group] = shared
+        return replace(theme, **changes) if changes else theme
+
+
+# 프로세스 기본 레지스트리
+THEME_REGISTRY = ThemeRegistry()
+
+
+def get_theme(name: str) -> "Theme":
+    """기본 레지스트리에서 이름으로 테마 조회"""
+    return THEME_REGISTRY.get(name)
@@ -0,0 +1,111 @@
+"""
+studio_ui/core/render.py
+HTML 출력 배치 - 연속된 st.markdown 호출을 하나의 요소로 합치기
+
+studio_ui 컴포넌트는 HTML을 st.markdown 대신 emit_html()로 출력합니다.
+`with batch():` 안에서는 HTML을 버퍼에 모았다가 한 번에 전송하므로
+요소(delta) 수가 줄어듭니다.
+
+버퍼는 HTML을 출력한 컨테이너(`with col:`, st.container(), st.tabs() 등)별로 따로 모으고,
+출력 위치가 다른 컨테이너로 바뀌면 먼저 모인 HTML을 원래 컨테이너에 전송합니다.
+(메인 영역 버퍼는 메인 영역이 다시 활성일 때 전송 - st.markdown은 항상 활성 컨테이너에 그려짐)
+위젯이나 컨테이너(st.columns, st.container 등)를 만들기 전에는 flush_html()로
+버퍼를 비워야 같은 컨테이너 안의 순서가 유지됩니다. studio_ui 컴포넌트는 내부에서
+이를 처리하며, 배치 안에서 직접 위젯/컨테이너를 호출할 때만 필요합니다.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import streamlit as st
+
+from .compat import active_container
+
+# 스크립트 스레드별 배치 버퍼 (Streamlit은 세션마다 별도 스레드에서 실행)
+_local = threading.local()
+
+# id(컨테이너) → (컨테이너, HTML 조각) - 출력한 순서대로
+_Buffers = Dict[int, Tuple[Any, List[str]]]
+
+
+def _buffers() -> Optional[_Buffers]:
+    return getattr(_local, "buffers", None)
+
+
+def _compact(parts: List[str]) -> str:
+    # 조각마다 들여쓰기가 달라도 마크다운 코드 블록으로 해석되지 않도록
+    # 줄 앞 공백과 빈 줄을 제거 (HTML에서는 의미 없는 공백)
+    return "\n".join(
+        line.strip() for part in parts for line in part.splitlines() if line.strip()
+    )
+
+
+def _send(buffers: _Buffers, active: Any) -> None:
+    """지금 쓸 수 있는 컨테이너의 버퍼를 전송 (메인 영역은 활성일 때만)"""
+    main = st._main
+    for ident, (container, parts) in list(buffers.items()):
+        if container is main and active is not main:
+            continue
+        container.markdown(_compact(parts), unsafe_allow_html=True)
+        del buffers[ident]
+
+
+def emit_html(html: str) -> None:
+    """
+    HTML 출력 (배치 중이면 활성 컨테이너의 버퍼에 추가, 아니면 즉시 st.markdown)
+
+    Args:
+        html: 출력할 HTML
+    """
+    buffers = _buffers()
+    if buffers is None:
+        st.markdown(html, unsafe_allow_html=True)
+        return
+    container = active_container()
+    if container is not _local.container:
+        # 다른 컨테이너로 옮겨 옴 → 이전 컨테이너에 모인 HTML을 제자리에 전송
+        _send(buffers, container)
+        _local.container = container
+    entry = buffers.get(id(container))
+    if entry is None:
+        entry = buffers[id(container)] = (container, [])
+    entry[1].append(html)
+
+
+def flush_html() -> None:
+    """배치 버퍼에 모인 HTML을 컨테이너마다 하나의 요소로 전송 (위젯/컨테이너 생성 전에 호출)"""
+    buffers = _buffers()
+    if buffers:
+        _send(buffers, active_container())
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """
+    HTML 출력 배치 컨텍스트
+
+    블록 안에서 studio_ui 컴포넌트가 출력한 HTML을 모아, 같은 컨테이너에서 사이에 위젯이 없는
+    구간마다 하나의 요소로 전송합니다. 중첩되면 가장 바깥 배치에 합류합니다.
+
+    Example:
+        >>> with studio_ui.batch():
+        ...     section_label("PRICING")
+        ...     section_title("요금제", subtitle="필요한 만큼만 선택하세요")
+        ...     pricing_grid(plans)
+    """
+    if _buffers() is not None:
+        yield
+        return
+
+    _local.buffers = {}
+    _local.container = None
+    completed = False
+    try:
+        yield
+        completed = True
+    finally:
+        # 리런/중단 예외로 빠져나가면 버퍼는 버림
+        if completed:
+            flush_html()
+        _local.buffers = None
+        _local.container = None
@@ -0,0 +1,145 @@
+"""
+studio_ui/core/state.py
+콜백 기반 상태 갱신 + 컴포넌트별 실행 카운터
+
+상호작용 컴포넌트는 위젯의 on_click 콜백에서 session_state를 바꿉니다.
+콜백은 클릭으로 인한 재실행이 시작되기 전에 실행되므로
+"클릭 → 상태 변경 → st.rerun()"처럼 스크립트를 한 번 더 실행할 필요가 없습니다.
+
+실행 카운터 (컴포넌트 이름별):
+    runs              컴포넌트가 렌더링된 실행 수 (한 실행에서 여러 번 렌더링해도 1)
+    interactions      콜백 실행 수 (클릭 등)
+    interaction_runs  상호작용 후 다음 상호작용 전까지 렌더링된 실행 수
+→ runs_per_interaction = interaction_runs / interactions (다른 위젯 조작이 없으면 1.0)
+"""
+import threading
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Literal, Optional
+
+import streamlit as st
+
+_SESSION_KEY = "_studio_ui_component_stats"
+
+
+@dataclass
+class ComponentStats:
+    """컴포넌트 실행/상호작용 카운터"""
+    runs: int = 0
+    interactions: int = 0
+    interaction_runs: int = 0
+    # 마지막 상호작용 이후 실행을 interaction_runs에 집계하는 중인지 여부
+    open: bool = field(default=False, repr=False, compare=False)
+    # 마지막으로 집계한 실행의 식별자 (styles._run_registry와 같은 ctx.cursors)
+    last_run: Any = field(default=None, repr=False, compare=False)
+
+    @property
+    def runs_per_interaction(self) -> float:
+        return self.interaction_runs / self.interactions if self.interactions else 0.0
+
+
+# 프로세스 전체 합계 (모든 세션)
+_process_stats: Dict[str, ComponentStats] = {}
+_process_lock = threading.Lock()
+
+
+def _session_stats() -> Dict[str, ComponentStats]:
+    stats = st.session_state.get(_SESSION_KEY)
+    if stats is None:
+        stats = st.session_state[_SESSION_KEY] = {}
+    return stats
+
+
+def _run_marker() -> Any:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return ctx.cursors if ctx is not None else None
+
+
+def _record(component: str, interaction: bool) -> None:
+    session = _session_stats()
+    current = session.get(component)
+    if current is None:
+        current = session[component] = ComponentStats()
+
+    if not interaction:
+        marker = _run_marker()
+        if marker is not None and current.last_run is marker:
+            return
+        current.last_run = marker
+
+    with _process_lock:
+        total = _process_stats.get(component)
+        if total is None:
+            total = _process_stats[component] = ComponentStats()
+
+        if interaction:
+            # 새 상호작용: 다른 컴포넌트의 집계 구간은 닫음
+            for other in session.values():
+                other.open = False
+            current.interactions += 1
+            total.interactions += 1
+            current.open = True
+        else:
+            current.runs += 1
+            total.runs += 1
+            if current.open:
+                current.interaction_runs += 1
+                total.interaction_runs += 1
+
+
+def track_run(component: str) -> None:
+    """컴포넌트 렌더링 1회 기록 (컴포넌트 함수에서 호출)"""
+    _record(component, interaction=False)
+
+
+def on_interaction(
+    component: str,
+    updates: Optional[Dict[str, Any]] = None,
+    callback: Optional[Callable[[], Any]] = None,
+) -> None:
+    """
+    위젯 on_click 콜백: 상호작용 기록 → session_state 갱신 → 사용자 콜백
+
+    Args:
+        component: 카운터 이름 (예: "tab_selector")
+        updates: session_state에 반영할 값 {키: 값}
+        callback: 이어서 호출할 사용자 콜백
+
+    Example:
+        >>> st.button("다음", on_click=on_interaction, args=("pager", {"page": 2}))
+    """
+    _record(component, interaction=True)
+    if updates:
+        for state_key, value in updates.items():
+            st.session_state[state_key] = value
+    if callback is not None:
+        callback()
+
+
+def component_stats(
+    scope: Literal["session", "process"] = "session",
+) -> Dict[str, ComponentStats]:
+    """
+    컴포넌트별 실행 카운터 (복사본)
+
+    Args:
+        scope: "session"은 현재 세션, "process"는 모든 세션 합계
+
+    Example:
+        >>> stats = component_stats()["tab_selector"]
+        >>> st.caption(f"상호작용당 실행 {stats.runs_per_interaction:.1f}회")
+    """
+    if scope == "process":
+        with _process_lock:
+            return {name: replace(s) for name, s in _process_stats.items()}
+    return {name: replace(s) for name, s in _session_stats().items()}
+
+
+def reset_component_stats(scope: Literal["session", "process"] = "session") -> None:
+    """실행 카운터 초기화"""
+    if scope == "process":
+        with _process_lock:
+            _process_stats.clear()
+    else:
+        st.session_state[_SESSION_KEY] = {}
@@ -0,0 +1,106 @@
+"""
+studio_ui/core/static.py
+정적 파일 서빙(app/static) 기반 에셋 배포 유틸리티
+
+Streamlit의 static file serving(server.enableStaticServing)을 사용해
+콘텐츠 해시가 붙은 파일을 앱 폴더의 static/ 아래에 기록합니다.
+파일명이 내용에 따라 바뀌므로 브라우저 캐시를 안전하게 재사용할 수 있습니다.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import streamlit as st
+
+# Streamlit이 static/ 폴더를 서빙하는 URL 접두사 (페이지 기준 상대 경로)
+STATIC_URL_PREFIX = "app/static"
+
+# 에셋을 기록할 static/ 하위 폴더
+ASSET_SUBDIR = "studio_ui"
+
+# (폴더, 파일명) → URL 메모 (같은 에셋을 프로세스당 한 번만 기록)
+_PUBLISHED: Dict[Tuple[str, str], str] = {}
+_PUBLISH_LOCK = threading.Lock()
+
+
+def static_serving_enabled() -> bool:
+    """server.enableStaticServing 설정 여부"""
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def default_static_dir() -> Path:
+    """
+    현재 앱의 static/ 폴더 경로
+
+    Streamlit은 메인 스크립트와 같은 폴더의 static/을 서빙합니다.
+    스크립트 경로를 알 수 없으면 현재 작업 폴더 기준으로 계산합니다.
+    """
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    main_script = getattr(ctx, "main_script_path", None) if ctx else None
+    base = Path(main_script).parent if main_script else Path.cwd()
+    return base / "static"
+
+
+def content_digest(data: bytes, length: int = 12) -> str:
+    """콘텐츠 해시 (파일명용, 프로세스 간 안정적)"""
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+def publish_asset(
+    content: Union[str, bytes],
+    stem: str,
+    suffix: str,
+    static_dir: Optional[Union[str, Path]] = None,
+) -> str:
+    """
+    콘텐츠 해시 파일로 에셋을 static/ 폴더에 기록하고 URL 반환
+
+    이미 같은 내용의 파일이 있으면 다시 쓰지 않습니다.
+    여러 워커 프로세스가 동시에 기록해도 안전하도록 임시 파일 + rename으로 씁니다.
+
+    Args:
+        content: 파일 내용
+        stem: 파일명 접두사 (예: "theme")
+        suffix: 확장자 (예: ".css")
+        static_dir: static 폴더 경로 (기본: 앱의 static/)
+
+    Returns:
+        페이지 기준 상대 URL (예: "app/static/studio_ui/theme-1a2b3c4d5e6f.css")
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    filename = f"{stem}-{content_digest(data)}{suffix}"
+    root = Path(static_dir) if static_dir is not None else default_static_dir()
+    memo_key = (str(root), filename)
+
+    url = _PUBLISHED.get(memo_key)
+    if url is not None:
+        return url
+
+    with _PUBLISH_LOCK:
+        url = _PUBLISHED.get(memo_key)
+        if url is None:
+            target_dir = root / ASSET_SUBDIR
+            target = target_dir / filename
+            if not target.exists():
+                target_dir.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=target_dir, prefix=".tmp-")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(data)
+                    os.chmod(tmp_path, 0o644)
+                    os.replace(tmp_path, target)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                    raise
+            url = f"{STATIC_URL_PREFIX}/{ASSET_SUBDIR}/{filename}"
+            _PUBLISHED[memo_key] = url
+    return url
@@ -13,31 +13,40 @@ studio_ui/core/styles.py
 - 컨테이너 스타일 (border=True)
 - 버튼 스타일 (Primary/Secondary)
 """
+import hashlib
 import streamlit as st
-from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Literal, Optional, Sequence, Set, Tuple, Union
 from .theme import Theme, DEFAULT_THEME
+from .registry import THEME_REGISTRY
+from .compat import current_fragment_id
+from .fonts import GOOGLE_FONTS_IMPORT, FontFace, load_fonts, set_session_fonts
+from .static import publish_asset, static_serving_enabled
 
 
-def apply_theme(theme: Optional[Theme] = None) -> None:
-    """
-    테마를 Streamlit 앱에 적용
+# 스타일시트 프로필
+#   - "full": 기존 앱과 동일한 강제 적용 스타일 (기본)
+#   - "lean": 같은 룩을 상속/:where()/contain으로 구현한 경량 스타일
+StyleProfile = Literal["full", "lean"]
 
-    Args:
-        theme: 적용할 테마 (기본: DEFAULT_THEME)
+# (테마 지문, 프로필, static 폴더, 웹 폰트 대체) → 배포된 스타일시트 URL
+_PUBLISHED_STYLESHEETS: Dict[Tuple[str, str, str, bool], str] = {}
 
-    Example:
-        >>> from studio_ui import apply_theme
-        >>> apply_theme()  # 기본 테마 적용
 
-        >>> from studio_ui import apply_theme, DARK_THEME
-        >>> apply_theme(DARK_THEME)  # 다크 테마 적용
-    """
-    # 매 리런마다 CSS 주입 필요 (Streamlit은 매번 페이지를 재구성)
-    theme = theme or DEFAULT_THEME
+def _font_css(theme: Theme, web_fonts: bool) -> str:
+    """스타일시트 맨 앞의 폰트 규칙 (자체 호스팅 @font-face, 없으면 Google Fonts @import)"""
+    if theme.fonts:
+        return theme.font_face_css()
+    return GOOGLE_FONTS_IMPORT if web_fonts else ""
+
 
-    css = f"""
+def _build_stylesheet(theme: Theme, web_fonts: bool = False) -> str:
+    """테마로부터 전체 스타일시트 문자열 생성 (캐시 없이 매번 포맷)"""
+    return f"""
     <style>
-    @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;500;600;700&display=swap');
+    {_font_css(theme, web_fonts)}
 
     {theme.to_css_vars()}
 
@@ -537,23 +546,568 @@ def apply_theme(theme: Optional[Theme] = None) -> None:
     </style>
     """
 
-    st.markdown(css, unsafe_allow_html=True)
+
+def _build_lean_stylesheet(theme: Theme, web_fonts: bool = False) -> str:
+    """
+    lean 프로필 스타일시트 생성
+
+    full 프로필과 같은 룩을 유지하면서 스타일 재계산 비용이 큰 패턴을 제거:
+    - 전체 선택자(`.stApp *`, `[data-testid=...] *`)와 광범위 태그 목록 대신
+      .stApp에 색상을 지정하고 CSS 상속으로 전파
+    - 기본값 성격의 규칙은 :where()로 감싸 명시도 0으로 유지 (!important 최소화)
+    - 무거운 블록에 contain / content-visibility 힌트
+    - 트랜지션은 컴포지터 전용 속성(transform, opacity)만 사용
+    """
+    return f"""
+    <style>
+    {_font_css(theme, web_fonts)}
+
+    {theme.to_css_vars()}
+
+    /* ============================================
+       다크모드 비활성화 - Streamlit 테마 변수 오버라이드
+       ============================================ */
+    :root, [data-theme="dark"], [data-theme="light"] {{
+        color-scheme: light only;
+        --primary-color: var(--primary);
+        --background-color: var(--bg-main);
+        --secondary-background-color: var(--bg-card);
+        --text-color: var(--fg-primary);
+    }}
+
+    /* ============================================
+       기본 폰트 및 텍스트 - 상속으로 전파
+       ============================================ */
+    html, body, .stApp {{
+        font-family: 'Noto Sans KR', -apple-system, BlinkMacSystemFont, sans-serif;
+        color: var(--fg-primary);
+        background: var(--bg-main) !important;
+    }}
+
+    /* Streamlit 텍스트 컨테이너는 부모 색상을 상속 */
+    .stApp [data-testid="stMarkdownContainer"],
+    .stApp [data-testid="stText"],
+    .stApp [data-testid="stWidgetLabel"],
+    .stApp [data-testid="stCaptionContainer"] {{
+        color: inherit;
+    }}
+
+    :where(.stApp) :where(p, li, td, th, label, a) {{
+        color: inherit;
+    }}
+
+    :where(.stApp) :where(h1, h2, h3, h4, h5, h6) {{
+        color: var(--fg-primary);
+        font-weight: 700;
+    }}
+
+    .stApp [data-testid="stAlert"] [data-testid="stMarkdownContainer"] {{
+        color: inherit;
+    }}
+
+    /* ============================================
+       앱 레이아웃
+       ============================================ */
+    .stApp {{ margin-top: -90px; }}
+
+    .main .block-container {{
+        padding: 0 1.5rem 2rem;
+        max-width: 1100px;
+        margin: 0 auto;
+    }}
+
+    #MainMenu, footer, header {{ visibility: hidden; height: 0 !important; }}
+    .stDeployButton {{ display: none; }}
+
+    /* 큰 블록은 레이아웃/페인트 영향 범위를 자체 영역으로 제한 */
+    .stApp [data-testid="stVerticalBlockBorderWrapper"],
+    .stApp .stFileUploader,
+    .stApp [data-testid="stCode"] {{
+        contain: layout paint style;
+    }}
+
+    /* 화면 밖 탭 패널/익스팬더 본문은 렌더링 지연 */
+    .stApp [data-baseweb="tab-panel"],
+    .stApp [data-testid="stExpanderDetails"] {{
+        content-visibility: auto;
+        contain-intrinsic-size: auto 480px;
+    }}
+
+    /* ============================================
+       버튼
+       ============================================ */
+    .stApp .stButton > button,
+    .stApp button[data-testid^="stBaseButton"] {{
+        color: var(--fg-primary);
+        background: var(--bg-card);
+        border: 1px solid var(--border-light);
+        border-radius: var(--radius-full);
+        padding: 0.75rem 2rem;
+        font-weight: 600;
+        transition: transform var(--transition-normal), opacity var(--transition-normal);
+    }}
+
+    .stApp .stButton > button p {{
+        color: inherit;
+    }}
+
+    .stApp button[kind="primary"],
+    .stApp button[data-testid="stBaseButton-primary"] {{
+        background: linear-gradient(135deg, var(--primary), var(--primary-dark));
+        color: white;
+        border: none;
+        box-shadow: var(--shadow-md);
+    }}
+
+    .stApp button[kind="primary"]:hover,
+    .stApp button[data-testid="stBaseButton-primary"]:hover {{
+        transform: translateY(-2px);
+        box-shadow: var(--shadow-lg);
+        color: white;
+    }}
+
+    .stApp button[kind="secondary"]:hover,
+    .stApp button[data-testid="stBaseButton-secondary"]:hover {{
+        border-color: var(--primary);
+        color: var(--primary);
+        background: var(--bg-muted);
+    }}
+
+    /* ============================================
+       입력 필드
+       ============================================ */
+    .stApp [data-testid="stTextInput"] > div {{
+        background: var(--bg-muted);
+    }}
+
+    .stApp [data-testid="stTextInput"] input {{
+        background: var(--bg-muted);
+        border: 1px solid var(--border-light);
+        border-radius: 8px;
+        padding: 0.875rem 1rem;
+        font-size: 0.875rem;
+        color: var(--fg-primary);
+    }}
+
+    .stApp [data-testid="stTextInput"] input:focus {{
+        border-color: var(--primary);
+        box-shadow: 0 0 0 3px rgba(201,168,124,0.2);
+        outline: none;
+    }}
+
+    .stApp [data-testid="stTextInput"] input::placeholder {{
+        color: #8a7d6d;
+    }}
+
+    .stApp [data-testid="stWidgetLabel"] {{
+        font-weight: 500;
+    }}
+
+    /* ============================================
+       탭 (Tabs)
+       ============================================ */
+    .stTabs [data-baseweb="tab-list"] {{
+        gap: 0.5rem;
+        background: transparent;
+    }}
+
+    .stTabs [data-baseweb="tab"] {{
+        background: var(--bg-card);
+        border: 1px solid var(--border-light);
+        border-radius: var(--radius-md);
+        color: var(--fg-secondary);
+        padding: 0.75rem 1.5rem;
+        font-weight: 500;
+    }}
+
+    .stTabs [data-baseweb="tab"]:hover {{
+        color: var(--primary);
+        border-color: var(--primary);
+    }}
+
+    .stTabs [data-baseweb="tab"][aria-selected="true"] {{
+        background: linear-gradient(135deg, var(--primary), var(--primary-dark));
+        color: white;
+        border-color: var(--primary);
+    }}
+
+    .stTabs [data-baseweb="tab"] p {{
+        color: inherit;
+    }}
+
+    .stTabs [data-baseweb="tab-highlight"],
+    .stTabs [data-baseweb="tab-border"] {{
+        display: none;
+    }}
+
+    /* ============================================
+       Selectbox
+       ============================================ */
+    .stSelectbox [data-baseweb="select"] > div {{
+        background: var(--bg-card);
+        border-color: var(--border-light);
+        border-radius: var(--radius-md);
+        color: var(--fg-primary);
+    }}
+
+    /* ============================================
+       알림 메시지
+       ============================================ */
+    .stApp [data-testid="stAlert"] {{
+        border-radius: var(--radius-md);
+    }}
+
+    /* ============================================
+       코드 블록
+       ============================================ */
+    .stApp [data-testid="stCode"],
+    .stApp pre,
+    .stApp code {{
+        background: #f8f5f0;
+        border: 1px solid var(--border-light);
+        border-radius: 8px;
+    }}
+
+    .stApp [data-testid="stCode"] pre {{
+        padding: 1rem;
+    }}
+
+    .stApp [data-testid="stCode"] code {{
+        color: var(--fg-secondary);
+        background: transparent;
+        border: none;
+    }}
+
+    .stApp .token.comment, .stApp .token.operator {{ color: var(--fg-muted); }}
+    .stApp .token.keyword {{ color: var(--primary); font-weight: 600; }}
+    .stApp .token.string {{ color: #6b8e6b; }}
+    .stApp .token.function {{ color: #7a6b5a; }}
+    .stApp .token.punctuation {{ color: var(--fg-secondary); }}
+
+    /* ============================================
+       구분선
+       ============================================ */
+    :where(.stApp) :where(hr) {{
+        border-color: var(--border-light);
+    }}
+
+    /* ============================================
+       File Uploader
+       ============================================ */
+    .stApp .stFileUploader {{
+        margin: 0.5rem 0;
+    }}
+
+    .stApp .stFileUploader > div,
+    .stApp [data-testid="stFileUploaderDropzone"] {{
+        background: linear-gradient(135deg, var(--bg-muted) 0%, #f5f0ea 100%);
+        border: 2px dashed var(--primary);
+        border-radius: 12px;
+        padding: 2rem 1.5rem;
+        box-shadow: inset 0 2px 8px rgba(201,168,124,0.08);
+    }}
+
+    .stApp .stFileUploader > div:hover {{
+        border-color: var(--primary-dark);
+    }}
+
+    .stApp .stFileUploader {{
+        color: #6b5a4a;
+    }}
+
+    .stApp [data-testid="stFileUploaderDropzoneInstructions"] {{
+        color: var(--fg-muted);
+        font-weight: 500;
+    }}
+
+    .stApp .stFileUploader button {{
+        background: linear-gradient(135deg, var(--primary), var(--primary-dark));
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0.5rem 1.25rem;
+        font-weight: 600;
+        box-shadow: 0 2px 8px rgba(201,168,124,0.3);
+        transition: transform var(--transition-normal);
+    }}
+
+    .stApp .stFileUploader button:hover {{
+        transform: translateY(-1px);
+    }}
+
+    .stApp [data-testid="stFileUploaderFile"] {{
+        background: var(--bg-card);
+        border: 1px solid var(--border-light);
+        border-radius: 8px;
+        padding: 0.5rem;
+    }}
+
+    /* ============================================
+       Popover / JSON
+       ============================================ */
+    [data-testid="stPopover"], .stJson {{
+        background: var(--bg-card);
+        border: 1px solid var(--border-light);
+        border-radius: 12px;
+    }}
+
+    /* ============================================
+       Container with border (st.container(border=True))
+       ============================================ */
+    .stApp [data-testid="stVerticalBlockBorderWrapper"] {{
+        background: var(--bg-card);
+        border: 1px solid var(--border-light);
+        border-radius: 16px;
+        padding: 1.5rem;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.04);
+    }}
+    </style>
+    """
+
+_BUILDERS = {
+    "full": _build_stylesheet,
+    "lean": _build_lean_stylesheet,
+}
+
+
+def compile_stylesheet(
+    theme: Optional[Theme] = None,
+    profile: StyleProfile = "full",
+    web_fonts: bool = False,
+) -> str:
+    """
+    테마 스타일시트를 컴파일 (프로세스당 테마·프로필별 1회만 포맷)
+
+    결과는 테마 지문(Theme.fingerprint) 기준으로 테마 레지스트리의 LRU에
+    캐시되므로 모든 세션의 리런은 캐시된 문자열을 재사용합니다.
+    (메모리 상한: THEME_REGISTRY.max_artifact_bytes)
+
+    Args:
+        theme: 컴파일할 테마 (기본: DEFAULT_THEME)
+        profile: 스타일시트 프로필 ("full" | "lean")
+        web_fonts: 테마에 자체 호스팅 폰트가 없으면 Google Fonts @import를 넣음
+
+    Returns:
+        <style> 태그를 포함한 CSS 문자열
+    """
+    if profile not in _BUILDERS:
+        raise ValueError(f"알 수 없는 스타일 프로필: {profile!r} (full, lean 중 선택)")
+    theme = theme or DEFAULT_THEME
+    return THEME_REGISTRY.artifact(
+        theme, ("stylesheet", profile, web_fonts), lambda: _BUILDERS[profile](theme, web_fonts)
+    )
+
+
+def clear_stylesheet_cache() -> None:
+    """컴파일된 스타일시트 캐시 비우기 (테스트/핫 리로드용)"""
+    THEME_REGISTRY.clear_artifacts()
+    _PUBLISHED_STYLESHEETS.clear()
+
+
+def publish_stylesheet(
+    theme: Optional[Theme] = None,
+    static_dir: Optional[Union[str, Path]] = None,
+    profile: StyleProfile = "full",
+    web_fonts: bool = False,
+) -> str:
+    """
+    컴파일된 스타일시트를 콘텐츠 해시 .css 파일로 static/ 폴더에 기록
+
+    Args:
+        theme: 기록할 테마 (기본: DEFAULT_THEME)
+        static_dir: static 폴더 경로 (기본: 앱의 static/)
+        profile: 스타일시트 프로필 ("full" | "lean")
+        web_fonts: 테마에 자체 호스팅 폰트가 없으면 Google Fonts @import를 넣음
+
+    Returns:
+        스타일시트 URL (예: "app/static/studio_ui/theme-1a2b3c4d5e6f.css")
+    """
+    theme = theme or DEFAULT_THEME
+    memo_key = (theme.fingerprint(), profile, str(static_dir), web_fonts)
+
+    url = _PUBLISHED_STYLESHEETS.get(memo_key)
+    if url is None:
+        html = compile_stylesheet(theme, profile, web_fonts)
+        css = html[html.index("<style>") + len("<style>"):html.rindex("</style>")]
+        url = publish_asset(css.strip(), stem="theme", suffix=".css", static_dir=static_dir)
+        _PUBLISHED_STYLESHEETS[memo_key] = url
+    return url
+
+
+def apply_theme(
+    theme: Optional[Theme] = None,
+    delivery: Literal["inline", "static"] = "inline",
+    static_dir: Optional[Union[str, Path]] = None,
+    profile: StyleProfile = "full",
+    fonts: Union[Literal["auto"], Sequence[FontFace], None] = "auto",
+) -> None:
+    """
+    테마를 Streamlit 앱에 적용
+
+    Args:
+        theme: 적용할 테마 (기본: DEFAULT_THEME)
+        delivery: 스타일시트 전달 방식
+            - "inline": 매 리런마다 <style>을 st.markdown으로 전송 (기본)
+            - "static": 콘텐츠 해시 .css 파일을 static 서빙으로 제공하고,
+              공용 iframe 컴포넌트가 문서 <head>에 한 번만 붙임 (리런당 수백 바이트)
+              server.enableStaticServing = true 필요 (꺼져 있으면 inline으로 동작)
+        static_dir: static 모드에서 사용할 static 폴더 (기본: 앱의 static/)
+        profile: 스타일시트 프로필
+            - "full": 전체 선택자 + !important 강제 적용 (기본, 기존 동작)
+            - "lean": 같은 룩을 상속 CSS 변수, :where() 규칙, contain 힌트,
+              컴포지터 전용 트랜지션으로 구현 (큰 페이지의 스타일 재계산 비용 절감)
+        fonts: 자체 호스팅 폰트 (core/fonts.py)
+            - "auto": static 서빙이 켜져 있고 build_fonts 매니페스트가 있으면 사용 (기본),
+              둘 중 하나라도 없으면 Google Fonts @import로 대체 (이전 동작, 외부망 필요)
+            - FontFace 목록: 지정한 폰트 사용
+            - None: 사용하지 않음 (시스템 폰트, 외부 요청 없음)
+            테마에 이미 폰트(Theme.fonts)가 있으면 그대로 사용합니다.
+
+    Example:
+        >>> from studio_ui import apply_theme
+        >>> apply_theme()  # 기본 테마 적용
+
+        >>> from studio_ui import apply_theme, DARK_THEME
+        >>> apply_theme(DARK_THEME)  # 다크 테마 적용
+
+        >>> apply_theme(delivery="static")  # .streamlit/config.toml에 enableStaticServing 필요
+
+        >>> apply_theme(profile="lean")  # 경량 선택자 프로필
+    """
+    if delivery not in ("inline", "static"):
+        raise ValueError(f"알 수 없는 전달 방식: {delivery!r} (inline, static 중 선택)")
+    theme = theme or DEFAULT_THEME
+    web_fonts = False
+    if fonts == "auto":
+        fonts = load_fonts(static_dir) if static_serving_enabled() else ()
+        # 쓸 수 있는 로컬 폰트가 없으면 Noto Sans KR이 빠지지 않도록 CDN @import 유지
+        web_fonts = not fonts
+    if fonts and not theme.fonts:
+        theme = theme.with_fonts(fonts)
+    # iframe 컴포넌트는 페이지의 @font-face를 공유하지 않으므로 같은 폰트를 args로 전달
+    set_session_fonts(theme.fonts)
+
+    if delivery == "static" and static_serving_enabled():
+        from .frontend import studio_component
+
+        # 공용 iframe 번들의 stylesheet 렌더러가 부모 문서 <head>에 <style>을 한 번만 붙이고
+        # 테마가 바뀌면 내용만 교체 (인자는 테마가 바뀔 때만 달라지므로 같은 iframe 유지)
+        href = publish_stylesheet(theme, static_dir=static_dir, profile=profile, web_fonts=web_fonts)
+        studio_component("stylesheet", key="studio_ui_theme", href=href, height=0)
+        return
+
+    # 매 리런마다 CSS 주입 필요 (Streamlit은 매번 페이지를 재구성)
+    # 스타일시트 포맷은 테마별로 한 번만 수행하고 이후에는 캐시 재사용
+    st.markdown(compile_stylesheet(theme, profile, web_fonts), unsafe_allow_html=True)
+
+
+@dataclass
+class CssRunStats:
+    """한 스크립트 실행(run) 동안의 컴포넌트 CSS 주입 통계"""
+    requested_blocks: int = 0  # inject_css 호출 수 (레지스트리 도입 전 <style> 요소 수)
+    requested_bytes: int = 0   # inject_css로 요청된 CSS 바이트 합계
+    unique_blocks: int = 0     # 내용 해시 기준 중복 제거 후 블록 수
+    emitted_elements: int = 0  # 실제로 생성한 <style> 요소 수 (새 블록당 1, css_run_stats 참고)
+    emitted_bytes: int = 0     # 실제로 전송한 바이트 (블록마다 한 번만 전송)
+
+
+class _CssRunRegistry:
+    """스크립트 실행 단위 CSS 레지스트리 (세션의 ScriptRunContext에 보관)"""
+
+    def __init__(self, run_marker: object):
+        self.run_marker = run_marker
+        # 프래그먼트 밖에서 보낸 블록 (프래그먼트 재실행에도 화면에 남음)
+        self.blocks: Dict[str, str] = {}
+        # 프래그먼트 안에서 보낸 블록 (프래그먼트 재실행 시 함께 지워지므로 프래그먼트별로 관리)
+        self.fragment_blocks: Dict[str, Set[str]] = {}
+        self.stats = CssRunStats()
+
+    def register(self, css: str) -> None:
+        self.stats.requested_blocks += 1
+        self.stats.requested_bytes += len(css.encode("utf-8"))
+
+        digest = _css_digest(css)
+        if digest in self.blocks:
+            return
+        fragment_id = current_fragment_id()
+        if fragment_id is None:
+            self.blocks[digest] = css
+        else:
+            emitted = self.fragment_blocks.setdefault(fragment_id, set())
+            if digest in emitted:
+                return
+            emitted.add(digest)
+        self.stats.unique_blocks += 1
+
+        # 새 블록만 자기 <style> 요소로 한 번 전송 (이미 보낸 블록을 다시 보내지 않음)
+        body = f"<style>{css}</style>"
+        self.stats.emitted_elements += 1
+        self.stats.emitted_bytes += len(body.encode("utf-8"))
+        st.markdown(body, unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=512)
+def _css_digest(css: str) -> str:
+    """CSS 내용 해시 (hash()와 달리 프로세스 간 안정적)"""
+    return hashlib.sha1(css.encode("utf-8")).hexdigest()[:16]
+
+
+def _run_registry() -> Optional[_CssRunRegistry]:
+    """현재 스크립트 실행의 CSS 레지스트리 (Streamlit 런타임 밖이면 None)"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+
+    # ScriptRunContext는 세션 동안 재사용되고 실행(프래그먼트 실행 포함)마다
+    # cursors를 새 dict로 교체하므로 이를 실행 식별자로 사용
+    # (widget_ids_this_run은 최근 버전에서 제자리 clear()되어 식별자로 쓸 수 없음)
+    run_marker = ctx.cursors
+    registry = getattr(ctx, "_studio_ui_css_registry", None)
+    if registry is None or registry.run_marker is not run_marker:
+        registry = _CssRunRegistry(run_marker)
+        ctx._studio_ui_css_registry = registry
+    return registry
+
+
+def css_run_stats() -> CssRunStats:
+    """
+    현재 스크립트 실행의 CSS 주입 통계
+
+    실행당 <style> 요소 하나로 합치지 않고, 처음 보는 블록마다 <style> 요소 하나를 보냅니다
+    (emitted_elements == unique_blocks). Streamlit에는 실행 종료 훅이 없어 합친 요소는 블록이
+    늘 때마다 통째로 다시 보내야 하고(실행당 전송량 O(N²)), 그 요소가 프래그먼트 안에서 처음 만들어지면
+    프래그먼트 재실행 때 바깥 컴포넌트의 CSS까지 함께 지워지기 때문입니다.
+    이미 보낸 블록은 다시 보내지 않으므로 실행당 전송량은 고유 CSS 크기에 비례합니다.
+
+    Example:
+        >>> stats = css_run_stats()
+        >>> st.caption(f"style 요소 {stats.requested_blocks} → {stats.emitted_elements}")
+    """
+    registry = _run_registry()
+    return registry.stats if registry is not None else CssRunStats()
 
 
 def inject_css(css: str, key: Optional[str] = None) -> None:
     """
-    CSS를 한 번만 주입 (중복 방지)
+    컴포넌트 CSS를 실행(run) 단위 레지스트리에 등록
+
+    같은 실행 안에서 등록된 CSS는 내용 해시로 중복 제거되어
+    처음 등록될 때 한 번만 전송됩니다. 프래그먼트 안에서 등록된 CSS는 프래그먼트 재실행 때
+    요소와 함께 지워지므로 프래그먼트마다 따로 중복 제거합니다.
 
     Args:
         css: 주입할 CSS 문자열
-        key: 중복 방지용 키 (None이면 CSS 해시 사용)
+        key: 식별용 라벨 (하위 호환용, 중복 판단은 CSS 내용 해시로 수행)
 
     Example:
         >>> inject_css('''
         ...     .my-class { color: red; }
         ... ''', key="my_styles")
     """
-    cache_key = f"_css_{key or hash(css)}"
-    if cache_key not in st.session_state:
+    registry = _run_registry()
+    if registry is None:
         st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
-        st.session_state[cache_key] = True
+        return
+    registry.register(css)
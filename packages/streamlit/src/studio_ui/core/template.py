@@ -0,0 +1,140 @@
+"""
+studio_ui/core/template.py
+사전 컴파일 HTML 템플릿 - 필드별 자동 이스케이프
+
+문법:
+    {{ name }}      HTML 이스케이프하여 삽입 (사용자 텍스트)
+    {{ name|num }}  숫자(int/float)는 이스케이프 없이 삽입 (그 밖의 값은 이스케이프)
+    {{ name|raw }}  그대로 삽입 (이미 렌더링된 HTML 조각, 코드에서 정한 CSS 값/클래스)
+
+템플릿은 모듈 import 시 한 번 컴파일됩니다.
+- 태그 사이(>와 <)의 줄바꿈 포함 공백은 제거, 그 밖의 줄바꿈 포함 공백은 공백 하나로 축약
+- 리터럴과 필드를 하나의 f-string으로 합친 렌더 함수 생성
+- 이스케이프는 특수문자가 없는 문자열/정수를 변환 없이 통과 (|num, |raw 필드는 검사 생략)
+"""
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+_FIELD_RE = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*(?:\|\s*(\w+)\s*)?\}\}")
+# 태그 사이의 서식용 공백 (줄바꿈 포함) → 제거
+_BOUNDARY_WS_RE = re.compile(r"(?<=>)\s*\n\s*(?=<)")
+# 그 밖의 줄바꿈 포함 공백 → 공백 하나
+_NEWLINE_WS_RE = re.compile(r"\s*\n\s*")
+
+_FILTERS = ("raw", "num")
+_SPECIAL_CHARS = ("&", "<", ">", '"', "'")
+
+
+def escape(value: Any) -> str:
+    """HTML 이스케이프 (None은 빈 문자열, 특수문자가 없는 문자열/정수는 변환만)"""
+    cls = value.__class__
+    if cls is not str:
+        if cls is int:
+            return str(value)
+        if value is None:
+            return ""
+        value = str(value)
+    if "&" in value or "<" in value or ">" in value or '"' in value or "'" in value:
+        return (
+            value.replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace(">", "&gt;")
+            .replace('"', "&quot;")
+            .replace("'", "&#x27;")
+        )
+    return value
+
+
+def _raw(value: Any) -> str:
+    if value.__class__ is str:
+        return value
+    return "" if value is None else str(value)
+
+
+def _num(value: Any) -> str:
+    cls = value.__class__
+    if cls is int or cls is float:
+        return str(value)
+    return escape(value)
+
+
+_FILTER_FUNCS = {"raw": "_r", "num": "_n"}
+
+
+def strip_whitespace(source: str) -> str:
+    """서식용 공백 제거 (<pre>/<textarea>가 없는 마크업 전제)"""
+    text = _BOUNDARY_WS_RE.sub("", source)
+    return _NEWLINE_WS_RE.sub(" ", text).strip()
+
+
+def _compile(source: str) -> Tuple[Callable[..., str], Tuple[str, ...]]:
+    """
+    템플릿 → (렌더 함수, 필드 이름 목록)
+
+    리터럴과 필드를 하나의 f-string으로 합친 키워드 전용 함수를 생성합니다.
+    예: def render(*, title): return f'<div>{_e(title)}</div>'
+    """
+    parts = _FIELD_RE.split(strip_whitespace(source))
+    literals: List[str] = parts[0::3]
+    names: List[str] = parts[1::3]
+    filters: List[str] = parts[2::3]
+
+    pieces = []
+    fast_pieces = []
+    for literal, name, flt in zip(literals, names, filters):
+        if flt and flt not in _FILTERS:
+            raise ValueError(f"알 수 없는 템플릿 필터: {flt!r} (사용 가능: {', '.join(_FILTERS)})")
+        literal = literal.replace("{", "{{").replace("}", "}}")
+        pieces += (literal, f"{{{_FILTER_FUNCS.get(flt, '_e')}({name})}}")
+        fast_pieces += (literal, f"{{{name}}}" if not flt else pieces[-1])
+    pieces.append(literals[-1].replace("{", "{{").replace("}", "}}"))
+    fast_pieces.append(pieces[-1])
+
+    fields = tuple(dict.fromkeys(names))
+    params = f"*, {', '.join(fields)}" if fields else ""
+    code = f"def render({params}):\n"
+    escaped = tuple(dict.fromkeys(name for name, flt in zip(names, filters) if not flt))
+    if escaped:
+        # 이스케이프 필드가 모두 str이고 특수문자가 없으면 _e 호출 없이 그대로 삽입
+        joined = " + ".join(escaped)
+        special = " or ".join(f"{ch!r} in _s" for ch in _SPECIAL_CHARS)
+        code += (
+            f"    if {' and '.join(f'{name}.__class__ is str' for name in escaped)}:\n"
+            f"        _s = {joined}\n"
+            f"        if not ({special}):\n"
+            f"            return f{''.join(fast_pieces)!r}\n"
+        )
+    code += f"    return f{''.join(pieces)!r}\n"
+    namespace: Dict[str, Any] = {"_e": escape, "_r": _raw, "_n": _num}
+    exec(compile(code, "<studio_ui.template>", "exec"), namespace)
+    return namespace["render"], fields
+
+
+class Template:
+    """
+    사전 컴파일 HTML 템플릿
+
+    Args:
+        source: 템플릿 문자열
+
+    Example:
+        >>> card = Template('''
+        ...     <div class="card">
+        ...         <div class="title">{{ title }}</div>
+        ...         {{ body|raw }}
+        ...     </div>
+        ... ''')
+        >>> card.render(title="A & B", body="<p>본문</p>")
+        '<div class="card"><div class="title">A &amp; B</div><p>본문</p></div>'
+    """
+
+    __slots__ = ("source", "fields", "render")
+
+    def __init__(self, source: str):
+        self.source = source
+        # render(**values): 필드 이름을 키워드 인자로 받는 생성 함수
+        # (누락/알 수 없는 필드는 TypeError)
+        self.render, self.fields = _compile(source)
+
+    def __repr__(self) -> str:
+        return f"Template(fields={self.fields!r})"
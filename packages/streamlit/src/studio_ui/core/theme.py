@@ -2,75 +2,153 @@
 studio_ui/core/theme.py
 CSS 변수 생성 및 테마 확장
 """
-from dataclasses import dataclass, field, replace
-from typing import Optional
-from .tokens import Colors, COLORS
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field, fields, replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Sequence, Tuple, TypeVar
+from .registry import THEME_REGISTRY
+from .tokens import (
+    Colors,
+    Typography,
+    Spacing,
+    Radius,
+    Shadow,
+    Transition,
+    COLORS,
+    TYPOGRAPHY,
+    SPACING,
+    RADIUS,
+    SHADOW,
+    TRANSITION,
+)
+
+if TYPE_CHECKING:
+    from .fonts import FontFace
+
+T = TypeVar("T")
+
+# 토큰 그룹 → CSS 변수 접두사 (필드명이 접두사로 시작하면 중복하지 않음)
+#   colors.bg_main → --bg-main, radius.sm → --radius-sm,
+#   typography.font_family → --font-family, typography.size_xs → --font-size-xs
+_CSS_VAR_GROUPS = (
+    ("colors", ""),
+    ("shadow", "shadow"),
+    ("radius", "radius"),
+    ("transition", "transition"),
+    ("typography", "font"),
+    ("spacing", "space"),
+)
+
 
+def _css_var_name(prefix: str, field_name: str) -> str:
+    name = field_name.replace("_", "-")
+    if not prefix or name.startswith(f"{prefix}-"):
+        return f"--{name}"
+    return f"--{prefix}-{name}"
 
-@dataclass
+
+@dataclass(frozen=True)
 class Theme:
-    """테마 클래스"""
+    """
+    테마 클래스 (불변, 해시 가능)
+
+    작은 파생 산출물(지문, CSS 변수 블록, JSON)은 인스턴스에 메모되어
+    테마 객체당 한 번만 계산됩니다. 컴파일된 스타일시트처럼 큰 산출물은
+    메모리 상한이 있는 테마 레지스트리(THEME_REGISTRY)에 보관됩니다.
+    """
     name: str = "studio"
-    colors: Colors = field(default_factory=lambda: COLORS)
+    colors: Colors = COLORS
+    typography: Typography = TYPOGRAPHY
+    spacing: Spacing = SPACING
+    radius: Radius = RADIUS
+    shadow: Shadow = SHADOW
+    transition: Transition = TRANSITION
+    # 자체 호스팅 폰트 (core/fonts.py) - 비어 있으면 시스템 폰트로 대체
+    fonts: Tuple["FontFace", ...] = ()
+    _artifacts: Dict[Hashable, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False, hash=False
+    )
+
+    def memo(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        파생 산출물을 인스턴스에 메모
+
+        Args:
+            key: 산출물 키
+            factory: 최초 1회 호출되는 생성 함수
+
+        Returns:
+            메모된 산출물
+        """
+        try:
+            return self._artifacts[key]
+        except KeyError:
+            value = self._artifacts[key] = factory()
+            return value
+
+    def tokens(self) -> Dict[str, Dict[str, Any]]:
+        """토큰 그룹별 값 딕셔너리"""
+        return {group: asdict(getattr(self, group)) for group, _ in _CSS_VAR_GROUPS}
+
+    def fingerprint(self) -> str:
+        """
+        테마 내용 기반 지문 (프로세스/재시작 간에도 동일)
+
+        이름이 아닌 스타일에 영향을 주는 토큰 값만으로 계산하므로
+        내용이 같은 테마는 같은 지문을 가집니다.
+        """
+        return self.memo("fingerprint", self._build_fingerprint)
+
+    def _build_fingerprint(self) -> str:
+        tokens: Dict[str, Any] = self.tokens()
+        if self.fonts:
+            tokens["fonts"] = [asdict(face) for face in self.fonts]
+        payload = json.dumps(tokens, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
     def to_css_vars(self) -> str:
-        """CSS 변수로 변환"""
-        c = self.colors
+        """CSS 변수로 변환 (모든 토큰 그룹을 필드 순회로 생성)"""
+        return self.memo("css_vars", self._build_css_vars)
+
+    def _build_css_vars(self) -> str:
+        lines = []
+        for group, prefix in _CSS_VAR_GROUPS:
+            tokens = getattr(self, group)
+            lines.append(f"            /* {group} */")
+            for f in fields(tokens):
+                lines.append(f"            {_css_var_name(prefix, f.name)}: {getattr(tokens, f.name)};")
+        body = "\n".join(lines)
         return f"""
         :root {{
-            /* 배경 */
-            --bg-main: {c.bg_main};
-            --bg-card: {c.bg_card};
-            --bg-muted: {c.bg_muted};
-            --bg-dark: {c.bg_dark};
-
-            /* 텍스트 */
-            --fg-primary: {c.fg_primary};
-            --fg-secondary: {c.fg_secondary};
-            --fg-muted: {c.fg_muted};
-
-            /* 액센트 */
-            --primary: {c.primary};
-            --primary-dark: {c.primary_dark};
-            --primary-light: {c.primary_light};
-
-            /* 시맨틱 */
-            --success: {c.success};
-            --success-bg: {c.success_bg};
-            --warning: {c.warning};
-            --warning-bg: {c.warning_bg};
-            --error: {c.error};
-            --error-bg: {c.error_bg};
-            --info: {c.info};
-
-            /* 테두리 */
-            --border-light: {c.border_light};
-            --border-dark: {c.border_dark};
-
-            /* 그림자 */
-            --shadow-sm: 0 2px 8px rgba(0,0,0,0.06);
-            --shadow-md: 0 4px 12px rgba(201,168,124,0.3);
-            --shadow-lg: 0 8px 24px rgba(201,168,124,0.4);
-            --shadow-dark: 0 8px 24px rgba(0,0,0,0.08);
-
-            /* 테두리 곡률 */
-            --radius-sm: 0.5rem;
-            --radius-md: 0.75rem;
-            --radius-lg: 1rem;
-            --radius-xl: 1.5rem;
-            --radius-full: 9999px;
-
-            /* 트랜지션 */
-            --transition-fast: 0.15s ease;
-            --transition-normal: 0.2s ease;
-            --transition-slow: 0.3s ease;
+{body}
         }}
         """
 
+    def font_face_css(self) -> str:
+        """자체 호스팅 폰트의 @font-face 규칙 (폰트가 없으면 빈 문자열)"""
+        return self.memo("font_face_css", self._build_font_face_css)
+
+    def _build_font_face_css(self) -> str:
+        if not self.fonts:
+            return ""
+        from .fonts import font_face_css
+
+        return font_face_css(self.fonts)
+
+    def to_json(self) -> str:
+        """테마 토큰을 JSON으로 내보내기"""
+        return self.memo("json", self._build_json)
+
+    def _build_json(self) -> str:
+        return json.dumps({"name": self.name, **self.tokens()}, ensure_ascii=False, indent=2)
+
     def extend(self, name: str, **color_overrides) -> "Theme":
         """
         커스텀 색상으로 테마 확장
 
+        결과는 기본 테마 레지스트리(THEME_REGISTRY)에 인터닝되므로
+        같은 이름과 오버라이드로 다시 호출하면 같은 인스턴스를 반환합니다.
+
         Example:
             >>> custom = DEFAULT_THEME.extend(
             ...     name="my_brand",
@@ -78,12 +156,24 @@ class Theme:
             ...     primary_dark="#0056b3",
             ... )
         """
-        new_colors = replace(self.colors, **color_overrides)
-        return Theme(name=name, colors=new_colors)
+        return THEME_REGISTRY.extend(self, name, **color_overrides)
+
+    def with_fonts(self, fonts: Sequence["FontFace"]) -> "Theme":
+        """
+        자체 호스팅 폰트를 사용하는 테마 (인터닝, 같은 폰트로 다시 호출하면 같은 인스턴스)
+
+        Example:
+            >>> from studio_ui.core.fonts import load_fonts
+            >>> theme = DEFAULT_THEME.with_fonts(load_fonts())
+        """
+        fonts = tuple(fonts)
+        if fonts == self.fonts:
+            return self
+        return self.memo(("with_fonts", fonts), lambda: THEME_REGISTRY.intern(replace(self, fonts=fonts)))
 
 
 # 기본 테마
-DEFAULT_THEME = Theme()
+DEFAULT_THEME = THEME_REGISTRY.intern(Theme())
 
 # 다크 테마
 DARK_THEME = DEFAULT_THEME.extend(
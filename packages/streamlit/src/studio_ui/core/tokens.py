@@ -89,9 +89,18 @@ class Shadow:
     dark: str = "0 8px 24px rgba(0,0,0,0.08)"
 
 
+@dataclass(frozen=True)
+class Transition:
+    """트랜지션"""
+    fast: str = "0.15s ease"
+    normal: str = "0.2s ease"
+    slow: str = "0.3s ease"
+
+
 # 기본 인스턴스
 COLORS = Colors()
 TYPOGRAPHY = Typography()
 SPACING = Spacing()
 RADIUS = Radius()
 SHADOW = Shadow()
+TRANSITION = Transition()
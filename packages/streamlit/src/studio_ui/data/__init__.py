@@ -0,0 +1,65 @@
+"""
+studio_ui.data - 업로드 파일 파싱 / 결과 내보내기 파이프라인
+
+CSV/XLSX 업로드를 청크 단위로 Arrow 테이블로 읽습니다 (pandas는 .to_pandas()).
+파싱 결과는 파일 SHA-256 기준 Arrow IPC 디스크 캐시(TableCache)에 저장해 세션/프로세스가 공유합니다.
+CSV 인코딩(UTF-8/CP949/UTF-16)과 구분자는 앞부분 표본으로 감지합니다 (sniff_csv).
+결과 테이블은 XLSX/CSV로 청크 단위 스트리밍 내보내기 하고 결과 바이트를 캐시합니다 (cached_export).
+read_header()는 헤더 행만, columns를 주면 선택한 컬럼만 읽습니다 (XLSX는 자체 스트리밍 리더, 추가 의존성 없음).
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cache import TableCache, default_table_cache, file_digest
+    from .encoding import CsvDialect, sniff_csv
+    from .export import cached_export, export_bytes, table_digest, write_csv, write_xlsx
+    from .parse import ParseJob, file_kind, parse_table, read_header
+
+# 공개 API → 정의 모듈 (PEP 562 지연 로딩)
+_LAZY_ATTRS = {
+    "TableCache": "studio_ui.data.cache",
+    "default_table_cache": "studio_ui.data.cache",
+    "file_digest": "studio_ui.data.cache",
+    "CsvDialect": "studio_ui.data.encoding",
+    "sniff_csv": "studio_ui.data.encoding",
+    "cached_export": "studio_ui.data.export",
+    "export_bytes": "studio_ui.data.export",
+    "table_digest": "studio_ui.data.export",
+    "write_csv": "studio_ui.data.export",
+    "write_xlsx": "studio_ui.data.export",
+    "ParseJob": "studio_ui.data.parse",
+    "file_kind": "studio_ui.data.parse",
+    "parse_table": "studio_ui.data.parse",
+    "read_header": "studio_ui.data.parse",
+}
+
+__all__ = [
+    "TableCache",
+    "default_table_cache",
+    "file_digest",
+    "CsvDialect",
+    "sniff_csv",
+    "cached_export",
+    "export_bytes",
+    "table_digest",
+    "write_csv",
+    "write_xlsx",
+    "ParseJob",
+    "file_kind",
+    "parse_table",
+    "read_header",
+]
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,200 @@
+"""
+studio_ui/data/cache.py
+파싱 결과 디스크 캐시 - 업로드 바이트의 SHA-256으로 주소를 정하는 Arrow IPC 파일
+
+같은 파일을 여러 사용자가 올리거나 리런해도 파싱은 한 번만 합니다.
+    - 키: SHA-256(파일 바이트) + 파싱 옵션 다이제스트
+    - 저장: Arrow IPC 파일 (임시 파일 + rename, 워커 프로세스끼리 동시에 써도 안전)
+    - 읽기: memory_map (힙으로 복사하지 않고 페이지 캐시를 세션/프로세스가 공유)
+    - 제거: 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은(mtime) 파일부터 삭제
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# 기본 캐시 크기 상한 (1 GB)
+DEFAULT_CACHE_BYTES = 1024 * 1024 * 1024
+# 파싱 결과 형식이 바뀌면 올려서 이전 캐시를 무효화
+CACHE_FORMAT = 2
+SUFFIX = ".arrow"
+
+
+def file_digest(data: bytes) -> str:
+    """파일 바이트의 SHA-256 (16진수)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def options_digest(options: Dict[str, Any]) -> str:
+    """파싱 옵션 다이제스트 (같은 파일이라도 옵션이 다르면 다른 캐시 항목)"""
+    payload = json.dumps([CACHE_FORMAT, options], sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def default_cache_dir() -> Path:
+    """
+    기본 캐시 폴더
+
+    STUDIO_UI_CACHE_DIR 환경 변수가 있으면 그 아래 tables/,
+    없으면 $XDG_CACHE_HOME(기본 ~/.cache)/studio_ui/tables
+    """
+    root = os.environ.get("STUDIO_UI_CACHE_DIR")
+    if root:
+        return Path(root) / "tables"
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "studio_ui" / "tables"
+
+
+class TableCache:
+    """
+    콘텐츠 주소 Arrow 테이블 디스크 캐시 (세션/워커 프로세스 공유)
+
+    Args:
+        directory: 캐시 폴더 (기본: default_cache_dir())
+        max_bytes: 전체 파일 크기 상한 (초과 시 오래 쓰지 않은 파일부터 삭제)
+
+    Example:
+        >>> cache = TableCache(max_bytes=512 * 1024 * 1024)
+        >>> table = cache.get_or_parse(file.getvalue(), file.name)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, os.PathLike]] = None,
+        max_bytes: int = DEFAULT_CACHE_BYTES,
+    ):
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def key(self, data: bytes, **options: Any) -> str:
+        """캐시 키 (파일 SHA-256 + 옵션 다이제스트)"""
+        return f"{file_digest(data)}-{options_digest(options)}"
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{SUFFIX}"
+
+    def get(self, key: str) -> Optional["pa.Table"]:
+        """캐시된 테이블 (메모리 매핑, 없으면 None)"""
+        import pyarrow as pa
+
+        path = self.path(key)
+        try:
+            source = pa.memory_map(str(path), "r")
+        except OSError:
+            return None
+        try:
+            table = pa.ipc.open_file(source).read_all()
+        except pa.ArrowInvalid:
+            return None  # 깨진 파일 (다음 put이 덮어씀)
+        try:
+            os.utime(path)  # LRU: 최근 사용 시각 갱신
+        except OSError:
+            pass
+        return table
+
+    def put(self, key: str, table: "pa.Table") -> Path:
+        """테이블을 Arrow IPC 파일로 저장 (임시 파일 + rename) 후 크기 상한 적용"""
+        import pyarrow as pa
+
+        target = self.path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=".tmp-", suffix=SUFFIX)
+        os.close(fd)
+        try:
+            with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self.evict()
+        return target
+
+    def get_or_parse(
+        self,
+        data: bytes,
+        name: str,
+        progress: Optional[Callable[[float], None]] = None,
+        **options: Any,
+    ) -> "pa.Table":
+        """
+        캐시 조회 후 없으면 parse_table()로 파싱해 저장
+
+        저장한 뒤에는 파일을 다시 매핑해 돌려주므로 파싱에 쓴 힙 메모리는 바로 해제됩니다.
+        """
+        from studio_ui.data.parse import file_kind, parse_table
+
+        options.setdefault("kind", file_kind(name))
+        key = self.key(data, **options)
+        table = self.get(key)
+        if table is not None:
+            if progress is not None:
+                progress(1.0)
+            return table
+        table = parse_table(data, name=name, progress=progress, **options)
+        self.put(key, table)
+        return self.get(key) or table
+
+    def evict(self) -> int:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 쓰지 않은 파일 삭제 (삭제한 바이트 반환)"""
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.directory.glob(f"*/*{SUFFIX}"):
+                if path.name.startswith(".tmp-"):
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue  # 다른 프로세스가 먼저 삭제
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total - removed <= self.max_bytes:
+                    break
+                try:
+                    # 다른 세션이 매핑 중이어도 POSIX에서는 매핑이 유지됨 (Windows는 실패 → 건너뜀)
+                    path.unlink()
+                    removed += size
+                except OSError:
+                    pass
+            return removed
+
+    def size(self) -> int:
+        """현재 캐시 파일 크기 합계"""
+        return sum(
+            path.stat().st_size
+            for path in self.directory.glob(f"*/*{SUFFIX}")
+            if not path.name.startswith(".tmp-")
+        )
+
+    def clear(self) -> None:
+        """캐시 파일 전부 삭제"""
+        for path in self.directory.glob(f"*/*{SUFFIX}"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+_DEFAULT: Optional[TableCache] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_table_cache() -> TableCache:
+    """프로세스 공용 기본 캐시 (STUDIO_UI_CACHE_BYTES로 크기 상한 지정 가능)"""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            limit = os.environ.get("STUDIO_UI_CACHE_BYTES")
+            _DEFAULT = TableCache(max_bytes=int(limit) if limit else DEFAULT_CACHE_BYTES)
+        return _DEFAULT
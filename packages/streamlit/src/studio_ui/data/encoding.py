@@ -0,0 +1,154 @@
+"""
+studio_ui/data/encoding.py
+CSV 인코딩/구분자 감지 - 파일 앞부분 표본만 보고 결정
+
+은행/카드사 CSV는 UTF-8만큼 CP949(EUC-KR 확장)로도 자주 옵니다.
+UTF-8로 읽다가 실패하면 처음부터 다시 디코딩하는 대신, 표본으로 방언(CsvDialect)을 정하고
+pyarrow ReadOptions(encoding=...)로 파일을 한 번만 스트리밍 디코딩합니다.
+    1. BOM: UTF-8 / UTF-16
+    2. 바이트 패턴: 표본이 ASCII뿐이면 처음 나오는 비ASCII 바이트 위치를 찾아 그곳을 표본으로
+       (ASCII 블록은 bytes.isascii()로 건너뜀, 앞 SCAN_LIMIT_BYTES까지만 찾고 없으면 UTF-8)
+    3. 시험 디코딩: 표본(SAMPLE_BYTES)을 UTF-8 → CP949 순서로 (잘린 마지막 문자는 무시)
+       둘 다 실패하면 한글 바이트 패턴이 더 많이 보이는 쪽
+    4. 구분자: 표본 줄마다 후보(, 탭 ; |) 개수가 헤더와 같은 비율이 가장 높은 것
+"""
+import codecs
+import io
+import os
+import re
+from dataclasses import dataclass
+from typing import BinaryIO, Optional, Tuple, Union
+
+# 시험 디코딩/구분자 감지에 쓰는 표본 크기
+SAMPLE_BYTES = 64 * 1024
+# 구분자 감지에 쓰는 최대 줄 수
+_SAMPLE_LINES = 100
+# ASCII 구간을 건너뛸 때 읽는 블록 크기
+_SCAN_BYTES = 1 << 20
+# 비ASCII 바이트를 찾는 최대 범위 (ASCII뿐인 큰 파일을 끝까지 읽지 않도록, 넘으면 UTF-8로 판단)
+SCAN_LIMIT_BYTES = 4 << 20
+
+_DELIMITERS = (",", "\t", ";", "|")
+_BOMS = (
+    (codecs.BOM_UTF8, "utf8"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+_UTF8_HANGUL = re.compile(rb"[\xea-\xed][\x80-\xbf][\x80-\xbf]")
+_EUCKR_HANGUL = re.compile(rb"[\xb0-\xc8][\xa1-\xfe]")
+_QUOTED = re.compile(r'"(?:[^"]|"")*"')
+
+
+@dataclass(frozen=True)
+class CsvDialect:
+    """감지한 CSV 방언 (encoding은 pyarrow/Python 코덱 이름)"""
+    encoding: str = "utf8"
+    delimiter: str = ","
+    bom: bool = False
+
+
+def detect_encoding(sample: bytes, final: bool = False) -> str:
+    """
+    표본 바이트 → 인코딩 ("utf8" | "utf-16" | "cp949")
+
+    Args:
+        sample: 파일 앞부분 (또는 처음 비ASCII 바이트부터의 구간)
+        final: 표본이 파일 끝까지인지 (False면 잘린 마지막 문자를 허용)
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    if sample.isascii():
+        return "utf8"
+    for encoding in ("utf8", "cp949"):
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    # 둘 다 깨진 표본: 한글 바이트 패턴이 더 많은 쪽
+    utf8 = len(_UTF8_HANGUL.findall(sample))
+    return "utf8" if utf8 * 3 >= len(_EUCKR_HANGUL.findall(sample)) * 2 else "cp949"
+
+
+def detect_delimiter(text: str, default: str = ",") -> str:
+    """표본 텍스트 → 구분자 (줄마다 개수가 헤더와 같은 비율이 높고, 개수가 많은 후보)"""
+    lines = [line for line in _QUOTED.sub("", text).splitlines() if line.strip()][:_SAMPLE_LINES]
+    best, best_score = default, (0.0, 0)
+    for delimiter in _DELIMITERS:
+        counts = [line.count(delimiter) for line in lines]
+        if not counts or counts[0] == 0:
+            continue
+        score = (sum(c == counts[0] for c in counts) / len(counts), counts[0])
+        if score > best_score:
+            best, best_score = delimiter, score
+    return best
+
+
+def sniff_csv(
+    source: Union[bytes, str, os.PathLike, BinaryIO],
+    name: Optional[str] = None,
+    sample_bytes: int = SAMPLE_BYTES,
+) -> CsvDialect:
+    """
+    CSV 인코딩/구분자 감지 (파일 앞부분만 읽음, 파일 객체는 위치를 되돌림)
+
+    Args:
+        source: 파일 바이트 / 경로 / 바이너리 파일 객체
+        name: 파일 이름 (.tsv면 구분자를 찾지 못할 때 탭)
+        sample_bytes: 표본 크기
+
+    Example:
+        >>> dialect = sniff_csv(uploaded_file.getvalue())
+        >>> dialect.encoding, dialect.delimiter
+        ('cp949', ',')
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        stream: BinaryIO = io.BytesIO(source)
+    elif isinstance(source, (str, os.PathLike)):
+        name = name or os.fspath(source)
+        stream = open(source, "rb")
+    else:
+        stream = source
+        name = name or getattr(source, "name", None)
+    start = stream.tell()
+    try:
+        sample = stream.read(sample_bytes)
+        final = len(sample) < sample_bytes
+        encoding = detect_encoding(sample, final)
+        if encoding == "utf8" and not final and sample.isascii():
+            # 앞부분이 ASCII뿐 (예: 영문 헤더 + 숫자) → 처음 나오는 비ASCII 구간으로 판단
+            window, window_final = _first_non_ascii(stream, sample_bytes)
+            if window:
+                encoding = detect_encoding(window, window_final)
+    finally:
+        if stream is source:
+            stream.seek(start)
+        else:
+            stream.close()
+
+    bom = any(sample.startswith(b) for b, _ in _BOMS)
+    text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(sample, final)
+    if not final:
+        text = text[:text.rfind("\n") + 1] or text  # 잘린 마지막 줄 제외
+    default = "\t" if name and name.lower().endswith(".tsv") else ","
+    return CsvDialect(encoding, detect_delimiter(text.lstrip("\ufeff"), default), bom)
+
+
+def _first_non_ascii(stream: BinaryIO, size: int) -> Tuple[bytes, bool]:
+    """처음 나오는 비ASCII 바이트부터 size 바이트 (SCAN_LIMIT_BYTES 안에 없으면 b"")"""
+    scanned = 0
+    while scanned < SCAN_LIMIT_BYTES:
+        block = stream.read(min(_SCAN_BYTES, SCAN_LIMIT_BYTES - scanned))
+        if not block:
+            return b"", True
+        scanned += len(block)
+        if block.isascii():
+            continue
+        start = _NON_ASCII.search(block).start()
+        window = block[start:start + size]
+        if len(window) < size:
+            window += stream.read(size - len(window))
+        return window, len(window) < size
+    return b"", False
@@ -0,0 +1,447 @@
+"""
+studio_ui/data/parse.py
+업로드 파일(CSV/XLSX) → Arrow 테이블 청크 파싱
+
+파일 전체를 pandas로 한 번에 읽지 않고 청크 단위 Arrow 레코드 배치로 변환하므로
+최대 메모리는 (완성된 Arrow 테이블 + 청크 1개) 수준입니다.
+    CSV:  pyarrow 스트리밍 리더 (CSV_BLOCK_BYTES 블록, GIL 해제)
+          인코딩/구분자는 앞부분 표본으로 감지해 한 번만 디코딩 (data/encoding.py)
+    XLSX: 시트 XML 스트리밍 리더 (data/xlsx.py, chunk_rows 행씩 변환)
+columns를 주면 선택한 컬럼만 읽고, read_header()는 헤더 행만 읽습니다 (컬럼 매칭 화면용).
+ParseJob은 스크립트 스레드 밖(스레드 풀)에서 실행되고 진행률을 progress로 알립니다.
+"""
+import io
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Sequence, Union,
+)
+
+from studio_ui.data.encoding import CsvDialect, sniff_csv
+from studio_ui.data.xlsx import XlsxSheet
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from studio_ui.data.cache import TableCache
+
+# XLSX 청크 행 수 (청크마다 Python 객체 → Arrow 배열 변환)
+DEFAULT_CHUNK_ROWS = 50_000
+# XLSX 진행률 보고 간격 (행)
+_PROGRESS_ROWS = 5_000
+# CSV 스트리밍 블록 크기
+CSV_BLOCK_BYTES = 1 << 20
+# 타입 추론이 뒤 블록과 맞지 않을 때 문자열로 바꿔 다시 읽는 최대 횟수
+_CSV_RETRIES = 8
+# 동시에 파싱할 최대 업로드 수 (프로세스 공용)
+MAX_PARSE_WORKERS = 2
+
+Source = Union[bytes, str, os.PathLike, BinaryIO]
+ProgressFn = Callable[[float], None]
+
+_KINDS = {".csv": "csv", ".tsv": "csv", ".txt": "csv", ".xlsx": "xlsx", ".xlsm": "xlsx"}
+
+
+def file_kind(name: str) -> str:
+    """파일 이름 → "csv" | "xlsx" (지원하지 않는 형식은 ValueError)"""
+    kind = _KINDS.get(os.path.splitext(name)[1].lower())
+    if kind is None:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {name} (csv, tsv, txt, xlsx만 지원)")
+    return kind
+
+
+def _open(source: Source) -> BinaryIO:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, "rb")
+    return source
+
+
+def _size(stream: BinaryIO) -> Optional[int]:
+    try:
+        position = stream.tell()
+        size = stream.seek(0, io.SEEK_END)
+        stream.seek(position)
+        return size
+    except (AttributeError, OSError):
+        return None
+
+
+def _column_names(header: Sequence[Any]) -> List[str]:
+    """헤더 행 → 컬럼 이름 (빈 칸은 "열N", 중복은 "이름_2" ...)"""
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for i, value in enumerate(header):
+        name = str(value).strip() if value is not None and str(value).strip() else f"열{i + 1}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_{seen[name]}"
+        else:
+            seen[name] = 1
+        names.append(name)
+    return names
+
+
+# ============================================================
+# CSV
+# ============================================================
+
+def _csv_reader(
+    stream: BinaryIO,
+    encoding: str,
+    delimiter: str,
+    names: Optional[Sequence[str]] = None,
+    columns: Optional[Sequence[str]] = None,
+    column_types: Optional[Dict[str, "pa.DataType"]] = None,
+):
+    from pyarrow import csv
+
+    # names가 있으면 첫 행(헤더)을 건너뛰고 그 이름을 사용
+    return csv.open_csv(
+        stream,
+        read_options=csv.ReadOptions(
+            block_size=CSV_BLOCK_BYTES,
+            encoding=encoding,
+            column_names=list(names) if names is not None else None,
+            skip_rows_after_names=1 if names is not None else 0,
+        ),
+        parse_options=csv.ParseOptions(delimiter=delimiter),
+        convert_options=csv.ConvertOptions(
+            include_columns=list(columns) if columns else None,
+            column_types=column_types,
+        ),
+    )
+
+
+def _csv_names(stream: BinaryIO, encoding: str, delimiter: str) -> List[str]:
+    """첫 행의 컬럼 이름 그대로 (스트림 위치는 유지)"""
+    start = stream.tell()
+    try:
+        return _csv_reader(stream, encoding, delimiter).schema.names
+    finally:
+        stream.seek(start)
+
+
+def _csv_table(
+    stream: BinaryIO,
+    columns: Optional[Sequence[str]],
+    encoding: str,
+    delimiter: str,
+    progress: Optional[ProgressFn],
+) -> "pa.Table":
+    import pyarrow as pa
+
+    size = _size(stream)
+    start = stream.tell()
+    raw = _csv_names(stream, encoding, delimiter)
+    names = _column_names(raw)
+    # 빈 칸/중복/앞뒤 공백이 있는 이름만 XLSX, read_header와 같은 이름으로 바꿔 읽음
+    # (이름을 지정하면 헤더를 물리적 한 줄로 건너뛰므로, 줄바꿈이 든 헤더 셀은 정리할 게 없을 때 그대로 읽음)
+    override = names if names != raw else None
+    forced: Dict[str, "pa.DataType"] = {}
+    for _ in range(_CSV_RETRIES):
+        stream.seek(start)
+        reader = _csv_reader(stream, encoding, delimiter, override, columns, forced)
+        batches = []
+        try:
+            for batch in reader:
+                batches.append(batch)
+                if progress is not None and size:
+                    progress(min((stream.tell() - start) / (size - start or 1), 1.0))
+        except pa.ArrowInvalid as exc:
+            # 스트리밍 리더는 첫 블록으로 타입을 정하므로, 뒤 블록과 맞지 않는 컬럼은 다시 읽음
+            # (정수 → 실수 → 문자열 순, XLSX의 _unify와 같은 규칙)
+            column = _failed_column(str(exc), names)
+            if column is None or forced.get(column) == pa.string():
+                raise
+            inferred = reader.schema.field(column).type
+            numeric = pa.types.is_integer(inferred) and column not in forced
+            forced[column] = pa.float64() if numeric else pa.string()
+            continue
+        # 데이터 행이 없어도 헤더의 컬럼은 유지
+        return pa.Table.from_batches(batches, schema=reader.schema)
+    raise ValueError("CSV 컬럼 타입을 결정하지 못했습니다")
+
+
+def _failed_column(message: str, names: List[str]) -> Optional[str]:
+    # "In CSV column #3: Row #200002: CSV conversion error to int64: ..." (#은 파일의 컬럼 위치)
+    marker = "In CSV column #"
+    if marker not in message:
+        return None
+    index = int(message.split(marker, 1)[1].split(":", 1)[0])
+    return names[index] if index < len(names) else None
+
+
+# ============================================================
+# XLSX
+# ============================================================
+
+def _xlsx_batches(
+    stream: BinaryIO,
+    sheet: Optional[str],
+    columns: Optional[Sequence[str]],
+    chunk_rows: int,
+    progress: Optional[ProgressFn],
+) -> Iterator["pa.RecordBatch"]:
+    with XlsxSheet(stream, sheet) as reader:
+        header_row, header = reader.header()
+        names = _column_names(header)
+        picked: Optional[List[int]] = None
+        if columns:
+            picked = _pick(names, columns)
+            names = list(columns)
+
+        chunk: List[list] = []
+        yielded = False
+        for done, row in enumerate(reader.rows(picked, after=header_row), 1):
+            if picked is None and len(row) < len(names):
+                row.extend([None] * (len(names) - len(row)))
+            chunk.append(row if picked is not None else row[:len(names)])
+            if len(chunk) >= chunk_rows:
+                yield _chunk_batch(chunk, names)
+                yielded = True
+                chunk = []
+            if progress is not None and done % _PROGRESS_ROWS == 0:
+                progress(min(reader.position / (reader.size or 1), 1.0))
+        if chunk or not yielded:
+            yield _chunk_batch(chunk, names)
+
+
+def _pick(names: List[str], columns: Sequence[str]) -> List[int]:
+    missing = [c for c in columns if c not in names]
+    if missing:
+        raise KeyError(f"시트에 없는 컬럼: {missing}")
+    return [names.index(c) for c in columns]
+
+
+def _chunk_batch(chunk: List[Sequence[Any]], names: List[str]) -> "pa.RecordBatch":
+    import pyarrow as pa
+
+    arrays = []
+    for values in (list(zip(*chunk)) if chunk else [()] * len(names)):
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # 한 컬럼에 숫자/문자가 섞여 있으면 문자열 컬럼으로 변환
+            arrays.append(pa.array([None if v is None else str(v) for v in values], pa.string()))
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def _unify(batches: List["pa.RecordBatch"]) -> "pa.Table":
+    """
+    청크마다 추론한 타입을 하나로 맞춰 테이블로 합침 (정수+실수 → 실수, 그 밖의 충돌 → 문자열)
+
+    batches는 _xlsx_batches 결과로 항상 1개 이상 (빈 시트도 헤더 컬럼만 있는 배치)이므로
+    데이터 행이 없어도 컬럼이 유지됩니다.
+    """
+    import pyarrow as pa
+
+    names = batches[0].schema.names
+    target = []
+    for i in range(len(names)):
+        types = {b.column(i).type for b in batches} - {pa.null()}
+        if len(types) <= 1:
+            target.append(types.pop() if types else pa.null())
+        elif all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in types):
+            target.append(pa.float64())
+        else:
+            target.append(pa.string())
+    schema = pa.schema(list(zip(names, target)))
+    return pa.Table.from_batches(
+        [b if b.schema.equals(schema) else b.cast(schema) for b in batches], schema=schema
+    )
+
+
+# ============================================================
+# 공개 API
+# ============================================================
+
+def parse_table(
+    source: Source,
+    name: Optional[str] = None,
+    kind: Optional[str] = None,
+    sheet: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    encoding: Optional[str] = None,
+    delimiter: Optional[str] = None,
+    progress: Optional[ProgressFn] = None,
+) -> "pa.Table":
+    """
+    업로드 파일을 Arrow 테이블로 청크 파싱
+
+    Args:
+        source: 파일 바이트 / 경로 / 바이너리 파일 객체 (st.file_uploader 결과 포함)
+        name: 파일 이름 (kind 추론용, 없으면 source.name)
+        kind: "csv" | "xlsx" (없으면 이름 확장자로 판단)
+        sheet: XLSX 시트 이름 (없으면 활성 시트)
+        columns: 읽을 컬럼 (없으면 전부)
+        chunk_rows: XLSX 청크 행 수
+        encoding: CSV 인코딩 (없으면 감지: utf8 / cp949 / utf-16)
+        delimiter: CSV 구분자 (없으면 감지: , 탭 ; |)
+        progress: 진행률 콜백 (0.0 ~ 1.0, 파싱 스레드에서 호출)
+
+    Returns:
+        pyarrow.Table (pandas가 필요하면 .to_pandas())
+
+    Example:
+        >>> table = parse_table(uploaded_file, columns=["주문자", "금액"])
+    """
+    name = _source_name(source, name)
+    kind = kind or file_kind(name)
+    stream = _open(source)
+    try:
+        if kind == "csv":
+            dialect = _dialect(stream, name, encoding, delimiter)
+            table = _csv_table(stream, columns, dialect.encoding, dialect.delimiter, progress)
+        else:
+            table = _unify(list(_xlsx_batches(stream, sheet, columns, chunk_rows, progress)))
+    finally:
+        if stream is not source:
+            stream.close()
+    if progress is not None:
+        progress(1.0)
+    return table
+
+
+def read_header(
+    source: Source,
+    name: Optional[str] = None,
+    kind: Optional[str] = None,
+    sheet: Optional[str] = None,
+    encoding: Optional[str] = None,
+    delimiter: Optional[str] = None,
+) -> List[str]:
+    """
+    컬럼 이름만 읽기 (파일 전체를 파싱하지 않음)
+
+    CSV는 첫 블록, XLSX는 첫 번째 비어 있지 않은 행까지만 읽습니다.
+    돌려주는 이름은 parse_table(columns=...)에 그대로 쓸 수 있습니다.
+
+    Example:
+        >>> names = read_header(uploaded_file)  # ["주문번호", "주문자", "금액", ...]
+        >>> table = parse_table(uploaded_file, columns=["주문자", "금액"])
+    """
+    name = _source_name(source, name)
+    kind = kind or file_kind(name)
+    stream = _open(source)
+    start = stream.tell()
+    try:
+        if kind == "csv":
+            dialect = _dialect(stream, name, encoding, delimiter)
+            return _column_names(_csv_names(stream, dialect.encoding, dialect.delimiter))
+        with XlsxSheet(stream, sheet) as reader:
+            return _column_names(reader.header()[1])
+    finally:
+        if stream is not source:
+            stream.close()
+        else:
+            stream.seek(start)  # 같은 파일 객체로 parse_table()을 이어서 호출할 수 있게
+
+
+def _source_name(source: Source, name: Optional[str]) -> str:
+    if name is not None:
+        return name
+    return os.fspath(source) if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")
+
+
+def _dialect(
+    stream: BinaryIO,
+    name: str,
+    encoding: Optional[str],
+    delimiter: Optional[str],
+) -> CsvDialect:
+    """지정하지 않은 인코딩/구분자만 표본으로 감지"""
+    if encoding is not None and delimiter is not None:
+        return CsvDialect(encoding, delimiter)
+    sniffed = sniff_csv(stream, name)
+    return CsvDialect(encoding or sniffed.encoding, delimiter or sniffed.delimiter, sniffed.bom)
+
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(MAX_PARSE_WORKERS, thread_name_prefix="studio_ui_parse")
+        return _EXECUTOR
+
+
+class ParseJob:
+    """
+    백그라운드 파싱 작업 (프로세스 공용 스레드 풀에서 실행)
+
+    스크립트 스레드는 progress/done만 확인하므로 파싱 중에도 세션이 막히지 않습니다.
+    작업 스레드는 Streamlit API를 호출하지 않습니다.
+    cache를 주면 생성 시점에 (해시 + 메모리 매핑)으로 조회해, 있으면 작업 없이 바로 완료됩니다.
+    파싱한 결과는 캐시에 저장한 뒤 매핑한 테이블로 돌려줍니다.
+    CSV는 생성 시점에 앞부분 표본으로 감지한 인코딩/구분자를 dialect로 알려줍니다.
+
+    Args:
+        data: 파일 바이트
+        name: 파일 이름
+        cache: 파싱 결과 디스크 캐시 (TableCache, 없으면 캐시 안 함)
+        **options: parse_table() 옵션 (sheet, columns, chunk_rows, encoding, delimiter ...)
+
+    Example:
+        >>> job = ParseJob(file.getvalue(), file.name, cache=default_table_cache())
+        >>> job.progress, job.done, job.dialect
+        >>> table = job.result()
+    """
+
+    def __init__(self, data: bytes, name: str, cache: Optional["TableCache"] = None, **options: Any):
+        self.name = name
+        self.options = options
+        self.progress = 0.0
+        self.cache = cache
+        self.key: Optional[str] = None
+        self.cached = False
+        self.dialect: Optional[CsvDialect] = None
+
+        kind = options.get("kind") or file_kind(name)
+        if kind == "csv":
+            self.dialect = _dialect(
+                io.BytesIO(data), name, options.get("encoding"), options.get("delimiter")
+            )
+        if cache is not None:
+            options.setdefault("kind", kind)
+            self.key = cache.key(data, **options)
+            table = cache.get(self.key)
+            if table is not None:
+                self.cached = True
+                self.progress = 1.0
+                self._future: "Future[pa.Table]" = Future()
+                self._future.set_result(table)
+                return
+        self._future = _executor().submit(self._run, data)
+
+    def _run(self, data: bytes) -> "pa.Table":
+        options = dict(self.options)
+        if self.dialect is not None:  # 감지 결과를 넘겨 다시 감지하지 않음 (캐시 키는 원래 옵션 기준)
+            options.update(encoding=self.dialect.encoding, delimiter=self.dialect.delimiter)
+        table = parse_table(data, name=self.name, progress=self._report, **options)
+        if self.cache is None:
+            return table
+        self.cache.put(self.key, table)
+        return self.cache.get(self.key) or table
+
+    def _report(self, fraction: float) -> None:
+        self.progress = fraction
+
+    @property
+    def done(self) -> bool:
+        return self._future.done()
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """실패한 경우 예외 (진행 중이거나 성공하면 None)"""
+        return self._future.exception() if self._future.done() else None
+
+    def result(self, timeout: Optional[float] = None) -> "pa.Table":
+        """파싱 결과 (완료될 때까지 대기, 실패하면 예외 전달)"""
+        return self._future.result(timeout)
@@ -0,0 +1,349 @@
+"""
+studio_ui/data/xlsx.py
+XLSX 시트 스트리밍 리더 (zipfile + 정규식, 외부 의존성 없음)
+
+openpyxl read_only는 셀마다 Python 객체를 거치고, 시트에 <dimension>이 없으면
+로드할 때 시트 XML 전체를 한 번 더 훑습니다. 이 리더는 시트 XML을 블록 단위로 풀면서
+행(</row>) 단위로 자르고
+    - header(): 첫 행을 찾으면 멈춤 (나머지 시트는 압축도 풀지 않음)
+    - rows(columns): 행마다 필요한 셀(<c r="C12")만 bytes.find로 찾아 변환
+      (건너뛴 셀은 Python 코드를 거치지 않으므로 시간이 읽는 컬럼 수에 비례)
+값은 openpyxl data_only와 같게 변환합니다:
+공유/인라인 문자열, 숫자(int/float), 불리언, 날짜 서식 숫자 → datetime (1 미만은 time), 오류 → 문자열("#N/A").
+"""
+import html
+import posixpath
+import re
+import zipfile
+from datetime import datetime, time, timedelta
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+from xml.etree import ElementTree
+
+_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_SHARED_STRINGS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings"
+_STYLES = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"
+
+# 시트 XML 압축 해제 블록 크기
+BLOCK_BYTES = 1 << 20
+
+# 날짜/시간 내장 서식 번호 (한국어 Excel의 27~36, 50~58 포함)
+_BUILTIN_DATE_FORMATS = frozenset(
+    list(range(14, 23)) + list(range(27, 37)) + list(range(45, 48)) + list(range(50, 59))
+)
+_FORMAT_LITERALS = re.compile(r'"[^"]*"|\\.|\[(?!h\]|m\]|s\])[^\]]*\]')
+_FORMAT_DATE_TOKENS = re.compile(r"[dmyhs]", re.I)
+
+_ATTR_R = re.compile(rb'\br="([A-Z]+)(\d*)"')
+_PHONETIC = re.compile(rb"<(?:\w+:)?rPh\b.*?</(?:\w+:)?rPh>", re.S)
+
+_EPOCH_1900 = datetime(1899, 12, 30)
+_EPOCH_1904 = datetime(1904, 1, 1)
+
+
+def column_index(letters: str) -> int:
+    """열 문자 → 0부터 시작하는 위치 ("A" → 0, "AB" → 27)"""
+    index = 0
+    for char in letters:
+        index = index * 26 + ord(char) - 64
+    return index - 1
+
+
+def column_letters(index: int) -> str:
+    """0부터 시작하는 위치 → 열 문자 (0 → "A")"""
+    letters = ""
+    index += 1
+    while index:
+        index, rest = divmod(index - 1, 26)
+        letters = chr(65 + rest) + letters
+    return letters
+
+
+def _is_date_format(code: str) -> bool:
+    return bool(_FORMAT_DATE_TOKENS.search(_FORMAT_LITERALS.sub("", code)))
+
+
+class _SharedStrings:
+    """공유 문자열 표 (필요한 인덱스까지만 점진적으로 읽음 - 헤더만 읽을 때 표 전체를 풀지 않음)"""
+
+    def __init__(self, archive: zipfile.ZipFile, path: Optional[str]):
+        self._values: List[str] = []
+        self._events = ElementTree.iterparse(archive.open(path), ("start", "end")) if path else None
+        self._root = None
+
+    def __getitem__(self, index: int) -> str:
+        while index >= len(self._values) and self._events is not None:
+            self._advance()
+        return self._values[index]
+
+    def _advance(self) -> None:
+        for event, elem in self._events:
+            if self._root is None:
+                self._root = elem
+            if event != "end" or elem.tag != f"{_MAIN}si":
+                continue
+            parts = []
+            for child in elem:
+                if child.tag == f"{_MAIN}t":
+                    parts.append(child.text or "")
+                elif child.tag == f"{_MAIN}r":
+                    parts.extend(t.text or "" for t in child.iter(f"{_MAIN}t"))
+            self._values.append("".join(parts))
+            self._root.clear()
+            return
+        self._events = None
+
+
+class XlsxSheet:
+    """
+    XLSX 시트 스트리밍 리더
+
+    Args:
+        stream: XLSX 바이너리 파일 객체
+        sheet: 시트 이름 (없으면 활성 시트)
+
+    Example:
+        >>> with XlsxSheet(io.BytesIO(data)) as reader:
+        ...     row_number, header = reader.header()
+        ...     for values in reader.rows([0, 3], after=row_number):
+        ...         ...
+    """
+
+    def __init__(self, stream: BinaryIO, sheet: Optional[str] = None):
+        self._archive = zipfile.ZipFile(stream)
+        names = set(self._archive.namelist())
+        rels = self._relationships("xl/_rels/workbook.xml.rels")
+        workbook = ElementTree.fromstring(self._archive.read("xl/workbook.xml"))
+
+        sheets = [
+            (s.get("name"), rels[s.get(f"{_REL}id")])
+            for s in workbook.iter(f"{_MAIN}sheet")
+        ]
+        self.sheet_names = [name for name, _ in sheets]
+        if sheet is not None:
+            matches = [path for name, path in sheets if name == sheet]
+            if not matches:
+                raise KeyError(f"시트가 없습니다: {sheet} (시트: {self.sheet_names})")
+            self._path = matches[0]
+        else:
+            view = workbook.find(f"{_MAIN}bookViews/{_MAIN}workbookView")
+            active = int(view.get("activeTab", 0)) if view is not None else 0
+            self._path = sheets[min(active, len(sheets) - 1)][1]
+        self.size = self._archive.getinfo(self._path).file_size
+        self.position = 0  # 압축을 푼 시트 XML 바이트 (진행률)
+
+        properties = workbook.find(f"{_MAIN}workbookPr")
+        date1904 = properties is not None and properties.get("date1904") in ("1", "true")
+        self._epoch = _EPOCH_1904 if date1904 else _EPOCH_1900
+
+        by_type = {kind: path for kind, path in self._typed_rels.items() if path in names}
+        self._strings = _SharedStrings(self._archive, by_type.get(_SHARED_STRINGS))
+        self._date_styles = self._read_date_styles(by_type.get(_STYLES))
+        self._prefix: Optional[bytes] = None
+        self._cell: Optional["re.Pattern[bytes]"] = None
+        self._text: Optional["re.Pattern[bytes]"] = None
+        self._value: Optional["re.Pattern[bytes]"] = None
+        self._addressed = True  # 모든 셀이 r="A1" 속성으로 시작하는지 (헤더 행으로 판단)
+        self._indexes: Dict[bytes, int] = {}
+
+    def __enter__(self) -> "XlsxSheet":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._archive.close()
+
+    # ---------- 워크북 구조 ----------
+
+    def _relationships(self, path: str) -> Dict[str, str]:
+        self._typed_rels: Dict[str, str] = {}
+        rels = {}
+        base = posixpath.dirname(posixpath.dirname(path))  # xl/_rels/x.rels → xl
+        for rel in ElementTree.fromstring(self._archive.read(path)).iter(f"{_PKG}Relationship"):
+            target = rel.get("Target", "")
+            target = target.lstrip("/") if target.startswith("/") else posixpath.normpath(
+                posixpath.join(base, target)
+            )
+            rels[rel.get("Id")] = target
+            self._typed_rels[rel.get("Type")] = target
+        return rels
+
+    def _read_date_styles(self, path: Optional[str]) -> Set[bytes]:
+        if path is None:
+            return set()
+        styles = ElementTree.fromstring(self._archive.read(path))
+        custom = {
+            int(fmt.get("numFmtId")): fmt.get("formatCode", "")
+            for fmt in styles.iter(f"{_MAIN}numFmt")
+        }
+        xfs = styles.find(f"{_MAIN}cellXfs")
+        dates = set()
+        for i, xf in enumerate(xfs if xfs is not None else ()):
+            fmt = int(xf.get("numFmtId", 0))
+            if fmt in _BUILTIN_DATE_FORMATS or (fmt in custom and _is_date_format(custom[fmt])):
+                dates.add(str(i).encode())
+        return dates
+
+    # ---------- 행 순회 ----------
+
+    def _segments(self) -> Iterator[bytes]:
+        """시트 XML을 풀면서 행 조각(<row ...>...)을 하나씩 돌려줌"""
+        self.position = 0
+        rest = b""
+        close = None
+        with self._archive.open(self._path) as member:
+            while True:
+                block = member.read(BLOCK_BYTES)
+                self.position += len(block)
+                buffer = rest + block
+                if self._prefix is None:
+                    found = re.search(rb"<(\w+:)?sheetData\b", buffer)
+                    if found is None and block:
+                        rest = buffer
+                        continue
+                    self._compile(found.group(1) or b"" if found else b"")
+                if close is None:
+                    close = b"</" + self._prefix + b"row>"
+                cut = buffer.rfind(close)
+                if cut < 0:
+                    rest = buffer
+                else:
+                    end = cut + len(close)
+                    yield from buffer[:end].split(close)[:-1]
+                    rest = buffer[end:]
+                if not block:
+                    return
+
+    def _compile(self, prefix: bytes) -> None:
+        self._prefix = prefix
+        p = re.escape(prefix)
+        self._row_open = b"<" + prefix + b"row"
+        # (열 문자, 나머지 속성, 내용) - Excel은 r 속성을 맨 앞에 씀
+        self._cell = re.compile(
+            b"<" + p + rb'c(?=[\s/>])(?: r="([A-Z]+)\d*")?([^>]*?)(?:/>|>(.*?)</' + p + b"c>)", re.S
+        )
+        self._text = re.compile(b"<" + p + rb"t(?:\s[^>]*)?>(.*?)</" + p + b"t>", re.S)
+        self._v_open, self._v_close = b"<" + prefix + b"v>", b"</" + prefix + b"v>"
+        self._value = re.compile(b"<" + p + rb"v>(.*?)</" + p + b"v>", re.S)
+
+    def _row_body(self, segment: bytes) -> Tuple[Optional[int], bytes]:
+        """행 조각 → (행 번호, 셀 부분) - 앞에 붙은 빈 행(<row r="3"/>)은 건너뜀"""
+        start = segment.rfind(self._row_open)
+        end = segment.find(b">", start)
+        if start < 0 or end < 0:
+            return None, b""
+        at = segment.find(b' r="', start, end)
+        number = int(segment[at + 4:segment.index(b'"', at + 4)]) if at >= 0 else None
+        return number, segment[end + 1:]
+
+    def _all_cells(self, body: bytes) -> List[Any]:
+        values: List[Any] = []
+        for match in self._cell.finditer(body):
+            letters, attrs, content = match.groups()
+            if letters is None:
+                ref = _ATTR_R.search(attrs)
+                self._addressed = False
+                letters = ref.group(1) if ref else None
+            index = self._indexes.get(letters) if letters else len(values)
+            if index is None:
+                index = self._indexes[letters] = column_index(letters.decode())
+            if index >= len(values):
+                values.extend([None] * (index - len(values) + 1))
+            values[index] = self._convert(attrs, content)
+        return values
+
+    def header(self) -> Tuple[int, List[Any]]:
+        """첫 번째 비어 있지 않은 행 (행 번호, 값 리스트) - 이후 행은 읽지 않음"""
+        for number, segment in enumerate(self._segments(), 1):
+            row_number, body = self._row_body(segment)
+            values = self._all_cells(body)
+            if any(v is not None for v in values):
+                return row_number or number, values
+        return 0, []
+
+    def rows(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        after: int = 0,
+    ) -> Iterator[List[Any]]:
+        """
+        after 행 이후의 행 값 (빈 행 제외)
+
+        Args:
+            columns: 읽을 열 위치 (0부터, 없으면 전부) - 지정하면 해당 셀만 찾아 변환
+            after: 이 행 번호까지 건너뜀 (보통 header()의 행 번호)
+        """
+        if columns is not None and self._prefix is None:
+            self.header()  # 셀 주소 형식 확인
+        letters = [column_letters(i).encode() for i in columns] if columns is not None else None
+        opener = b"<" + (self._prefix or b"") + b'c r="'
+
+        for number, segment in enumerate(self._segments(), 1):
+            row_number, body = self._row_body(segment)
+            row_number = row_number or number
+            if row_number <= after or not body:
+                continue
+            if letters is None:
+                values = self._all_cells(body)
+            elif self._addressed:
+                suffix = str(row_number).encode() + b'"'
+                values = []
+                for letter in letters:
+                    at = body.find(opener + letter + suffix)
+                    match = self._cell.match(body, at) if at >= 0 else None
+                    values.append(self._convert(match.group(2), match.group(3)) if match else None)
+            else:
+                cells = self._all_cells(body)
+                values = [cells[i] if i < len(cells) else None for i in columns]
+            if any(v is not None for v in values):
+                yield values
+
+    # ---------- 값 변환 ----------
+
+    def _convert(self, attrs: bytes, body: Optional[bytes]) -> Any:
+        if not body:
+            return None
+        at = attrs.find(b' t="')
+        kind = attrs[at + 4:attrs.index(b'"', at + 4)] if at >= 0 else b"n"
+        if kind == b"inlineStr":
+            if b"rPh" in body:
+                body = _PHONETIC.sub(b"", body)
+            return self._decode(b"".join(self._text.findall(body)))
+        if body.startswith(self._v_open):
+            raw = body[len(self._v_open):body.find(self._v_close)]
+        else:
+            value = self._value.search(body)  # 수식 셀: <f>...</f><v>...</v>
+            if value is None:
+                return None
+            raw = value.group(1)
+        if kind == b"n":
+            if self._date_styles:
+                at = attrs.find(b' s="')
+                if at >= 0 and attrs[at + 4:attrs.index(b'"', at + 4)] in self._date_styles:
+                    return self._date(float(raw))
+            try:
+                return int(raw)
+            except ValueError:
+                return float(raw)
+        if kind == b"s":
+            return self._strings[int(raw)]
+        if kind == b"b":
+            return raw == b"1"
+        if kind == b"d":
+            return datetime.fromisoformat(raw.decode())
+        return self._decode(raw)  # str(수식 결과), e(오류)
+
+    def _date(self, serial: float) -> Union[datetime, time]:
+        if 0 <= serial < 1:
+            return (datetime.min + timedelta(milliseconds=round(serial * 86_400_000))).time()  # 시각만
+        if self._epoch is _EPOCH_1900 and serial < 60:
+            serial += 1  # Excel 1900 윤년 버그 (1900-02-29가 있다고 계산)
+        return self._epoch + timedelta(milliseconds=round(serial * 86_400_000))
+
+    @staticmethod
+    def _decode(raw: bytes) -> str:
+        text = raw.decode("utf-8")
+        return html.unescape(text) if "&" in text else text
@@ -0,0 +1,534 @@
+/*
+ * studio_ui iframe 컴포넌트 공용 스크립트 (frontend/index.html이 한 번 불러와 캐시)
+ *
+ * variant별 렌더러:
+ *   cards, carousel  스와이프 선택 (swipe_slider / step_carousel)
+ *   grid             가상 스크롤 카드 그리드 (card_grid mode="virtual")
+ *   stats            실시간 통계 카드 (live_stats_card, 바뀐 구간/범례만 갱신)
+ *   stylesheet       테마 스타일시트를 부모 문서 <head>에 붙임 (apply_theme static 모드)
+ *
+ * args.fonts: apply_theme의 자체 호스팅 폰트 ({family, weight, url}, URL은 부모 페이지 기준)
+ *
+ * Streamlit 컴포넌트 메시지 프로토콜:
+ *   iframe → 앱: streamlit:setComponentValue, streamlit:setFrameHeight
+ *   앱 → iframe: streamlit:render (args) → index.html이 window.studioUI.render로 전달
+ *
+ * 값 전송은 channel이 합칩니다 (제스처 중 이벤트 수와 무관하게 서버 실행 수 일정):
+ *   - 입력이 args.settle_ms 동안 멈춘 뒤 마지막 값만 전송
+ *   - 서버가 확인(ack)한 값과 같으면 전송하지 않음
+ *   - 전송 중(in-flight)인 값이 있으면 확인될 때까지 기다렸다가 최신 값만 전송 (중간 값은 폐기)
+ * 서버 확인은 render의 args.ack(서버가 받은 값)로 받고, ack를 보내지 않는
+ * Streamlit 버전에서는 ACK_TIMEOUT_MS 뒤에 확인된 것으로 간주합니다.
+ */
+(function () {
+    "use strict";
+
+    var root = document.getElementById("root");
+    var view = null;       // 현재 스와이프 DOM (items/variant가 바뀔 때만 다시 생성)
+    var signature = null;  // view를 만든 args 요약
+    var index = 0;         // 화면에 표시 중인 인덱스
+    var height = null;     // 마지막으로 알린 iframe 높이
+    var fonts = null;      // 적용한 args.fonts 요약
+
+    var ACK_TIMEOUT_MS = 1500;
+
+    function post(type, data) {
+        var message = { isStreamlitMessage: true, type: type };
+        for (var name in data) message[name] = data[name];
+        window.parent.postMessage(message, "*");
+    }
+
+    var channel = {
+        settleMs: 150,
+        acked: null,      // 서버가 확인한 값
+        inflight: null,   // 보냈지만 아직 확인되지 않은 값
+        latest: null,     // 보낼 값을 계산하는 함수 (최신 입력만 유지)
+        settling: false,  // settle 창이 진행 중인지
+        settleTimer: null,
+        ackTimer: null,
+
+        // 입력 발생: settle 창을 다시 시작 (getValue는 전송 시점에 평가)
+        schedule: function (getValue) {
+            var self = this;
+            this.latest = getValue;
+            this.settling = true;
+            clearTimeout(this.settleTimer);
+            this.settleTimer = setTimeout(function () {
+                self.settling = false;
+                self.flush();
+            }, this.settleMs);
+        },
+
+        flush: function () {
+            if (this.settling || this.inflight !== null || this.latest === null) return;
+            var value = this.latest();
+            this.latest = null;
+            if (value === this.acked) return;
+
+            var self = this;
+            this.inflight = value;
+            post("streamlit:setComponentValue", { value: value, dataType: "json" });
+            this.ackTimer = setTimeout(function () { self.ack(value); }, ACK_TIMEOUT_MS);
+        },
+
+        // 서버 확인: 기다리는 동안 settle 창을 지난 입력이 있으면 최신 값만 전송
+        ack: function (value) {
+            clearTimeout(this.ackTimer);
+            this.acked = value;
+            this.inflight = null;
+            this.flush();
+        },
+
+        reset: function (value) {
+            clearTimeout(this.settleTimer);
+            clearTimeout(this.ackTimer);
+            this.acked = value;
+            this.inflight = null;
+            this.latest = null;
+            this.settling = false;
+        }
+    };
+
+    function el(tag, className, text) {
+        var node = document.createElement(tag);
+        if (className) node.className = className;
+        if (text !== undefined) node.textContent = text;
+        return node;
+    }
+
+    function toggleActive(nodes, active) {
+        for (var i = 0; i < nodes.length; i++) {
+            nodes[i].classList.toggle("active", i === active);
+        }
+    }
+
+    // ---------- variant: cards ----------
+    function buildCards(args) {
+        var outer = el("div", "swipe-outer" + (args.single ? " single" : ""));
+        var track = el("div", "swipe-track");
+        var dotsRow = el("div", "dots-row");
+        var cards = [];
+        var dots = [];
+
+        args.items.forEach(function (item, i) {
+            var card = el("div", "swipe-card" + (item.type === "add" ? " add-card" : ""));
+            card.appendChild(el("div", "card-emoji", item.emoji || "📌"));
+            card.appendChild(el("div", "card-title", item.title || ""));
+            card.addEventListener("click", function () { select(i, true); });
+            track.appendChild(card);
+            cards.push(card);
+
+            var dot = el("div", "dot");
+            dot.addEventListener("click", function () { select(i, true); });
+            dotsRow.appendChild(dot);
+            dots.push(dot);
+        });
+
+        outer.appendChild(track);
+        outer.appendChild(dotsRow);
+        root.appendChild(outer);
+
+        function closest() {
+            var rect = track.getBoundingClientRect();
+            var center = rect.left + rect.width / 2;
+            var best = 0;
+            var bestDist = Infinity;
+            cards.forEach(function (card, i) {
+                var r = card.getBoundingClientRect();
+                var dist = Math.abs(r.left + r.width / 2 - center);
+                if (dist < bestDist) {
+                    bestDist = dist;
+                    best = i;
+                }
+            });
+            return best;
+        }
+
+        function mark(i) {
+            index = i;
+            toggleActive(cards, i);
+            toggleActive(dots, i);
+            return i;
+        }
+
+        function select(i, scroll) {
+            mark(i);
+            if (scroll && cards[i]) {
+                cards[i].scrollIntoView({ behavior: "smooth", inline: "center", block: "nearest" });
+            }
+            channel.schedule(function () { return index; });
+        }
+
+        // 스크롤 이벤트는 settle 창만 연장하고, 멈춘 뒤 가운데 카드를 한 번 계산
+        track.addEventListener("scroll", function () {
+            channel.schedule(function () { return mark(closest()); });
+        }, { passive: true });
+
+        return {
+            show: function (i) {
+                toggleActive(cards, i);
+                toggleActive(dots, i);
+                if (cards[i]) cards[i].scrollIntoView({ inline: "center", block: "nearest" });
+            }
+        };
+    }
+
+    // ---------- variant: carousel ----------
+    function buildCarousel(args) {
+        var container = el("div", "section-container");
+        var header = el("div", "section-header");
+        header.appendChild(el("div", "section-label", args.label || ""));
+        header.appendChild(el("div", "section-title", args.title || ""));
+        container.appendChild(header);
+
+        var wrapper = el("div", "carousel-wrapper");
+        var track = el("div", "carousel-track");
+        var dotsRow = el("div", "carousel-dots");
+        var dots = [];
+        var total = args.items.length;
+
+        args.items.forEach(function (item, i) {
+            var slide = el("div", "carousel-slide");
+            slide.appendChild(el("span", "step-badge", item.step || ""));
+            slide.appendChild(el("div", "step-title", item.title || ""));
+            slide.appendChild(el("div", "step-desc", item.desc || ""));
+            track.appendChild(slide);
+
+            var dot = el("span", "dot");
+            dot.addEventListener("click", function () { goTo(i); });
+            dotsRow.appendChild(dot);
+            dots.push(dot);
+        });
+
+        wrapper.appendChild(track);
+        container.appendChild(wrapper);
+        container.appendChild(dotsRow);
+        root.appendChild(container);
+
+        function show(i) {
+            track.style.transform = "translateX(-" + (i * 100) + "%)";
+            toggleActive(dots, i);
+        }
+
+        function goTo(i) {
+            index = i;
+            show(i);
+            channel.schedule(function () { return index; });
+        }
+
+        function swipe(diff) {
+            if (diff < -50 && index < total - 1) goTo(index + 1);
+            else if (diff > 50 && index > 0) goTo(index - 1);
+        }
+
+        var startX = 0;
+        track.addEventListener("touchstart", function (e) { startX = e.touches[0].clientX; }, { passive: true });
+        track.addEventListener("touchend", function (e) { swipe(e.changedTouches[0].clientX - startX); }, { passive: true });
+
+        var dragging = false;
+        var mouseStartX = 0;
+        track.addEventListener("mousedown", function (e) { dragging = true; mouseStartX = e.clientX; });
+        track.addEventListener("mouseup", function (e) {
+            if (!dragging) return;
+            dragging = false;
+            swipe(e.clientX - mouseStartX);
+        });
+        track.addEventListener("mouseleave", function () { dragging = false; });
+
+        return { show: show };
+    }
+
+    // ---------- variant: stylesheet ----------
+    // app/static은 .css를 text/plain + nosniff로 서빙할 수 있으므로 <link> 대신 fetch로 읽음
+    function applyStylesheet(href) {
+        var doc = window.parent.document, id = "studio-ui-theme";
+        var node = doc.getElementById(id);
+        if (node && node.getAttribute("data-href") === href) return;
+        fetch(new URL(href, doc.baseURI)).then(function (r) { return r.text(); }).then(function (css) {
+            node = doc.getElementById(id);
+            if (!node) { node = doc.createElement("style"); node.id = id; doc.head.appendChild(node); }
+            node.textContent = css;
+            node.setAttribute("data-href", href);
+        });
+    }
+
+    // ---------- 자체 호스팅 폰트 ----------
+    function applyFonts(list) {
+        var next = JSON.stringify(list || []);
+        if (next === fonts) return;
+        fonts = next;
+        var base = window.parent.document.baseURI;
+        var css = (list || []).map(function (face) {
+            return "@font-face { font-family: '" + face.family + "'; font-style: normal; " +
+                "font-weight: " + face.weight + "; font-display: swap; " +
+                "src: url('" + new URL(face.url, base).href + "') format('woff2'); }";
+        }).join("\n");
+        var node = document.getElementById("studio-ui-fonts");
+        if (!node) {
+            node = document.createElement("style");
+            node.id = "studio-ui-fonts";
+            document.head.appendChild(node);
+        }
+        node.textContent = css;
+    }
+
+    // ---------- variant: grid (card_grid mode="virtual") ----------
+    // 보이는 행(+GRID_OVERSCAN)만 DOM에 그리고, 캐시에 없거나 다이제스트가 바뀐 페이지만 요청
+    var GRID_OVERSCAN = 2;          // 화면 위아래로 미리 그릴 행 수
+    var GRID_CACHE_PAGES = 64;      // 브라우저에 보관할 최대 페이지 수
+    var GRID_REQUEST_MS = 80;       // 스크롤이 멈춘 뒤 페이지를 요청하기까지 기다리는 시간
+    var GRID_PENDING_MS = 2000;     // 요청한 페이지를 다시 요청하기 전까지 기다리는 시간
+
+    var grid = null;
+
+    function buildGrid() {
+        var state = {
+            args: null,
+            layout: null,
+            cache: new Map(),   // 페이지 → { digest, items }
+            pending: {},        // 페이지 → 요청 시각
+            version: 0,         // 캐시가 바뀔 때마다 증가 (같은 범위 재그리기 판단)
+            drawn: null,
+            seq: 0,
+            requestTimer: null,
+            frame: null,
+            scroller: el("div", "vgrid"),
+            spacer: el("div", "vgrid-spacer"),
+            rows: el("div", "vgrid-rows")
+        };
+        state.scroller.appendChild(state.spacer);
+        state.scroller.appendChild(state.rows);
+        root.appendChild(state.scroller);
+        state.scroller.addEventListener("scroll", function () {
+            if (state.frame !== null) return;
+            state.frame = requestAnimationFrame(function () {
+                state.frame = null;
+                drawGrid(state);
+            });
+        }, { passive: true });
+        return state;
+    }
+
+    function gridCard(state, i, missing) {
+        var args = state.args;
+        var page = Math.floor(i / args.page_size);
+        var cached = state.cache.get(page);
+        if (!cached || cached.digest !== args.digests[page]) {
+            if (missing.indexOf(page) < 0) missing.push(page);
+            return el("div", "grid-card placeholder");
+        }
+        var item = cached.items[i - page * args.page_size] || ["", "", ""];
+        var card = el("div", "grid-card");
+        card.appendChild(el("div", "grid-icon", item[0]));
+        card.appendChild(el("div", "grid-title", item[1]));
+        card.appendChild(el("div", "grid-desc", item[2]));
+        return card;
+    }
+
+    function drawGrid(state) {
+        var args = state.args;
+        var columns = args.columns;
+        var rowHeight = args.row_height;
+        var top = state.scroller.scrollTop;
+        var firstRow = Math.max(0, Math.floor(top / rowHeight) - GRID_OVERSCAN);
+        var lastRow = Math.min(
+            Math.ceil(args.total / columns) - 1,
+            Math.ceil((top + args.height) / rowHeight) + GRID_OVERSCAN
+        );
+        var drawn = firstRow + ":" + lastRow + ":" + state.version;
+        if (drawn === state.drawn) return;
+        state.drawn = drawn;
+
+        var missing = [];
+        var rows = document.createDocumentFragment();
+        for (var r = firstRow; r <= lastRow; r++) {
+            var row = el("div", "vgrid-row");
+            row.style.gridTemplateColumns = "repeat(" + columns + ", minmax(0, 1fr))";
+            row.style.height = rowHeight + "px";
+            for (var i = r * columns; i < Math.min((r + 1) * columns, args.total); i++) {
+                row.appendChild(gridCard(state, i, missing));
+            }
+            rows.appendChild(row);
+        }
+        state.rows.textContent = "";
+        state.rows.appendChild(rows);
+        state.rows.style.transform = "translateY(" + (firstRow * rowHeight) + "px)";
+
+        var pageOf = function (row) { return Math.floor(row * columns / args.page_size); };
+        requestPages(state, missing, [pageOf(firstRow), pageOf(lastRow + 1)]);
+    }
+
+    // 스크롤이 GRID_REQUEST_MS 동안 멈춘 뒤 마지막으로 필요한 페이지만 한 번에 요청
+    function requestPages(state, missing, visible) {
+        var now = Date.now();
+        var want = missing.filter(function (page) {
+            return !(page in state.pending && now - state.pending[page] < GRID_PENDING_MS);
+        });
+        clearTimeout(state.requestTimer);
+        if (!want.length) return;
+        state.requestTimer = setTimeout(function () {
+            var sent = Date.now();
+            want.forEach(function (page) { state.pending[page] = sent; });
+            state.seq += 1;
+            post("streamlit:setComponentValue", {
+                value: { seq: sent.toString(36) + "-" + state.seq, want: want, visible: visible },
+                dataType: "json"
+            });
+        }, GRID_REQUEST_MS);
+    }
+
+    function renderGrid(args) {
+        if (grid === null) {
+            root.textContent = "";
+            grid = buildGrid();
+        }
+        var layout = JSON.stringify([args.columns, args.row_height, args.page_size]);
+        if (layout !== grid.layout) {
+            grid.layout = layout;
+            grid.cache.clear();
+            grid.pending = {};
+        }
+        grid.args = args;
+
+        Object.keys(args.pages || {}).forEach(function (key) {
+            var page = Number(key);
+            grid.cache.delete(page);
+            grid.cache.set(page, { digest: args.digests[page], items: JSON.parse(args.pages[key]) });
+            delete grid.pending[page];
+        });
+        while (grid.cache.size > GRID_CACHE_PAGES) {
+            grid.cache.delete(grid.cache.keys().next().value);
+        }
+        grid.version += 1;
+
+        grid.scroller.style.height = args.height + "px";
+        grid.spacer.style.height = (Math.ceil(args.total / args.columns) * args.row_height) + "px";
+        drawGrid(grid);
+    }
+
+    // ---------- variant: stats (live_stats_card) ----------
+    // DOM은 한 번만 만들고, 레이블별로 바뀐 막대 구간 너비/색과 범례 값만 고침
+    var stats = null;
+
+    function buildStats() {
+        var state = {
+            box: el("div", "stats-container"),
+            title: el("div", "stats-title"),
+            bar: el("div", "stats-bar"),
+            legend: el("div", "stats-legend"),
+            rows: new Map()     // 레이블 → { segment, item, dot, text, pct, color, value }
+        };
+        state.box.appendChild(state.title);
+        state.box.appendChild(state.bar);
+        state.box.appendChild(state.legend);
+        root.textContent = "";
+        root.appendChild(state.box);
+        // 범례 줄바꿈으로 높이가 바뀌면 iframe 높이를 맞춤
+        if (window.ResizeObserver) {
+            new ResizeObserver(function () { setHeight(root.offsetHeight); }).observe(root);
+        }
+        return state;
+    }
+
+    function statsRow(state, label) {
+        var row = state.rows.get(label);
+        if (row) return row;
+        row = {
+            segment: el("div", "stats-segment"),
+            item: el("div", "stats-legend-item"),
+            dot: el("div", "stats-legend-dot"),
+            text: el("span", "stats-legend-text"),
+            pct: null,
+            color: null,
+            value: null
+        };
+        row.item.appendChild(row.dot);
+        row.item.appendChild(row.text);
+        state.rows.set(label, row);
+        return row;
+    }
+
+    // 위치 i에 node가 없을 때만 옮김 (순서가 그대로면 DOM 변경 없음)
+    function placeAt(parent, node, i) {
+        if (parent.children[i] !== node) parent.insertBefore(node, parent.children[i] || null);
+    }
+
+    function renderStats(args) {
+        if (stats === null) stats = buildStats();
+
+        var heading = args.title + " (총 " + args.total + "건)";
+        if (stats.title.textContent !== heading) stats.title.textContent = heading;
+
+        var seen = new Set();
+        args.items.forEach(function (entry, i) {
+            var label = entry[0], value = entry[1], color = entry[2];
+            var row = statsRow(stats, label);
+            var pct = args.total > 0 ? value / args.total * 100 : 0;
+            seen.add(label);
+            if (row.pct !== pct) {
+                row.pct = pct;
+                row.segment.style.width = pct + "%";
+            }
+            if (row.color !== color) {
+                row.color = color;
+                row.segment.style.background = color;
+                row.dot.style.background = color;
+            }
+            if (row.value !== value) {
+                row.value = value;
+                row.text.textContent = label + " " + value;
+            }
+            placeAt(stats.bar, row.segment, i);
+            placeAt(stats.legend, row.item, i);
+        });
+        stats.rows.forEach(function (row, label) {
+            if (seen.has(label)) return;
+            stats.bar.removeChild(row.segment);
+            stats.legend.removeChild(row.item);
+            stats.rows.delete(label);
+        });
+    }
+
+    var BUILDERS = { cards: buildCards, carousel: buildCarousel };
+
+    function renderSwipe(args) {
+        var hasAck = args.ack !== undefined && args.ack !== null;
+        channel.settleMs = args.settle_ms;
+
+        var next = JSON.stringify([args.variant, args.single, args.label, args.title, args.items]);
+        if (next !== signature) {
+            // 항목이 바뀌면 DOM을 다시 만들고 서버가 가진 값(없으면 args.current)에서 시작
+            signature = next;
+            root.textContent = "";
+            index = Math.min(hasAck ? args.ack : args.current, args.items.length - 1);
+            channel.reset(index);
+            view = BUILDERS[args.variant](args);
+            view.show(index);
+        } else if (hasAck && channel.inflight === args.ack) {
+            // 보낸 값이 반영된 실행의 render → 확인
+            channel.ack(args.ack);
+        }
+    }
+
+    function render(args) {
+        if (args.variant === "stylesheet") {
+            applyStylesheet(args.href);
+        } else {
+            applyFonts(args.fonts);
+            if (args.variant === "grid") renderGrid(args);
+            else if (args.variant === "stats") renderStats(args);
+            else renderSwipe(args);
+        }
+
+        // height가 없으면 내용 높이에 맞춤
+        setHeight(args.height === undefined || args.height === null ? root.offsetHeight : args.height);
+    }
+
+    function setHeight(next) {
+        if (next === height) return;
+        height = next;
+        post("streamlit:setFrameHeight", { height: height });
+    }
+
+    window.studioUI = { render: render };
+})();
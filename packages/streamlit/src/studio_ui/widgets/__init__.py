@@ -4,5 +4,30 @@ studio_ui.widgets - 고기능 위젯 (Tier 3)
 React Custom Component 등 복잡한 위젯은 여기에 추가
 신중하게 도입하고, 필요한 경우에만 사용
 """
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = []
+if TYPE_CHECKING:
+    from .swipe import swipe_select
+
+# 공개 API → 정의 모듈 (PEP 562 지연 로딩)
+_LAZY_ATTRS = {
+    "swipe_select": "studio_ui.widgets.swipe",
+}
+
+__all__ = [
+    "swipe_select",
+]
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,78 @@
+"""
+studio_ui/widgets/swipe.py
+스와이프 선택 컴포넌트 - swipe_slider / step_carousel 공용 양방향 커스텀 컴포넌트
+
+공용 iframe 번들(core/frontend.py)의 cards/carousel 렌더러가 Streamlit 컴포넌트
+메시지 프로토콜로 선택 인덱스를 직접 반환합니다.
+페이지의 다른 위젯(number_input 등)을 찾아 값을 흉내 내지 않습니다.
+
+값 전송은 프론트엔드에서 합쳐집니다:
+- 입력이 settle_ms 동안 멈춘 뒤 마지막 값만 전송
+- 서버가 확인(ack)한 값과 같으면 전송하지 않음
+- 이전 값이 확인되기 전의 중간 값은 폐기하고 최신 값만 전송
+따라서 스크롤 이벤트 수와 관계없이 제스처당 서버 실행은 최대 1회입니다.
+"""
+from typing import Any, Dict, List, Literal
+
+import streamlit as st
+
+from studio_ui.core.compat import KEYED_COMPONENT_IDENTITY
+from studio_ui.core.frontend import studio_component
+
+
+def swipe_select(
+    items: List[Dict[str, Any]],
+    current: int = 0,
+    key: str = "swipe",
+    height: int = 140,
+    variant: Literal["cards", "carousel"] = "cards",
+    settle_ms: int = 150,
+    **props: Any,
+) -> int:
+    """
+    스와이프 선택 컴포넌트 (선택된 인덱스 반환)
+
+    Args:
+        items: 항목 리스트 (cards: emoji/title/type, carousel: step/title/desc)
+        current: 처음 선택할 인덱스
+        key: 컴포넌트 키 (같은 키는 선택 값을 유지)
+        height: iframe 높이
+        variant: "cards" (가로 스크롤 카드) | "carousel" (한 장씩 넘기는 캐러셀)
+        settle_ms: 마지막 입력 후 값을 보내기까지 기다리는 시간 (ms)
+        **props: variant별 추가 인자 (cards: single, carousel: label, title)
+
+    Returns:
+        선택된 인덱스
+
+    Example:
+        >>> idx = swipe_select([{"emoji": "👤", "title": "이름"}], key="tabs")
+    """
+    if not items:
+        return 0
+    current = max(0, min(current, len(items) - 1))
+
+    # ack: 서버가 이번 실행에서 받은 값 → 프론트엔드의 전송 확인 신호
+    # 인자가 바뀌면 요소 ID도 바뀌는 Streamlit 버전에서는 iframe이 다시 만들어지므로
+    # 보내지 않음 (프론트엔드는 시간 초과로 확인 처리)
+    if KEYED_COMPONENT_IDENTITY:
+        props["ack"] = _clamp(st.session_state.get(key, current), current, len(items))
+
+    value = studio_component(
+        variant,
+        key=key,
+        default=current,
+        items=items,
+        current=current,
+        height=height,
+        settle_ms=settle_ms,
+        **props,
+    )
+    return _clamp(value, current, len(items))
+
+
+def _clamp(value: Any, fallback: int, total: int) -> int:
+    try:
+        index = int(value)
+    except (TypeError, ValueError):
+        return fallback
+    return max(0, min(index, total - 1))
@@ -0,0 +1,45 @@
+"""
+tests/test_action_card.py
+액션 카드 삭제 버튼 - 기존 del_{key} 위젯 키 유지, 스타일 범위는 studio_action_{key} 컨테이너 (AppTest)
+"""
+from streamlit.testing.v1 import AppTest
+
+from studio_ui.core.compat import HAS_KEY_CLASSES
+
+
+def _cards_app():
+    import streamlit as st
+
+    from studio_ui import action_card
+
+    st.session_state.setdefault("items", [0, 1, 2])
+    for item in st.session_state["items"]:
+        with action_card(f"카드 {item}", key=f"card_{item}",
+                         on_delete=lambda item=item: st.session_state["items"].remove(item)):
+            pass
+    # 같은 접두사를 쓰는 사용자 위젯 (삭제 버튼 스타일 범위 밖)
+    st.button("삭제", key="del_user")
+
+
+def test_delete_button_keeps_del_key():
+    at = AppTest.from_function(_cards_app).run()
+    assert not at.exception
+
+    at.button(key="del_card_1").click().run()
+    assert not at.exception
+    assert at.session_state["items"] == [0, 2]
+
+
+def test_delete_button_is_scoped_by_wrapper_container():
+    at = AppTest.from_function(_cards_app).run()
+    if not HAS_KEY_CLASSES:
+        return
+
+    css = at.main.children[0].value
+    assert "st-key-studio_action_" in css and "st-key-del_" not in css
+
+    for card in (n for n in at.main.children.values() if n.type == "flex_container"):
+        scope = card.children[0]
+        button = scope.children[0]
+        assert button.key.startswith("del_card_")
+        assert scope.proto.id.endswith("-studio_action_" + button.key[len("del_"):])
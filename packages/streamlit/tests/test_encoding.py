@@ -0,0 +1,50 @@
+"""
+tests/test_encoding.py
+CSV 인코딩 감지 - 앞부분이 ASCII뿐인 CP949 파일, ASCII뿐인 큰 파일의 읽기 범위
+"""
+import io
+
+from studio_ui.data import encoding
+from studio_ui.data.encoding import sniff_csv
+from studio_ui.data.parse import parse_table
+
+
+class _CountingStream(io.BytesIO):
+    """read()로 읽은 바이트 수를 기록하는 파일 객체"""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        block = super().read(size)
+        self.bytes_read += len(block)
+        return block
+
+
+def _ascii_head_cp949(ascii_rows: int) -> bytes:
+    lines = ["date,name,amount"]
+    lines += [f"2024-03-01,user{i},{i}" for i in range(ascii_rows)]
+    lines += ["2024-03-02,홍길동,1000", "2024-03-03,고객,2000"]
+    return ("\n".join(lines) + "\n").encode("cp949")
+
+
+def test_cp949_after_ascii_lines():
+    data = _ascii_head_cp949(ascii_rows=5_000)  # 표본(SAMPLE_BYTES)보다 긴 ASCII 구간
+    assert data[:encoding.SAMPLE_BYTES].isascii()
+
+    dialect = sniff_csv(data, "deposits.csv")
+    assert (dialect.encoding, dialect.delimiter) == ("cp949", ",")
+
+    table = parse_table(data, "deposits.csv")
+    assert table.column("name").to_pylist()[-2:] == ["홍길동", "고객"]
+
+
+def test_ascii_scan_is_capped(monkeypatch):
+    monkeypatch.setattr(encoding, "SCAN_LIMIT_BYTES", 256 * 1024)
+    stream = _CountingStream(b"a,b\n" + b"1,2\n" * 1_000_000)  # 4 MB, 전부 ASCII
+
+    dialect = sniff_csv(stream, "numbers.csv")
+    assert dialect.encoding == "utf8"
+    assert stream.bytes_read <= encoding.SAMPLE_BYTES + encoding.SCAN_LIMIT_BYTES
+    assert stream.tell() == 0
@@ -0,0 +1,27 @@
+"""
+tests/test_fonts.py
+폰트 빌드 CLI의 --font PATH[:WEIGHT] 해석 - Windows 경로, 중복 굵기
+"""
+import pytest
+
+from studio_ui.core.fonts import _font_sources, main
+
+
+def test_weight_suffix_only_when_numeric():
+    assert _font_sources([r"C:\fonts\bold.otf:700", r"C:\fonts\regular.otf"]) == {
+        "700": r"C:\fonts\bold.otf",
+        "400": r"C:\fonts\regular.otf",
+    }
+    assert _font_sources(["NotoSansKR-Medium.otf:500", "fonts/Noto:Sans.otf:"]) == {
+        "500": "NotoSansKR-Medium.otf",
+        "400": "fonts/Noto:Sans.otf",
+    }
+
+
+def test_duplicate_weight_is_rejected(capsys):
+    with pytest.raises(ValueError):
+        _font_sources(["Regular.otf", "Other.otf:400"])
+
+    with pytest.raises(SystemExit):
+        main(["--font", "a.otf:700", "--font", "b.otf:700"])
+    assert "700" in capsys.readouterr().err
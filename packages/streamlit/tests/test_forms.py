@@ -0,0 +1,31 @@
+"""
+tests/test_forms.py
+컬럼 매칭 폼 - 파일에서 온 레이블/컬럼 이름이 HTML로 해석되지 않는지 (AppTest)
+"""
+from streamlit.testing.v1 import AppTest
+
+
+def _matcher_app():
+    import streamlit as st
+
+    from studio_ui import column_matcher
+
+    left, right = column_matcher(
+        "<b>주문서</b>", ["<img src=x onerror=alert(1)>", "금액"],
+        "입금내역 & 메모", ["입금자", "<script>x</script>"],
+        right_default=1,
+    )
+    st.session_state.picked = (left, right)
+
+
+def test_labels_are_escaped_and_options_kept():
+    at = AppTest.from_function(_matcher_app).run()
+    assert not at.exception
+
+    html = "".join(m.value for column in at.columns for m in column.children.values() if m.type == "markdown")
+    assert "&lt;b&gt;주문서&lt;/b&gt;" in html and "<b>" not in html
+    assert "입금내역 &amp; 메모" in html
+
+    # 선택 값은 원래 컬럼 이름 그대로 (이스케이프는 표시용 HTML에만 적용)
+    assert at.session_state.picked == ("<img src=x onerror=alert(1)>", "<script>x</script>")
+    assert at.selectbox(key="left_col").options == ["<img src=x onerror=alert(1)>", "금액"]
@@ -0,0 +1,49 @@
+"""
+tests/test_parse.py
+CSV 헤더 이름 - 빈 칸/중복 이름을 XLSX와 같은 규칙으로 정리하고 parse_table(columns=...)과 맞는지
+"""
+import io
+
+import pytest
+
+from studio_ui.data import parse
+from studio_ui.data.parse import parse_table, read_header
+
+CSV = "a,,a, b \n1,2,3,4\n5,6,7,8\n"
+NAMES = ["a", "열2", "a_2", "b"]
+
+
+def test_csv_header_names_match_xlsx_rules():
+    assert read_header(io.BytesIO(CSV.encode()), name="t.csv") == NAMES
+
+    openpyxl = pytest.importorskip("openpyxl")
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["a", None, "a", " b "])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    assert read_header(io.BytesIO(buffer.getvalue()), name="t.xlsx") == NAMES
+
+
+def test_parse_uses_header_names():
+    table = parse_table(io.BytesIO(CSV.encode()), name="t.csv")
+    assert table.schema.names == NAMES
+    assert table.column("a_2").to_pylist() == [3, 7]
+
+    picked = parse_table(io.BytesIO(CSV.encode()), name="t.csv", columns=["열2", "a_2"])
+    assert picked.to_pylist() == [{"열2": 2, "a_2": 3}, {"열2": 6, "a_2": 7}]
+
+
+def test_header_only_file_keeps_named_columns():
+    table = parse_table(io.BytesIO(b"a,,a\n"), name="t.csv")
+    assert table.schema.names == ["a", "열2", "a_2"]
+    assert table.num_rows == 0
+
+
+def test_float_retry_with_renamed_columns(monkeypatch):
+    # 첫 블록은 정수, 뒤 블록에 실수 → 정리한 이름(a_2)으로 float64 재시도
+    monkeypatch.setattr(parse, "CSV_BLOCK_BYTES", 64)
+    lines = ["a,a"] + [f"{i},{i}" for i in range(40)] + ["1,1.5"]
+    table = parse_table(io.BytesIO(("\n".join(lines) + "\n").encode()), name="t.csv")
+    assert table.schema.names == ["a", "a_2"]
+    assert str(table.schema.field("a_2").type) == "double"
+    assert table.column("a_2").to_pylist()[-1] == 1.5
@@ -0,0 +1,63 @@
+"""
+tests/test_render.py
+HTML 출력 배치 - 배치 안에서 컨테이너별로 HTML이 제자리에 전송되는지 (AppTest)
+"""
+from streamlit.testing.v1 import AppTest
+
+
+def _columns_app():
+    import streamlit as st
+
+    import studio_ui
+    from studio_ui.components.atoms import badge, section_label
+
+    with studio_ui.batch():
+        section_label("MAIN-1")
+        studio_ui.flush_html()  # 배치 안에서 직접 컨테이너를 만들기 전
+        cols = st.columns(2)
+        for i, col in enumerate(cols):
+            with col:
+                badge(f"COL-{i}-A")
+                badge(f"COL-{i}-B")
+        section_label("MAIN-2")
+
+
+def _login_app():
+    import studio_ui
+    from studio_ui.components.atoms import section_label
+    from studio_ui.components.auth import login_form
+
+    with studio_ui.batch():
+        login_form(key="login")
+        section_label("AFTER-FORM")
+
+
+def _texts(block) -> list:
+    return [element.value for element in block if element.type == "markdown"]
+
+
+def test_batch_keeps_html_in_columns():
+    at = AppTest.from_function(_columns_app).run()
+    assert not at.exception
+
+    main = [n for n in at.main.children.values() if n.type == "markdown"]
+    assert len(main) == 2
+    assert "MAIN-1" in main[0].value and "MAIN-2" in main[1].value
+    assert not any("COL-" in m.value for m in main)
+
+    for i, column in enumerate(at.columns):
+        texts = _texts(column.children.values())
+        assert len(texts) == 1  # 컬럼마다 배지 2개가 요소 하나로 합쳐짐
+        assert f"COL-{i}-A" in texts[0] and f"COL-{i}-B" in texts[0]
+
+
+def test_nested_batch_keeps_form_footer_in_form_container():
+    at = AppTest.from_function(_login_app).run()
+    assert not at.exception
+
+    main = [n for n in at.main.children.values() if n.type == "markdown"]
+    assert "AFTER-FORM" in main[-1].value
+    assert not any('class="auth-footer"' in m.value for m in main)
+
+    form = next(n for n in at.main.children.values() if n.type == "flex_container")
+    assert 'class="auth-footer"' in _texts(form.children.values())[-1]
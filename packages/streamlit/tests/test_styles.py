@@ -0,0 +1,13 @@
+"""
+tests/test_styles.py
+apply_theme 인자 검사 - 알 수 없는 전달 방식/프로필은 아무것도 전송하기 전에 ValueError
+"""
+import pytest
+
+from studio_ui.core.styles import apply_theme
+
+
+@pytest.mark.parametrize("options", [{"delivery": "statc"}, {"profile": "lite"}])
+def test_unknown_option_raises(options):
+    with pytest.raises(ValueError):
+        apply_theme(**options)
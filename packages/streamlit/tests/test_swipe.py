@@ -0,0 +1,55 @@
+"""
+tests/test_swipe.py
+스와이프 선택 - 프론트엔드가 보낸 값마다 스크립트가 한 번만 실행되고 그 값이 확인(ack)되는지 (AppTest)
+"""
+import json
+
+from streamlit.testing.v1 import AppTest
+
+from studio_ui.core.compat import KEYED_COMPONENT_IDENTITY
+
+
+def _slider_app():
+    import streamlit as st
+
+    from studio_ui import step_carousel, swipe_slider
+
+    st.session_state.setdefault("runs", 0)
+    st.session_state.runs += 1
+
+    slides = [{"emoji": "📌", "title": f"카드 {i}"} for i in range(8)]
+    steps = [{"step": f"STEP {i + 1}", "title": f"단계 {i + 1}", "desc": "설명"} for i in range(4)]
+    st.session_state.slider_value = swipe_slider(slides, key="slider")
+    st.session_state.step_value = step_carousel(steps, key="carousel")
+
+
+def _args(at: AppTest, index: int) -> dict:
+    instances = [n for n in at.main.children.values() if n.type == "component_instance"]
+    return json.loads(instances[index].proto.json_args)
+
+
+def test_one_script_run_per_settled_value():
+    at = AppTest.from_function(_slider_app).run()
+    assert not at.exception
+    assert at.session_state.runs == 1
+
+    # 프론트엔드는 제스처가 멈춘 뒤 마지막 값만 보냄 → 값 하나당 서버 실행 1회
+    for runs, value in enumerate((3, 7, 7, 0, 5), start=2):
+        at.session_state["slider_current"] = value
+        at.run()
+        assert not at.exception
+        assert at.session_state.runs == runs
+        assert at.session_state.slider_value == value
+        if KEYED_COMPONENT_IDENTITY:
+            assert _args(at, 0)["ack"] == value  # 같은 값은 다시 보내지 않도록 확인 신호
+
+
+def test_out_of_range_value_is_clamped_without_extra_run():
+    at = AppTest.from_function(_slider_app).run()
+
+    at.session_state["slider_current"] = 99
+    at.run()
+    assert not at.exception
+    assert at.session_state.runs == 2
+    assert at.session_state.slider_value == 7
+    assert at.session_state.step_value == 0  # 다른 컴포넌트 값은 그대로
@@ -0,0 +1,34 @@
+"""
+tests/test_template.py
+템플릿 렌더 함수 - 특수문자 없는 필드의 빠른 경로와 이스케이프 경로가 같은 결과를 내는지
+"""
+from studio_ui.core.template import Template, escape
+
+_LINK = Template('<a href="{{ href }}" class="{{ cls|raw }}">{{ label }}{{ label }} ({{ count|num }})</a>')
+
+
+def _expected(href, cls, label, count):
+    count_html = str(count) if count.__class__ in (int, float) else escape(count)
+    return f'<a href="{escape(href)}" class="{cls}">{escape(label)}{escape(label)} ({count_html})</a>'
+
+
+def test_plain_fields_are_inserted_unchanged():
+    assert _LINK.render(href="?page=a", cls="x-menu", label="매칭하기", count=3) == (
+        '<a href="?page=a" class="x-menu">매칭하기매칭하기 (3)</a>'
+    )
+
+
+def test_special_characters_are_escaped_in_every_field():
+    for href, label in (
+        ('?q="a"', "A & B"),
+        ("?page=a", "<b>굵게</b>"),
+        ("?page=a", "it's"),
+        ("?a>b", "plain"),
+    ):
+        assert _LINK.render(href=href, cls="<i>", label=label, count=1.5) == _expected(href, "<i>", label, 1.5)
+
+
+def test_non_str_fields_fall_back_to_escape():
+    assert _LINK.render(href=None, cls=None, label=7, count="<3") == (
+        '<a href="" class="">77 (&lt;3)</a>'
+    )
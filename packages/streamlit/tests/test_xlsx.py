@@ -0,0 +1,118 @@
+"""
+tests/test_xlsx.py
+XlsxSheet 값 변환을 openpyxl(data_only)과 비교
+
+openpyxl로 만든 통합문서(공유 문자열, 날짜/시각 서식, 1904 날짜 체계)와
+openpyxl이 쓰지 않는 형식(인라인 문자열, 공유 수식)으로 바꾼 시트를 두 리더로 읽어 같은 값인지 확인합니다.
+
+실행:
+    pip install "studio-ui[dev]"
+    pytest tests
+"""
+import io
+import zipfile
+from datetime import date, datetime, time
+
+import pytest
+
+from studio_ui.data.xlsx import XlsxSheet
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def _workbook(rows, epoch1904=False, formats=None) -> bytes:
+    """openpyxl로 통합문서 바이트 생성 (formats: 열 문자 → number_format)"""
+    from openpyxl.utils.datetime import CALENDAR_MAC_1904
+
+    workbook = openpyxl.Workbook()
+    if epoch1904:
+        workbook.epoch = CALENDAR_MAC_1904
+    sheet = workbook.active
+    sheet.title = "데이터"
+    for row in rows:
+        sheet.append(row)
+    for letter, code in (formats or {}).items():
+        for cell in sheet[letter][1:]:
+            cell.number_format = code
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _replace_sheet(data: bytes, sheet_xml: str) -> bytes:
+    """통합문서의 첫 시트 XML만 바꿔서 다시 압축 (스타일/관계는 그대로)"""
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as source, zipfile.ZipFile(out, "w") as target:
+        for info in source.infolist():
+            body = source.read(info.filename)
+            if info.filename == "xl/worksheets/sheet1.xml":
+                body = sheet_xml.encode("utf-8")
+            target.writestr(info, body)
+    return out.getvalue()
+
+
+def _trim(values):
+    values = list(values)
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+def _openpyxl_rows(data: bytes):
+    workbook = openpyxl.load_workbook(io.BytesIO(data), data_only=True)
+    rows = [_trim(row) for row in workbook.active.iter_rows(values_only=True)]
+    return [row for row in rows if any(v is not None for v in row)]
+
+
+def _studio_rows(data: bytes, columns=None):
+    with XlsxSheet(io.BytesIO(data)) as reader:
+        number, header = reader.header()
+        rows = [_trim(header)] if columns is None else [[header[i] for i in columns]]
+        rows += [_trim(row) if columns is None else row for row in reader.rows(columns, after=number)]
+    return rows
+
+
+ROWS = [
+    ["주문번호", "고객", "금액", "비율", "확정", "입금일", "입금시각", "마감"],
+    ["ORD-1", "홍길동 & <주식회사>", 12000, 0.125, True, datetime(2024, 3, 1, 9, 30), time(14, 5, 30), date(2024, 3, 31)],
+    ["ORD-2", "  앞뒤 공백  ", -3, 1e-9, False, datetime(1900, 1, 15), time(0, 0, 1), date(1900, 3, 1)],
+    ["ORD-3", None, 2**40, 3.5, None, datetime(2099, 12, 31, 23, 59, 59), None, date(2000, 2, 29)],
+]
+
+
+@pytest.mark.parametrize("epoch1904", [False, True], ids=["1900", "1904"])
+def test_matches_openpyxl(epoch1904):
+    data = _workbook(ROWS, epoch1904=epoch1904, formats={"F": "yyyy-mm-dd hh:mm:ss", "H": "yyyy\\-mm\\-dd"})
+    assert _studio_rows(data) == _openpyxl_rows(data)
+
+
+def test_projected_columns_match_openpyxl():
+    data = _workbook(ROWS)
+    expected = [[row[i] if i < len(row) else None for i in (0, 2, 5)] for row in _openpyxl_rows(data)]
+    assert _studio_rows(data, columns=[0, 2, 5]) == expected
+
+
+def test_custom_date_formats():
+    rows = [["값", "날짜", "문자 서식"], [1, 45000, 45000], [2, 45000.75, 45000.75]]
+    data = _workbook(rows, formats={"B": '[$-412]yyyy"년" m"월" d"일"', "C": '"일"0.00'})
+    assert _studio_rows(data) == _openpyxl_rows(data)
+
+
+SHEET_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<sheetData>
+<row r="1"><c r="A1" t="inlineStr"><is><t>이름</t></is></c><c r="B1" t="inlineStr"><is><r><t>수</t></r><r><t>량</t></r></is></c><c r="C1" t="inlineStr"><is><t>두 배</t></is></c><c r="D1" t="inlineStr"><is><t>결과</t></is></c></row>
+<row r="2"><c r="A2" t="inlineStr"><is><t xml:space="preserve"> 사과 &amp; 배 </t><rPh sb="0" eb="1"><t>サ</t></rPh></is></c><c r="B2"><v>2</v></c><c r="C2"><f t="shared" ref="C2:C4" si="0">B2*2</f><v>4</v></c><c r="D2" t="str"><f>A2&amp;"!"</f><v> 사과 &amp; 배 !</v></c></row>
+<row r="3"><c r="A3" t="inlineStr"><is><t>귤</t></is></c><c r="B3"><v>1.5</v></c><c r="C3"><f t="shared" si="0"/><v>3</v></c><c r="D3" t="e"><f>1/0</f><v>#DIV/0!</v></c></row>
+<row r="4" spans="1:4"/>
+<row r="5"><c r="A5" t="inlineStr"><is><t>감</t></is></c><c r="B5"><v>7</v></c><c r="C5"><f t="shared" si="0"/><v>14</v></c><c r="D5" t="b"><f>TRUE()</f><v>1</v></c></row>
+</sheetData>
+</worksheet>
+"""
+
+
+def test_inline_strings_and_shared_formulas():
+    data = _replace_sheet(_workbook([["placeholder"]]), SHEET_XML)
+    rows = _studio_rows(data)
+    assert rows == _openpyxl_rows(data)
+    assert rows[1][:3] == [" 사과 & 배 ", 2, 4]